@@ -7,16 +7,23 @@ from tkinter import ttk, messagebox
 import locale
 import json
 import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from datetime import datetime
-import uuid  # For unique scenario IDs
-import webbrowser
+
+from calculator.core.calc import Calculator
+from calculator.core.comparison import compare_loans, flatten_grid
+from calculator.core.live import Debouncer, line_edits
+from calculator.core.projection import project_investments
+from calculator.core.scenario_view import ScenarioTable
+from calculator.core.scenarios import ScenarioManager
+from calculator.core.tasks import TaskRunner
 
 # Set up currency formatting
 locale.setlocale(locale.LC_ALL, '')
 
+# Keys that move around an entry without changing it
+NAVIGATION_KEYS = {'Tab', 'ISO_Left_Tab', 'Left', 'Right', 'Up', 'Down', 'Home', 'End',
+                   'Shift_L', 'Shift_R', 'Control_L', 'Control_R', 'Alt_L', 'Alt_R',
+                   'Return', 'KP_Enter', 'Escape'}
+
 class EmailDialog(tk.Toplevel):
     def __init__(self, parent, callback):
         super().__init__(parent)
@@ -60,45 +67,6 @@ class EmailDialog(tk.Toplevel):
         self.callback(email, subject)
         self.destroy()
 
-class ScenarioManager:
-    def __init__(self):
-        self.scenarios_file = 'scenarios.json'
-        self.load_scenarios()
-
-    def load_scenarios(self):
-        try:
-            with open(self.scenarios_file, 'r') as f:
-                self.scenarios = json.load(f)
-        except FileNotFoundError:
-            self.scenarios = {}
-
-    def save_scenarios(self):
-        with open(self.scenarios_file, 'w') as f:
-            json.dump(self.scenarios, f, indent=2)
-
-    def add_scenario(self, name: str, data: dict) -> str:
-        scenario_id = str(uuid.uuid4())
-        self.scenarios[scenario_id] = {
-            'name': name,
-            'data': data,
-            'created_at': datetime.now().isoformat(),
-            'last_modified': datetime.now().isoformat()
-        }
-        self.save_scenarios()
-        return scenario_id
-
-    def get_scenario(self, scenario_id: str) -> dict:
-        return self.scenarios.get(scenario_id)
-
-    def delete_scenario(self, scenario_id: str):
-        if scenario_id in self.scenarios:
-            del self.scenarios[scenario_id]
-            self.save_scenarios()
-
-    def get_all_scenarios(self) -> dict:
-        return self.scenarios
-
-
 class SaveScenarioDialog(tk.Toplevel):
     def __init__(self, parent, callback):
         super().__init__(parent)
@@ -133,96 +101,294 @@ class SaveScenarioDialog(tk.Toplevel):
 
 
 class ScenarioComparisonWindow(tk.Toplevel):
-    def __init__(self, parent, scenario_manager):
+    """Scenario comparison as a virtualized table.
+
+    The Treeview holds only as many items as fit on screen. Scrolling,
+    sorting and filtering rewrite those items' values from a
+    ScenarioTable instead of creating a widget per scenario or cell.
+    Opening the window reads only names; inputs and outputs are fetched
+    a page at a time, and a whole column only when sorting by it.
+    """
+
+    # (heading, key, format) for each metric column
+    METRICS = [
+        ('Purchase Price', 'sale_price', 'currency'),
+        ('Down Payment', 'down_payment', 'currency'),
+        ('Loan Amount', 'loan_amount', 'currency'),
+        ('Interest Rate', 'new_rate', 'percent'),
+        ('Monthly Payment', 'monthly_payment', 'currency'),
+        ('Balloon Payment', 'balloon_payment', 'currency'),
+        ('Total Cost', 'total_cost', 'currency')
+    ]
+    ROW_HEIGHT = 22
+
+    def __init__(self, parent, scenario_manager, tasks):
         super().__init__(parent)
         self.scenario_manager = scenario_manager
+        self.tasks = tasks
         self.title("Compare Scenarios")
         self.geometry("1200x800")
 
+        self.rows_by_id = {}
+        self.loaded_ids = set()
+        self.loaded_columns = {'name'}
+        self.pending_ids = set()
+        self.table = ScenarioTable(self.load_rows())
+        self.offset = 0
+        self.visible_ids = []
+        self.selected_ids = set()
+        self.filter_job = None
+
         # Create main container
         main_frame = ttk.Frame(self)
         main_frame.pack(expand=True, fill='both', padx=10, pady=5)
 
-        # Scenario Selection Frame
-        selection_frame = ttk.LabelFrame(main_frame, text="Select Scenarios to Compare")
-        selection_frame.pack(fill='x', padx=5, pady=5)
-
-        # Create scenario selection
-        self.scenario_vars = {}
-        self.create_scenario_checkboxes(selection_frame)
-
-        # Comparison Results Frame
-        self.results_frame = ttk.Frame(main_frame)
-        self.results_frame.pack(expand=True, fill='both', padx=5, pady=5)
+        # Type-ahead filter
+        filter_frame = ttk.Frame(main_frame)
+        filter_frame.pack(fill='x', padx=5, pady=5)
+        ttk.Label(filter_frame, text="Filter:").pack(side='left')
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', lambda *_: self.schedule_filter())
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=40)
+        filter_entry.pack(side='left', padx=5)
+        filter_entry.focus_set()
+        self.count_label = ttk.Label(filter_frame)
+        self.count_label.pack(side='left', padx=10)
+
+        # Table with a scrollbar driven by the model, not the widget
+        table_frame = ttk.Frame(main_frame)
+        table_frame.pack(expand=True, fill='both', padx=5, pady=5)
+        ttk.Style(self).configure('Comparison.Treeview', rowheight=self.ROW_HEIGHT)
+        columns = ['name'] + [key for _, key, _ in self.METRICS]
+        self.tree = ttk.Treeview(table_frame, columns=columns, show='headings',
+                                 selectmode='extended', style='Comparison.Treeview')
+        self.tree.heading('name', text="Scenario",
+                          command=lambda: self.sort_by('name'))
+        self.tree.column('name', width=220, anchor='w')
+        for heading, key, _ in self.METRICS:
+            self.tree.heading(key, text=heading,
+                              command=lambda k=key: self.sort_by(k))
+            self.tree.column(key, width=130, anchor='e')
+        self.scrollbar = ttk.Scrollbar(table_frame, orient='vertical',
+                                       command=self.on_scroll)
+        self.tree.pack(side='left', expand=True, fill='both')
+        self.scrollbar.pack(side='right', fill='y')
+
+        self.tree.bind('<Configure>', lambda e: self.render())
+        self.tree.bind('<<TreeviewSelect>>', self.on_select)
+        self.tree.bind('<MouseWheel>',
+                       lambda e: self.scroll_to(self.offset - e.delta // 120))
+        self.tree.bind('<Button-4>', lambda e: self.scroll_to(self.offset - 3))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_to(self.offset + 3))
 
         # Compare Button
-        ttk.Button(main_frame, text="Compare Selected", 
-                  command=self.compare_scenarios).pack(pady=10)
-
-    def create_scenario_checkboxes(self, parent):
-        scenarios = self.scenario_manager.get_all_scenarios()
-        for scenario_id, scenario_data in scenarios.items():
-            var = tk.BooleanVar()
-            self.scenario_vars[scenario_id] = var
-            ttk.Checkbutton(parent, text=scenario_data['name'], 
-                          variable=var).pack(anchor='w', padx=5, pady=2)
+        self.compare_button = ttk.Button(main_frame, text="Compare Selected",
+                                         command=self.compare_scenarios)
+        self.compare_button.pack(pady=10)
+
+        self.render()
+
+    def load_rows(self) -> list:
+        """One row per scenario with only its ID and name."""
+        rows = [{'id': scenario['id'], 'name': scenario['name']}
+                for scenario in self.scenario_manager.list_scenarios()]
+        self.rows_by_id = {row['id']: row for row in rows}
+        return rows
+
+    def load_page(self, rows: list):
+        """
+        Merge inputs and stored outputs into rows not yet loaded.
+
+        Stale outputs are not recomputed here, on the Tk thread; they go
+        to ``refresh_outputs``.
+        """
+        ids = [row['id'] for row in rows if row['id'] not in self.loaded_ids]
+        if not ids:
+            return
+        scenarios = self.scenario_manager.get_scenarios(ids)
+        outputs = self.scenario_manager.get_outputs(
+            ids, [key for _, key, _ in self.METRICS], recompute=False
+        )
+        for scenario_id in ids:
+            row = self.rows_by_id[scenario_id]
+            data = scenarios.get(scenario_id, {}).get('data', {})
+            row.update({**data, **outputs.get(scenario_id, {})},
+                       id=scenario_id, name=row['name'])
+            if 'new_rate' not in row and isinstance(row.get('rate'), (int, float)):
+                # Scenarios saved before inputs were stored in percent
+                row['new_rate'] = row['rate'] * 100
+        self.loaded_ids.update(ids)
+        self.refresh_outputs([scenario_id for scenario_id in ids
+                              if scenario_id in scenarios and scenario_id not in outputs])
+
+    def load_column(self, column: str):
+        """Read one column for every scenario so the table can sort by it."""
+        values = self.scenario_manager.column_values(column)
+        if column == 'new_rate':
+            rates = self.scenario_manager.column_values('rate')
+            for scenario_id, rate in rates.items():
+                if values.get(scenario_id) is None and isinstance(rate, (int, float)):
+                    values[scenario_id] = rate * 100
+        for scenario_id, value in values.items():
+            row = self.rows_by_id.get(scenario_id)
+            if row is not None and scenario_id not in self.loaded_ids:
+                row[column] = value
+        self.loaded_columns.add(column)
+
+    def refresh_outputs(self, scenario_ids):
+        """Recompute stale outputs on a worker thread, then redraw."""
+        new_ids = set(scenario_ids) - self.pending_ids
+        if not new_ids:
+            return
+        # The new task replaces any running one, so it takes over its IDs
+        self.pending_ids |= new_ids
+        # On failure the rows keep showing N/A until the window is reopened
+        self.tasks.submit(
+            'scenario-outputs', recompute_outputs,
+            self.scenario_manager.db_path, sorted(self.pending_ids),
+            [key for _, key, _ in self.METRICS],
+            on_done=self.outputs_ready, on_error=lambda error: None
+        )
+
+    def outputs_ready(self, outputs: dict):
+        if not self.winfo_exists():
+            return
+        self.pending_ids.clear()
+        for scenario_id, values in outputs.items():
+            row = self.rows_by_id.get(scenario_id)
+            if row is not None:
+                row.update(values)
+        if self.table.sort_column is not None:
+            self.table.sort(self.table.sort_column, self.table.descending)
+        self.render()
+
+    def page_size(self) -> int:
+        return max(1, self.tree.winfo_height() // self.ROW_HEIGHT - 1)
+
+    def render(self):
+        """Write the visible window of rows into the pooled tree items."""
+        size = self.page_size()
+        self.offset = max(0, min(self.offset, len(self.table) - size))
+        rows = self.table.window(self.offset, size)
+        self.load_page(rows)
+
+        items = self.tree.get_children()
+        for index in range(len(items), size):
+            self.tree.insert('', 'end', iid=f'row{index}')
+        items = self.tree.get_children()
+        for item in items[size:]:
+            self.tree.delete(item)
+
+        self.visible_ids = [row['id'] for row in rows]
+        for index, item in enumerate(items[:size]):
+            if index < len(rows):
+                self.tree.item(item, values=self.format_row(rows[index]))
+            else:
+                self.tree.item(item, values=())
+        # selection_set queues a <<TreeviewSelect>>; only touch the
+        # selection when it differs so on_select sees no change
+        selection = {
+            f'row{index}' for index, scenario_id in enumerate(self.visible_ids)
+            if scenario_id in self.selected_ids
+        }
+        if set(self.tree.selection()) != selection:
+            self.tree.selection_set(sorted(selection))
+
+        total = len(self.table)
+        if total:
+            self.scrollbar.set(self.offset / total,
+                               min(1.0, (self.offset + size) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.update_count()
+
+    def update_count(self):
+        self.count_label.config(
+            text=f"{len(self.table)} of {len(self.table.rows)} scenarios, "
+                 f"{len(self.selected_ids)} selected"
+        )
+
+    def format_row(self, row: dict) -> list:
+        values = [row['name']]
+        for _, key, fmt in self.METRICS:
+            value = row.get(key)
+            if not isinstance(value, (int, float)):
+                values.append('N/A')
+            elif fmt == 'percent':
+                values.append(f"{value:.2f}%")
+            else:
+                values.append(f"${value:,.2f}")
+        return values
+
+    def scroll_to(self, offset: int):
+        self.offset = offset
+        self.render()
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == 'moveto':
+            self.scroll_to(int(float(amount) * len(self.table)))
+        elif unit == 'pages':
+            self.scroll_to(self.offset + int(amount) * self.page_size())
+        else:
+            self.scroll_to(self.offset + int(amount))
+
+    def on_select(self, event=None):
+        """Record selection changes; the tree already shows them."""
+        selected = set(self.tree.selection())
+        visible = set(self.visible_ids)
+        chosen = {
+            scenario_id for index, scenario_id in enumerate(self.visible_ids)
+            if f'row{index}' in selected
+        }
+        if chosen == self.selected_ids & visible:
+            return
+        self.selected_ids = (self.selected_ids - visible) | chosen
+        self.update_count()
+
+    def schedule_filter(self):
+        """Filter after a short pause in typing rather than on every key."""
+        if self.filter_job is not None:
+            self.after_cancel(self.filter_job)
+        self.filter_job = self.after(150, self.apply_filter)
+
+    def apply_filter(self):
+        self.filter_job = None
+        self.table.set_filter(self.filter_var.get())
+        self.scroll_to(0)
+
+    def sort_by(self, column: str):
+        if column not in self.loaded_columns:
+            self.load_column(column)
+        self.table.sort(column)
+        self.scroll_to(0)
 
     def compare_scenarios(self):
-        # Clear previous results
-        for widget in self.results_frame.winfo_children():
-            widget.destroy()
-
-        # Get selected scenarios
-        selected_scenarios = [
-            (scenario_id, self.scenario_manager.get_scenario(scenario_id))
-            for scenario_id, var in self.scenario_vars.items()
-            if var.get()
-        ]
-
-        if len(selected_scenarios) < 2:
+        if self.table.only is not None:
+            self.table.set_only(None)
+            self.compare_button.config(text="Compare Selected")
+            self.scroll_to(0)
+            return
+
+        if len(self.selected_ids) < 2:
             messagebox.showwarning(
                 "Warning", 
                 "Please select at least two scenarios to compare."
             )
             return
 
-        # Create comparison table
-        self.create_comparison_table(selected_scenarios)
-
-    def create_comparison_table(self, scenarios):
-        # Create headers
-        headers = ["Metric"] + [s[1]['name'] for s in scenarios]
-        for col, header in enumerate(headers):
-            ttk.Label(self.results_frame, text=header, 
-                     style='Title.TLabel').grid(row=0, column=col, padx=5, pady=5)
-
-        # Define metrics to compare
-        metrics = [
-            ('Purchase Price', 'sale_price'),
-            ('Down Payment', 'down_payment'),
-            ('Loan Amount', 'loan_amount'),
-            ('Interest Rate', 'rate'),
-            ('Monthly Payment', 'monthly_payment'),
-            ('Total Cost', 'total_cost')
-        ]
-
-        # Add rows for each metric
-        for row, (label, key) in enumerate(metrics, start=1):
-            ttk.Label(self.results_frame, text=label).grid(
-                row=row, column=0, sticky='w', padx=5, pady=2
-            )
-            for col, (_, scenario) in enumerate(scenarios, start=1):
-                value = scenario['data'].get(key, 'N/A')
-                if isinstance(value, (int, float)):
-                    if key == 'rate':
-                        formatted_value = f"{value * 100:.2f}%"
-                    else:
-                        formatted_value = f"${value:,.2f}"
-                else:
-                    formatted_value = str(value)
-                ttk.Label(self.results_frame, text=formatted_value).grid(
-                    row=row, column=col, padx=5, pady=2
-                )
+        self.table.set_only(self.selected_ids)
+        self.compare_button.config(text="Show All Scenarios")
+        self.scroll_to(0)
+
+
+def recompute_outputs(task, db_path: str, scenario_ids: list, metrics: list) -> dict:
+    """Recompute and store outputs on a worker thread with its own connection."""
+    manager = ScenarioManager(db_path, None)
+    try:
+        task.check()
+        return manager.get_outputs(scenario_ids, metrics)
+    finally:
+        manager.close()
 
 
 class EmailManager:
@@ -232,11 +398,13 @@ class EmailManager:
         
     def connect_gmail(self, to_email, subject):
         """Open Gmail in default browser with pre-filled recipient and subject"""
+        import webbrowser  # Only needed once the user sends an email
         email_url = f'https://mail.google.com/mail/?view=cm&fs=1&to={to_email}&su={subject}'
         webbrowser.open(email_url)
         
     def connect_apple_mail(self, to_email, subject):
         """Open Apple Mail with pre-filled recipient and subject"""
+        import webbrowser
         webbrowser.open(f'mailto:{to_email}?subject={subject}')
 
 class RealEstateCalculator:
@@ -245,6 +413,13 @@ class RealEstateCalculator:
         self.root.title("Real Estate Analysis Tool")
         self.root.geometry("1400x800")  # Wider to accommodate middle panel
         
+        # Status bar for background calculations
+        self.tasks = TaskRunner(self.root.after)
+        self.debouncer = Debouncer(self.root.after, self.root.after_cancel)
+        self.live_mode = tk.BooleanVar(value=False)
+        self.live_inputs = {}
+        self.setup_status_bar()
+        
         # Create main container
         self.main_container = ttk.Frame(root)
         self.main_container.pack(expand=True, fill='both', padx=10, pady=5)
@@ -272,6 +447,7 @@ class RealEstateCalculator:
         self.summary_text = tk.Text(self.summary_frame, width=40, wrap=tk.WORD, 
                                   font=('Consolas', 10))
         self.summary_text.pack(expand=True, fill='both', padx=5, pady=5)
+        self.summary_lines = []
         
         # Create tabs
         self.seller_financing_tab = ttk.Frame(self.notebook)
@@ -289,6 +465,8 @@ class RealEstateCalculator:
         self.setup_investment_tab()
         self.setup_comparison_tab()
         self.setup_closing_costs_tab()
+        # Editing an input makes any running calculation stale
+        self.bind_input_edits()
         
         # Style
         style = ttk.Style()
@@ -308,6 +486,7 @@ class RealEstateCalculator:
         self.add_scenario_buttons()
         
         self.scenario_manager = ScenarioManager()
+        self.scenario_manager.refresh_outputs_in_background()
         self.email_manager = EmailManager()  # Initialize email manager
 
     def add_email_button(self, parent):
@@ -423,10 +602,162 @@ class RealEstateCalculator:
         except Exception as e:
             messagebox.showerror("Error", f"Could not load references: {str(e)}")
 
+    def setup_status_bar(self):
+        """Status line, progress bar and cancel button for running tasks."""
+        status_bar = ttk.Frame(self.root)
+        status_bar.pack(side='bottom', fill='x', padx=10, pady=(0, 5))
+        self.status_label = ttk.Label(status_bar, text="Ready")
+        self.status_label.pack(side='left')
+        self.cancel_button = ttk.Button(status_bar, text="Cancel",
+                                        command=self.cancel_tasks, state='disabled')
+        self.cancel_button.pack(side='right')
+        ttk.Checkbutton(status_bar, text="Live update", variable=self.live_mode,
+                        command=self.toggle_live_mode).pack(side='right', padx=5)
+        self.progress = ttk.Progressbar(status_bar, mode='determinate',
+                                        maximum=1.0, length=200)
+        self.progress.pack(side='right', padx=5)
+
+    def bind_input_edits(self):
+        """
+        Watch the calculator tabs' entries for edits.
+
+        The entries get an extra bindtag rather than a TEntry class binding,
+        so typing in dialogs or the scenario filter leaves tasks alone.
+        """
+        self.root.bind_class('CalculatorInput', '<KeyRelease>', self.on_input_edited)
+        pending = [self.seller_financing_tab, self.investment_tab,
+                   self.comparison_tab, self.closing_costs_tab]
+        while pending:
+            widget = pending.pop()
+            pending.extend(widget.winfo_children())
+            if isinstance(widget, (ttk.Entry, tk.Entry)):
+                widget.bindtags(widget.bindtags() + ('CalculatorInput',))
+
+    def set_status(self, text: str, busy: bool = False):
+        self.status_label.configure(text=text)
+        self.cancel_button.configure(state='normal' if busy else 'disabled')
+        if not busy:
+            self.progress['value'] = 0
+
+    def run_task(self, key: str, fn, inputs: dict, on_done, on_error=None):
+        """
+        Run ``fn(task, inputs)`` on a worker thread and pass its result to
+        ``on_done`` on the Tk thread. Starting a task under the same key
+        replaces the previous one.
+        """
+        def done(result):
+            self.set_status("Ready", busy=self.tasks.busy)
+            on_done(result)
+
+        self.set_status("Calculating...", busy=True)
+        self.progress['value'] = 0
+        self.tasks.submit(key, fn, inputs, on_done=done,
+                          on_error=on_error or self.task_failed,
+                          on_progress=self.task_progress)
+
+    def task_progress(self, fraction: float, message: str):
+        self.progress['value'] = fraction
+        if message:
+            self.status_label.configure(text=message)
+
+    def task_failed(self, error: BaseException):
+        self.set_status("Ready", busy=self.tasks.busy)
+        if isinstance(error, ValueError):
+            messagebox.showerror("Error", "Please enter valid numbers in all fields.")
+        else:
+            messagebox.showerror("Error", str(error))
+
+    def cancel_tasks(self, reason: str = "Cancelled"):
+        if self.tasks.cancel():
+            self.set_status(reason)
+
+    def on_input_edited(self, event):
+        if event.keysym in NAVIGATION_KEYS:
+            return
+        if self.live_mode.get():
+            # A burst of keystrokes becomes one recalculation; a newer run
+            # replaces any still in flight.
+            self.debouncer.call('live', self.recalculate_live)
+        elif self.tasks.busy:
+            self.cancel_tasks("Cancelled: inputs changed")
+
+    def live_calculators(self) -> dict:
+        """Tab widget name -> (task key, read inputs, compute, render)."""
+        return {
+            str(self.seller_financing_tab): (
+                'seller_financing', self.read_seller_financing_inputs,
+                self.compute_seller_financing,
+                lambda result: self.show_results(self.results_frame, result)),
+            str(self.investment_tab): (
+                'investment', self.read_investment_inputs, self.compute_investment,
+                lambda result: self.show_results(self.investment_results_frame, result)),
+            str(self.comparison_tab): (
+                'comparison', self.read_comparison_inputs, self.compute_comparison,
+                self.show_comparison_results),
+            str(self.closing_costs_tab): (
+                'closing_costs', self.read_closing_costs_inputs, self.compute_closing_costs,
+                lambda result: self.show_results(self.closing_results_frame, result)),
+        }
+
+    def toggle_live_mode(self):
+        self.live_inputs.clear()
+        if self.live_mode.get():
+            self.recalculate_live()
+        else:
+            self.debouncer.cancel()
+
+    def recalculate_live(self):
+        """Recalculate the visible tab if its inputs changed since last time."""
+        calculator = self.live_calculators().get(self.notebook.select())
+        if calculator is None:
+            return
+        key, read_inputs, compute, render = calculator
+        try:
+            inputs = read_inputs()
+        except ValueError:
+            self.set_status("Waiting for valid input", busy=self.tasks.busy)
+            return
+        if self.live_inputs.get(key) == inputs:
+            return
+        self.live_inputs[key] = inputs
+        self.run_task(key, compute, inputs, render, on_error=self.live_task_failed)
+
+    def live_task_failed(self, error: BaseException):
+        """Report errors quietly while typing instead of opening dialogs."""
+        self.set_status(f"Invalid input: {error}", busy=self.tasks.busy)
+
+    def show_results(self, frame, result: dict):
+        """
+        Show a computed result's summary and its labels in ``frame``,
+        reusing existing labels and only touching the ones that changed.
+        """
+        self.update_summary(result['summary'])
+        labels = frame.winfo_children()
+        for index, (text, style) in enumerate(result['labels']):
+            if index < len(labels):
+                label = labels[index]
+                if label.cget('text') != text:
+                    label.configure(text=text)
+                if str(label.cget('style')) != style:
+                    label.configure(style=style)
+            else:
+                ttk.Label(frame, text=text, style=style).pack(anchor='w')
+        for label in labels[len(result['labels']):]:
+            label.destroy()
+
     def update_summary(self, text: str):
-        """Update the calculation summary panel."""
-        self.summary_text.delete(1.0, tk.END)
-        self.summary_text.insert(tk.END, text)
+        """Update the calculation summary panel, rewriting only changed lines."""
+        lines = text.split('\n')
+        current = self.summary_text.get('1.0', 'end-1c')
+        if current != ''.join(line + '\n' for line in self.summary_lines):
+            # First use, or the user edited the panel: start over
+            self.summary_text.delete('1.0', tk.END)
+            self.summary_lines = []
+        for start, stop, replacement in line_edits(self.summary_lines, lines):
+            self.summary_text.delete(f'{start + 1}.0', f'{stop + 1}.0')
+            self.summary_text.insert(f'{start + 1}.0',
+                                     ''.join(line + '\n' for line in replacement))
+        self.summary_lines = lines
 
     def setup_seller_financing_tab(self):
         # Current Mortgage Frame
@@ -613,6 +944,25 @@ class RealEstateCalculator:
         self.extra_payment.grid(row=0, column=1)
         self.extra_payment.insert(0, "0")
         
+        # Scenario grid (comma-separated values)
+        grid_frame = ttk.LabelFrame(comparison_frame, text="Scenario Grid (comma-separated)", padding="5")
+        grid_frame.grid(row=5, column=0, columnspan=2, sticky='ew', pady=5)
+        
+        ttk.Label(grid_frame, text="Down Payments (%):").grid(row=0, column=0, sticky='w')
+        self.compare_down_payments = ttk.Entry(grid_frame)
+        self.compare_down_payments.grid(row=0, column=1)
+        self.compare_down_payments.insert(0, "12, 20, 30")
+        
+        ttk.Label(grid_frame, text="Interest Rates (%):").grid(row=1, column=0, sticky='w')
+        self.compare_rates = ttk.Entry(grid_frame)
+        self.compare_rates.grid(row=1, column=1)
+        self.compare_rates.insert(0, "1.5, 2, 2.5")
+        
+        ttk.Label(grid_frame, text="Loan Terms (years):").grid(row=2, column=0, sticky='w')
+        self.compare_terms = ttk.Entry(grid_frame)
+        self.compare_terms.grid(row=2, column=1)
+        self.compare_terms.insert(0, "30")
+        
         # Results Frame with Scrollbar
         results_container = ttk.Frame(self.comparison_tab)
         results_container.pack(fill='both', expand=True, padx=10, pady=5)
@@ -620,6 +970,23 @@ class RealEstateCalculator:
         self.comparison_results_frame = ttk.LabelFrame(results_container, text="Comparison Results", padding="10")
         self.comparison_results_frame.pack(fill='both', expand=True)
         
+        # A single Treeview holds every scenario row, so large grids don't
+        # create one label widget per cell.
+        columns = ("down_payment", "rate", "term", "extra", "monthly",
+                   "total_interest", "total_pmi", "years_to_pay")
+        headings = ("Down Payment", "Rate", "Term", "Extra", "Monthly",
+                    "Total Interest", "Total PMI", "Years to Pay")
+        self.comparison_tree = ttk.Treeview(self.comparison_results_frame, columns=columns,
+                                            show='headings', height=10)
+        for column, heading in zip(columns, headings):
+            self.comparison_tree.heading(column, text=heading)
+            self.comparison_tree.column(column, width=100, anchor='e')
+        tree_scroll = ttk.Scrollbar(self.comparison_results_frame, orient='vertical',
+                                    command=self.comparison_tree.yview)
+        self.comparison_tree.configure(yscrollcommand=tree_scroll.set)
+        self.comparison_tree.pack(side='left', fill='both', expand=True)
+        tree_scroll.pack(side='right', fill='y')
+        
         # Calculate Button
         ttk.Button(self.comparison_tab, text="Compare Scenarios", 
                   command=self.calculate_comparison).pack(pady=10)
@@ -658,10 +1025,18 @@ class RealEstateCalculator:
         title_frame = ttk.LabelFrame(costs_frame, text="Title and Recording", padding="5")
         title_frame.grid(row=3, column=0, columnspan=2, sticky='ew', pady=5)
         
-        ttk.Label(title_frame, text="Title Insurance Rate (%):").grid(row=0, column=0, sticky='w')
+        ttk.Label(title_frame, text="State:").grid(row=0, column=0, sticky='w')
+        self.closing_state = ttk.Entry(title_frame)
+        self.closing_state.grid(row=0, column=1)
+        
+        ttk.Label(title_frame, text="County:").grid(row=1, column=0, sticky='w')
+        self.closing_county = ttk.Entry(title_frame)
+        self.closing_county.grid(row=1, column=1)
+        
+        # Blank uses the state or county title premium schedule
+        ttk.Label(title_frame, text="Title Insurance Rate (%):").grid(row=2, column=0, sticky='w')
         self.title_rate = ttk.Entry(title_frame)
-        self.title_rate.grid(row=0, column=1)
-        self.title_rate.insert(0, "0.5")
+        self.title_rate.grid(row=2, column=1)
         
         # Results Frame
         self.closing_results_frame = ttk.LabelFrame(self.closing_costs_tab, text="Closing Costs", padding="10")
@@ -672,30 +1047,13 @@ class RealEstateCalculator:
                   command=self.calculate_closing_costs).pack(pady=10)
 
     def calculate_monthly_payment(self, principal: float, annual_rate: float, years: int) -> float:
-        monthly_rate = annual_rate / 12
-        num_payments = years * 12
-        
-        if monthly_rate == 0:
-            return principal / num_payments
-        
-        return principal * (monthly_rate * (1 + monthly_rate)**num_payments) / \
-               ((1 + monthly_rate)**num_payments - 1)
+        return Calculator.calculate_monthly_payment(principal, annual_rate, years)
 
     def calculate_loan_balance(self, original_principal: float, annual_rate: float, 
                              original_term: int, years_elapsed: int) -> float:
         """Calculate remaining balance based on original term and years elapsed."""
-        monthly_rate = annual_rate / 12
-        monthly_payment = self.calculate_monthly_payment(original_principal, annual_rate, original_term)
-        
-        remaining_balance = original_principal
-        months_elapsed = years_elapsed * 12
-        
-        for _ in range(months_elapsed):
-            interest = remaining_balance * monthly_rate
-            principal_paid = monthly_payment - interest
-            remaining_balance -= principal_paid
-        
-        return remaining_balance
+        return Calculator.calculate_loan_balance(original_principal, annual_rate,
+                                                 original_term, years_elapsed)
 
     def format_currency(self, amount: float) -> str:
         return locale.currency(amount, grouping=True)
@@ -703,485 +1061,467 @@ class RealEstateCalculator:
     def format_percent(self, amount: float) -> str:
         return f"{amount:.2f}%"
 
+    def read_seller_financing_inputs(self) -> dict:
+        """Read the seller financing entries (main thread only)."""
+        return {
+            'original_price': float(self.original_price.get()),
+            'current_rate': float(self.current_rate.get()),
+            'original_term': int(self.original_term.get()),
+            'years_remaining': int(self.years_remaining.get()),
+            'sale_price': float(self.sale_price.get()),
+            'down_payment': float(self.down_payment.get()),
+            'new_rate': float(self.new_rate.get()),
+            'loan_term': int(self.loan_term.get()),
+            'balloon_years': int(self.balloon_years.get())
+        }
+
     def calculate_seller_financing(self):
         try:
-            summary = []
-            summary.append("=== Current Mortgage Calculations ===\n")
-            
-            # Get current mortgage values
-            original_price = float(self.original_price.get())
-            current_rate = float(self.current_rate.get()) / 100
-            original_term = int(self.original_term.get())
-            years_remaining = int(self.years_remaining.get())
-            years_elapsed = original_term - years_remaining
-            
-            # Calculate current mortgage details
-            monthly_rate = current_rate / 12
-            original_payment = self.calculate_monthly_payment(original_price, current_rate, original_term)
-            
-            summary.append(f"Original Loan Amount: {self.format_currency(original_price)}")
-            summary.append(f"Annual Interest Rate: {current_rate*100:.2f}%")
-            summary.append(f"Monthly Interest Rate: {monthly_rate*100:.3f}%")
-            summary.append(f"Original Monthly Payment: {self.format_currency(original_payment)}")
-            summary.append(f"Years Elapsed: {years_elapsed}")
-            summary.append(f"Payments Made: {years_elapsed * 12}")
-            
-            # Calculate current balance
-            current_balance = self.calculate_loan_balance(
-                original_price, 
-                current_rate,
-                original_term,
-                years_elapsed
-            )
-            
-            total_paid = original_payment * (years_elapsed * 12)
-            interest_paid = total_paid - (original_price - current_balance)
-            
-            summary.append(f"Total Amount Paid: {self.format_currency(total_paid)}")
-            summary.append(f"Principal Paid: {self.format_currency(original_price - current_balance)}")
-            summary.append(f"Interest Paid: {self.format_currency(interest_paid)}")
-            summary.append(f"Current Balance: {self.format_currency(current_balance)}\n")
-            
-            # Get new financing values
-            summary.append("=== New Financing Calculations ===\n")
-            
-            sale_price = float(self.sale_price.get())
-            down_payment = float(self.down_payment.get())
-            new_rate = float(self.new_rate.get()) / 100
-            loan_term = int(self.loan_term.get())
-            balloon_years = int(self.balloon_years.get())
-            
-            summary.append(f"Sale Price: {self.format_currency(sale_price)}")
-            summary.append(f"Down Payment: {self.format_currency(down_payment)}")
-            summary.append(f"Loan Amount: {self.format_currency(sale_price - down_payment)}")
-            summary.append(f"Interest Rate: {new_rate*100:.2f}%")
-            summary.append(f"Monthly Rate: {(new_rate/12)*100:.3f}%")
-            
-            # Calculate new financing
-            loan_amount = sale_price - down_payment
-            monthly_payment = self.calculate_monthly_payment(loan_amount, new_rate, loan_term)
-            
-            summary.append(f"Monthly Payment: {self.format_currency(monthly_payment)}")
-            
-            # Calculate balloon payment
-            remaining_balance = loan_amount
-            total_interest = 0
-            total_principal = 0
-            
-            for month in range(balloon_years * 12):
-                interest = remaining_balance * new_rate / 12
-                principal_paid = monthly_payment - interest
-                remaining_balance -= principal_paid
-                total_interest += interest
-                total_principal += principal_paid
-            
-            total_payments = monthly_payment * (balloon_years * 12)
-            
-            summary.append(f"\nAfter {balloon_years} years ({balloon_years * 12} payments):")
-            summary.append(f"Total Payments Made: {self.format_currency(total_payments)}")
-            summary.append(f"Total Principal Paid: {self.format_currency(total_principal)}")
-            summary.append(f"Total Interest Paid: {self.format_currency(total_interest)}")
-            summary.append(f"Balloon Payment: {self.format_currency(remaining_balance)}")
-            summary.append(f"\nTotal Cost Breakdown:")
-            summary.append(f"Down Payment: {self.format_currency(down_payment)}")
-            summary.append(f"Total Payments: {self.format_currency(total_payments)}")
-            summary.append(f"Balloon Payment: {self.format_currency(remaining_balance)}")
-            summary.append(f"Total Cost: {self.format_currency(total_payments + down_payment + remaining_balance)}")
-            
-            # Update summary panel
-            self.update_summary("\n".join(summary))
-            
-            # Clear previous results
-            for widget in self.results_frame.winfo_children():
-                widget.destroy()
-            
-            # Display results
-            ttk.Label(self.results_frame, text="Current Mortgage:", style='Title.TLabel').pack(anchor='w')
-            ttk.Label(self.results_frame, 
-                     text=f"Original Term: {original_term} years ({years_remaining} years remaining)", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.results_frame, 
-                     text=f"Current Balance: {self.format_currency(current_balance)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            
-            ttk.Label(self.results_frame, text="\nNew Financing:", style='Title.TLabel').pack(anchor='w')
-            ttk.Label(self.results_frame, 
-                     text=f"Monthly Payment: {self.format_currency(monthly_payment)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.results_frame, 
-                     text=f"Balloon Payment (Year {balloon_years}): {self.format_currency(remaining_balance)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            
-            ttk.Label(self.results_frame, text="\nPayment Totals:", style='Title.TLabel').pack(anchor='w')
-            ttk.Label(self.results_frame, 
-                     text=f"Total Payments: {self.format_currency(total_payments)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.results_frame, 
-                     text=f"Total Cost: {self.format_currency(total_payments + down_payment + remaining_balance)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            
-        except ValueError as e:
+            inputs = self.read_seller_financing_inputs()
+        except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers in all fields.")
+            return
+        self.run_task('seller_financing', self.compute_seller_financing, inputs,
+                      lambda result: self.show_results(self.results_frame, result))
+
+    def compute_seller_financing(self, task, inputs: dict) -> dict:
+        """Seller financing numbers and text; runs on a worker thread."""
+        summary = []
+        summary.append("=== Current Mortgage Calculations ===\n")
+        
+        original_price = inputs['original_price']
+        current_rate = inputs['current_rate'] / 100
+        original_term = inputs['original_term']
+        years_remaining = inputs['years_remaining']
+        sale_price = inputs['sale_price']
+        down_payment = inputs['down_payment']
+        new_rate = inputs['new_rate'] / 100
+        balloon_years = inputs['balloon_years']
+        
+        results = Calculator.calculate_seller_financing(inputs)
+        current = results['current_mortgage']
+        new = results['new_financing']
+        
+        # Calculate current mortgage details
+        monthly_rate = current_rate / 12
+        years_elapsed = current['years_elapsed']
+        original_payment = current['original_payment']
+        
+        summary.append(f"Original Loan Amount: {self.format_currency(original_price)}")
+        summary.append(f"Annual Interest Rate: {current_rate*100:.2f}%")
+        summary.append(f"Monthly Interest Rate: {monthly_rate*100:.3f}%")
+        summary.append(f"Original Monthly Payment: {self.format_currency(original_payment)}")
+        summary.append(f"Years Elapsed: {years_elapsed}")
+        summary.append(f"Payments Made: {years_elapsed * 12}")
+        
+        current_balance = current['current_balance']
+        
+        summary.append(f"Total Amount Paid: {self.format_currency(current['total_paid'])}")
+        summary.append(f"Principal Paid: {self.format_currency(current['principal_paid'])}")
+        summary.append(f"Interest Paid: {self.format_currency(current['interest_paid'])}")
+        summary.append(f"Current Balance: {self.format_currency(current_balance)}\n")
+        
+        # Get new financing values
+        summary.append("=== New Financing Calculations ===\n")
+        
+        summary.append(f"Sale Price: {self.format_currency(sale_price)}")
+        summary.append(f"Down Payment: {self.format_currency(down_payment)}")
+        summary.append(f"Loan Amount: {self.format_currency(sale_price - down_payment)}")
+        summary.append(f"Interest Rate: {new_rate*100:.2f}%")
+        summary.append(f"Monthly Rate: {(new_rate/12)*100:.3f}%")
+        
+        # New financing and balloon payment
+        monthly_payment = new['monthly_payment']
+        
+        summary.append(f"Monthly Payment: {self.format_currency(monthly_payment)}")
+        
+        remaining_balance = new['balloon_payment']
+        total_interest = new['total_interest']
+        total_principal = new['total_principal']
+        total_payments = new['total_payments']
+        
+        summary.append(f"\nAfter {balloon_years} years ({new['balloon_months']} payments):")
+        summary.append(f"Total Payments Made: {self.format_currency(total_payments)}")
+        summary.append(f"Total Principal Paid: {self.format_currency(total_principal)}")
+        summary.append(f"Total Interest Paid: {self.format_currency(total_interest)}")
+        summary.append(f"Balloon Payment: {self.format_currency(remaining_balance)}")
+        summary.append(f"\nTotal Cost Breakdown:")
+        summary.append(f"Down Payment: {self.format_currency(down_payment)}")
+        summary.append(f"Total Payments: {self.format_currency(total_payments)}")
+        summary.append(f"Balloon Payment: {self.format_currency(remaining_balance)}")
+        summary.append(f"Total Cost: {self.format_currency(new['total_cost'])}")
+        
+        return {
+            'summary': "\n".join(summary),
+            'labels': [
+                ("Current Mortgage:", 'Title.TLabel'),
+                (f"Original Term: {original_term} years ({years_remaining} years remaining)", 'Result.TLabel'),
+                (f"Current Balance: {self.format_currency(current_balance)}", 'Result.TLabel'),
+                ("\nNew Financing:", 'Title.TLabel'),
+                (f"Monthly Payment: {self.format_currency(monthly_payment)}", 'Result.TLabel'),
+                (f"Balloon Payment (Year {balloon_years}): {self.format_currency(remaining_balance)}", 'Result.TLabel'),
+                ("\nPayment Totals:", 'Title.TLabel'),
+                (f"Total Payments: {self.format_currency(total_payments)}", 'Result.TLabel'),
+                (f"Total Cost: {self.format_currency(new['total_cost'])}", 'Result.TLabel')
+            ]
+        }
+
+    def read_investment_inputs(self) -> dict:
+        """Read the investment analysis entries (main thread only)."""
+        return {
+            'purchase_price': float(self.inv_purchase_price.get()),
+            'down_payment': float(self.inv_down_payment.get()),
+            'rate': float(self.inv_rate.get()),
+            'loan_term': 30,
+            'monthly_rent': float(self.monthly_rent.get()),
+            'vacancy_rate': float(self.vacancy_rate.get()),
+            'property_tax': float(self.property_tax.get()),
+            'insurance': float(self.insurance.get()),
+            'maintenance': float(self.maintenance.get()),
+            'utilities': float(self.utilities.get()),
+            'mgmt_fee': float(self.mgmt_fee.get()),
+            'appreciation_rate': float(self.appreciation_rate.get()),
+            'rent_increase': float(self.rent_increase.get())
+        }
 
     def calculate_investment(self):
         try:
-            summary = []
-            summary.append("=== Investment Property Analysis ===\n")
-            
-            # Get basic property information
-            purchase_price = float(self.inv_purchase_price.get())
-            down_payment = float(self.inv_down_payment.get())
-            rate = float(self.inv_rate.get()) / 100
-            loan_amount = purchase_price - down_payment
-            
-            # Get income information
-            monthly_rent = float(self.monthly_rent.get())
-            vacancy_rate = float(self.vacancy_rate.get()) / 100
-            
-            # Calculate effective gross income
-            annual_rent = monthly_rent * 12
-            vacancy_loss = annual_rent * vacancy_rate
-            effective_gross_income = annual_rent - vacancy_loss
-            
-            # Get operating expenses
-            property_tax = float(self.property_tax.get())
-            insurance = float(self.insurance.get())
-            maintenance = float(self.maintenance.get())
-            utilities = float(self.utilities.get())
-            mgmt_fee = float(self.mgmt_fee.get()) / 100 * effective_gross_income
-            
-            # Calculate loan payment
-            monthly_payment = self.calculate_monthly_payment(loan_amount, rate, 30)
-            annual_debt_service = monthly_payment * 12
-            
-            # Calculate operating expenses
-            total_expenses = property_tax + insurance + maintenance + utilities + mgmt_fee
-            
-            # Calculate NOI and cash flow
-            noi = effective_gross_income - total_expenses
-            cash_flow = noi - annual_debt_service
-            
-            # Calculate returns
-            cap_rate = (noi / purchase_price) * 100
-            cash_on_cash = (cash_flow / down_payment) * 100
-            
-            # Calculate DSCR
-            dscr = noi / annual_debt_service
-            
-            # Operating expense ratio
-            expense_ratio = (total_expenses / effective_gross_income) * 100
-            
-            # Appreciation analysis
-            appreciation_rate = float(self.appreciation_rate.get()) / 100
-            rent_increase = float(self.rent_increase.get()) / 100
-            
-            # 5-year projection
-            summary.append("Property Information:")
-            summary.append(f"Purchase Price: {self.format_currency(purchase_price)}")
-            summary.append(f"Down Payment: {self.format_currency(down_payment)} ({down_payment/purchase_price*100:.1f}%)")
-            summary.append(f"Loan Amount: {self.format_currency(loan_amount)}")
-            summary.append(f"Interest Rate: {rate*100:.2f}%")
-            summary.append(f"Monthly Payment: {self.format_currency(monthly_payment)}\n")
-            
-            summary.append("Income Analysis:")
-            summary.append(f"Monthly Rent: {self.format_currency(monthly_rent)}")
-            summary.append(f"Annual Rent: {self.format_currency(annual_rent)}")
-            summary.append(f"Vacancy Loss: {self.format_currency(vacancy_loss)}")
-            summary.append(f"Effective Gross Income: {self.format_currency(effective_gross_income)}\n")
-            
-            summary.append("Operating Expenses:")
-            summary.append(f"Property Tax: {self.format_currency(property_tax)}")
-            summary.append(f"Insurance: {self.format_currency(insurance)}")
-            summary.append(f"Maintenance: {self.format_currency(maintenance)}")
-            summary.append(f"Utilities: {self.format_currency(utilities)}")
-            summary.append(f"Property Management: {self.format_currency(mgmt_fee)}")
-            summary.append(f"Total Operating Expenses: {self.format_currency(total_expenses)}")
-            summary.append(f"Operating Expense Ratio: {expense_ratio:.1f}%\n")
-            
-            summary.append("Financial Metrics:")
-            summary.append(f"Net Operating Income (NOI): {self.format_currency(noi)}")
-            summary.append(f"Annual Debt Service: {self.format_currency(annual_debt_service)}")
-            summary.append(f"Annual Cash Flow: {self.format_currency(cash_flow)}")
-            summary.append(f"Monthly Cash Flow: {self.format_currency(cash_flow/12)}")
-            summary.append(f"Cap Rate: {cap_rate:.2f}%")
-            summary.append(f"Cash on Cash Return: {cash_on_cash:.2f}%")
-            summary.append(f"Debt Service Coverage Ratio: {dscr:.2f}\n")
-            
-            summary.append("5-Year Projection:")
-            property_value = purchase_price
-            current_rent = monthly_rent
-            
-            for year in range(1, 6):
-                property_value *= (1 + appreciation_rate)
-                current_rent *= (1 + rent_increase)
-                equity = property_value - loan_amount
-                
-                summary.append(f"\nYear {year}:")
-                summary.append(f"Property Value: {self.format_currency(property_value)}")
-                summary.append(f"Monthly Rent: {self.format_currency(current_rent)}")
-                summary.append(f"Equity: {self.format_currency(equity)}")
-                summary.append(f"Return on Equity: {(cash_flow/equity)*100:.2f}%")
-            
-            # Update summary panel
-            self.update_summary("\n".join(summary))
-            
-            # Clear previous results
-            for widget in self.investment_results_frame.winfo_children():
-                widget.destroy()
-            
-            # Display key metrics in results frame
-            ttk.Label(self.investment_results_frame, text="Key Investment Metrics:", 
-                     style='Title.TLabel').pack(anchor='w')
-            ttk.Label(self.investment_results_frame, 
-                     text=f"Monthly Cash Flow: {self.format_currency(cash_flow/12)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.investment_results_frame, 
-                     text=f"Cap Rate: {cap_rate:.2f}%", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.investment_results_frame, 
-                     text=f"Cash on Cash Return: {cash_on_cash:.2f}%", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.investment_results_frame, 
-                     text=f"DSCR: {dscr:.2f}", 
-                     style='Result.TLabel').pack(anchor='w')
-            
-        except ValueError as e:
+            inputs = self.read_investment_inputs()
+        except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers in all fields.")
+            return
+        self.run_task('investment', self.compute_investment, inputs,
+                      lambda result: self.show_results(self.investment_results_frame, result))
+
+    def compute_investment(self, task, inputs: dict) -> dict:
+        """Investment analysis numbers and text; runs on a worker thread."""
+        summary = []
+        summary.append("=== Investment Property Analysis ===\n")
+        
+        # Get basic property information
+        purchase_price = inputs['purchase_price']
+        down_payment = inputs['down_payment']
+        rate = inputs['rate'] / 100
+        loan_amount = purchase_price - down_payment
+        
+        # Get income information
+        monthly_rent = inputs['monthly_rent']
+        vacancy_rate = inputs['vacancy_rate'] / 100
+        
+        # Calculate effective gross income
+        annual_rent = monthly_rent * 12
+        vacancy_loss = annual_rent * vacancy_rate
+        effective_gross_income = annual_rent - vacancy_loss
+        
+        # Get operating expenses
+        property_tax = inputs['property_tax']
+        insurance = inputs['insurance']
+        maintenance = inputs['maintenance']
+        utilities = inputs['utilities']
+        mgmt_fee = inputs['mgmt_fee'] / 100 * effective_gross_income
+        
+        analysis = Calculator.calculate_investment(inputs)
+        task.report(1, 3, "Analyzing")
+        
+        # Loan payment, NOI and cash flow
+        monthly_payment = analysis['monthly']['payment']
+        annual_debt_service = analysis['annual']['debt_service']
+        total_expenses = analysis['annual']['total_expenses']
+        noi = analysis['annual']['noi']
+        cash_flow = analysis['annual']['cash_flow']
+        
+        # Returns, DSCR and operating expense ratio
+        cap_rate = analysis['returns']['cap_rate']
+        cash_on_cash = analysis['returns']['cash_on_cash']
+        dscr = analysis['returns']['dscr']
+        expense_ratio = analysis['returns']['expense_ratio']
+        
+        # 5-year projection
+        summary.append("Property Information:")
+        summary.append(f"Purchase Price: {self.format_currency(purchase_price)}")
+        summary.append(f"Down Payment: {self.format_currency(down_payment)} ({down_payment/purchase_price*100:.1f}%)")
+        summary.append(f"Loan Amount: {self.format_currency(loan_amount)}")
+        summary.append(f"Interest Rate: {rate*100:.2f}%")
+        summary.append(f"Monthly Payment: {self.format_currency(monthly_payment)}\n")
+        
+        summary.append("Income Analysis:")
+        summary.append(f"Monthly Rent: {self.format_currency(monthly_rent)}")
+        summary.append(f"Annual Rent: {self.format_currency(annual_rent)}")
+        summary.append(f"Vacancy Loss: {self.format_currency(vacancy_loss)}")
+        summary.append(f"Effective Gross Income: {self.format_currency(effective_gross_income)}\n")
+        
+        summary.append("Operating Expenses:")
+        summary.append(f"Property Tax: {self.format_currency(property_tax)}")
+        summary.append(f"Insurance: {self.format_currency(insurance)}")
+        summary.append(f"Maintenance: {self.format_currency(maintenance)}")
+        summary.append(f"Utilities: {self.format_currency(utilities)}")
+        summary.append(f"Property Management: {self.format_currency(mgmt_fee)}")
+        summary.append(f"Total Operating Expenses: {self.format_currency(total_expenses)}")
+        summary.append(f"Operating Expense Ratio: {expense_ratio:.1f}%\n")
+        
+        summary.append("Financial Metrics:")
+        summary.append(f"Net Operating Income (NOI): {self.format_currency(noi)}")
+        summary.append(f"Annual Debt Service: {self.format_currency(annual_debt_service)}")
+        summary.append(f"Annual Cash Flow: {self.format_currency(cash_flow)}")
+        summary.append(f"Monthly Cash Flow: {self.format_currency(cash_flow/12)}")
+        summary.append(f"Cap Rate: {cap_rate:.2f}%")
+        summary.append(f"Cash on Cash Return: {cash_on_cash:.2f}%")
+        summary.append(f"Debt Service Coverage Ratio: {dscr:.2f}\n")
+        
+        summary.append("5-Year Projection:")
+        pro_forma = project_investments({**inputs, 'expense_inflation': 0}, years=5)
+        task.report(2, 3, "Projecting")
+        
+        for index, year in enumerate(pro_forma['year']):
+            summary.append(f"\nYear {year}:")
+            summary.append(f"Property Value: {self.format_currency(pro_forma['property_value'][index, 0])}")
+            summary.append(f"Monthly Rent: {self.format_currency(pro_forma['gross_rent'][index, 0] / 12)}")
+            summary.append(f"Cash Flow: {self.format_currency(pro_forma['cash_flow'][index, 0])}")
+            summary.append(f"Loan Balance: {self.format_currency(pro_forma['loan_balance'][index, 0])}")
+            summary.append(f"Equity: {self.format_currency(pro_forma['equity'][index, 0])}")
+            summary.append(f"Return on Equity: {pro_forma['return_on_equity'][index, 0]:.2f}%")
+        
+        return {
+            'summary': "\n".join(summary),
+            'labels': [
+                ("Key Investment Metrics:", 'Title.TLabel'),
+                (f"Monthly Cash Flow: {self.format_currency(cash_flow/12)}", 'Result.TLabel'),
+                (f"Cap Rate: {cap_rate:.2f}%", 'Result.TLabel'),
+                (f"Cash on Cash Return: {cash_on_cash:.2f}%", 'Result.TLabel'),
+                (f"DSCR: {dscr:.2f}", 'Result.TLabel')
+            ]
+        }
+
+    def parse_number_list(self, text: str) -> list:
+        """Parse a comma-separated list of numbers from an entry."""
+        return [float(value) for value in text.replace(';', ',').split(',') if value.strip()]
+
+    def read_comparison_inputs(self) -> dict:
+        """Read the loan comparison entries (main thread only)."""
+        inputs = {
+            'purchase_price': float(self.compare_price.get()),
+            'points_paid': float(self.points_paid.get()),
+            'tax_rate': float(self.tax_rate.get()),
+            'extra_payments': self.parse_number_list(self.extra_payment.get()) or [0.0],
+            'down_payment_percents': self.parse_number_list(self.compare_down_payments.get()),
+            'interest_rates': self.parse_number_list(self.compare_rates.get()),
+            'terms': [int(term) for term in self.parse_number_list(self.compare_terms.get())]
+        }
+        if not (inputs['down_payment_percents'] and inputs['interest_rates'] and inputs['terms']):
+            raise ValueError("Scenario grid cannot be empty")
+        return inputs
 
     def calculate_comparison(self):
         try:
-            summary = []
-            summary.append("=== Loan Comparison Analysis ===\n")
-            
-            purchase_price = float(self.compare_price.get())
-            points_paid = float(self.points_paid.get())
-            tax_rate = float(self.tax_rate.get()) / 100
-            extra_payment = float(self.extra_payment.get())
-            
-            # Define scenarios
-            down_payments = [
-                purchase_price * 0.12,  # 12%
-                purchase_price * 0.20,  # 20%
-                purchase_price * 0.30   # 30%
-            ]
-            interest_rates = [0.015, 0.02, 0.025]  # 1.5%, 2%, 2.5%
-            
-            # Clear previous results
-            for widget in self.comparison_results_frame.winfo_children():
-                widget.destroy()
-            
-            # Create headers
-            headers = ["Down Payment", "Rate", "Monthly", "Total Interest", "Years to Pay"]
-            for col, header in enumerate(headers):
-                ttk.Label(self.comparison_results_frame, text=header, 
-                         style='Title.TLabel').grid(row=0, column=col, padx=5, pady=5)
-            
-            row = 1
-            scenarios = []
-            
-            for down_payment in down_payments:
-                for rate in interest_rates:
-                    loan_amount = purchase_price - down_payment
-                    base_payment = self.calculate_monthly_payment(loan_amount, rate, 30)
-                    
-                    # Calculate with extra payment
-                    total_payment = base_payment + extra_payment
-                    remaining_balance = loan_amount
-                    months = 0
-                    total_interest = 0
-                    
-                    while remaining_balance > 0 and months < 360:
-                        interest = remaining_balance * (rate / 12)
-                        total_interest += interest
-                        principal = total_payment - interest
-                        remaining_balance -= principal
-                        months += 1
-                    
-                    years_to_pay = months / 12
-                    
-                    # Calculate tax savings
-                    first_year_interest = loan_amount * rate
-                    tax_savings = first_year_interest * tax_rate
-                    
-                    # Points cost
-                    points_cost = loan_amount * (points_paid / 100)
-                    
-                    # PMI (if down payment < 20%)
-                    pmi_required = down_payment < (purchase_price * 0.2)
-                    monthly_pmi = (loan_amount * 0.005) / 12 if pmi_required else 0
-                    
-                    scenario = {
-                        'down_payment': down_payment,
-                        'down_payment_percent': (down_payment / purchase_price) * 100,
-                        'rate': rate * 100,
-                        'monthly_payment': base_payment,
-                        'total_payment': total_payment,
-                        'total_interest': total_interest,
-                        'years_to_pay': years_to_pay,
-                        'tax_savings': tax_savings,
-                        'points_cost': points_cost,
-                        'monthly_pmi': monthly_pmi
-                    }
-                    scenarios.append(scenario)
-                    
-                    # Display in grid
-                    ttk.Label(self.comparison_results_frame, 
-                             text=f"{self.format_currency(down_payment)} ({scenario['down_payment_percent']:.1f}%)", 
-                             style='Result.TLabel').grid(row=row, column=0, padx=5, pady=2)
-                    ttk.Label(self.comparison_results_frame, 
-                             text=f"{rate*100:.1f}%", 
-                             style='Result.TLabel').grid(row=row, column=1, padx=5, pady=2)
-                    ttk.Label(self.comparison_results_frame, 
-                             text=self.format_currency(base_payment), 
-                             style='Result.TLabel').grid(row=row, column=2, padx=5, pady=2)
-                    ttk.Label(self.comparison_results_frame, 
-                             text=self.format_currency(total_interest), 
-                             style='Result.TLabel').grid(row=row, column=3, padx=5, pady=2)
-                    ttk.Label(self.comparison_results_frame, 
-                             text=f"{years_to_pay:.1f}", 
-                             style='Result.TLabel').grid(row=row, column=4, padx=5, pady=2)
-                    row += 1
+            inputs = self.read_comparison_inputs()
+        except ValueError:
+            messagebox.showerror("Error", "Please enter valid numbers in all fields.")
+            return
+        self.run_task('comparison', self.compute_comparison, inputs,
+                      self.show_comparison_results)
+
+    def compute_comparison(self, task, inputs: dict) -> dict:
+        """Loan grid rows and summary text; runs on a worker thread."""
+        summary = []
+        summary.append("=== Loan Comparison Analysis ===\n")
+        
+        purchase_price = inputs['purchase_price']
+        points_paid = inputs['points_paid']
+        
+        grid = flatten_grid(compare_loans(
+            purchase_price,
+            [percent / 100 for percent in inputs['down_payment_percents']],
+            [rate / 100 for rate in inputs['interest_rates']],
+            inputs['terms'],
+            inputs['extra_payments'],
+            points=points_paid,
+            tax_rate=inputs['tax_rate'] / 100
+        ))
+        
+        count = len(grid['loan_amount'])
+        rows = []
+        summary.append("Scenario Details:\n")
+        for i in range(count):
+            if i % 200 == 0:
+                task.report(i, count, f"Formatting {count} scenarios")
+            scenario = {key: float(values[i]) for key, values in grid.items()}
+            scenario['down_payment_percent'] = (scenario['down_payment'] / purchase_price) * 100
+            
+            rows.append((
+                f"{self.format_currency(scenario['down_payment'])} ({scenario['down_payment_percent']:.1f}%)",
+                f"{scenario['rate']*100:.2f}%",
+                f"{scenario['term_years']:.0f}",
+                self.format_currency(scenario['extra_payment']),
+                self.format_currency(scenario['monthly_payment']),
+                self.format_currency(scenario['total_interest']),
+                self.format_currency(scenario['total_pmi']),
+                f"{scenario['years_to_pay']:.1f}"
+            ))
             
             # Add detailed analysis to summary
-            summary.append("Scenario Details:\n")
-            for scenario in scenarios:
-                summary.append(f"Down Payment: {self.format_currency(scenario['down_payment'])} "
-                             f"({scenario['down_payment_percent']:.1f}%)")
-                summary.append(f"Interest Rate: {scenario['rate']:.1f}%")
-                summary.append(f"Base Monthly Payment: {self.format_currency(scenario['monthly_payment'])}")
-                if extra_payment > 0:
-                    summary.append(f"Extra Monthly Payment: {self.format_currency(extra_payment)}")
-                    summary.append(f"Total Monthly Payment: {self.format_currency(scenario['total_payment'])}")
-                summary.append(f"Years to Pay: {scenario['years_to_pay']:.1f}")
-                summary.append(f"Total Interest: {self.format_currency(scenario['total_interest'])}")
-                summary.append(f"First Year Tax Savings: {self.format_currency(scenario['tax_savings'])}")
-                if scenario['monthly_pmi'] > 0:
-                    summary.append(f"Monthly PMI: {self.format_currency(scenario['monthly_pmi'])}")
-                if points_paid > 0:
-                    summary.append(f"Points Cost: {self.format_currency(scenario['points_cost'])}")
-                summary.append("")
-            
-            # Update summary panel
-            self.update_summary("\n".join(summary))
-            
-        except ValueError as e:
-            messagebox.showerror("Error", "Please enter valid numbers in all fields.")
+            summary.append(f"Down Payment: {self.format_currency(scenario['down_payment'])} "
+                         f"({scenario['down_payment_percent']:.1f}%)")
+            summary.append(f"Interest Rate: {scenario['rate']*100:.2f}%")
+            summary.append(f"Loan Term: {scenario['term_years']:.0f} years")
+            summary.append(f"Base Monthly Payment: {self.format_currency(scenario['monthly_payment'])}")
+            if scenario['extra_payment'] > 0:
+                summary.append(f"Extra Monthly Payment: {self.format_currency(scenario['extra_payment'])}")
+                summary.append(f"Total Monthly Payment: {self.format_currency(scenario['total_payment'])}")
+            summary.append(f"Years to Pay: {scenario['years_to_pay']:.1f}")
+            summary.append(f"Total Interest: {self.format_currency(scenario['total_interest'])}")
+            summary.append(f"First Year Tax Savings: {self.format_currency(scenario['tax_savings'])}")
+            if scenario['monthly_pmi'] > 0:
+                summary.append(f"Monthly PMI: {self.format_currency(scenario['monthly_pmi'])}")
+                summary.append(f"Total PMI ({scenario['pmi_months']:.0f} months): "
+                             f"{self.format_currency(scenario['total_pmi'])}")
+            if points_paid > 0:
+                summary.append(f"Points Cost: {self.format_currency(scenario['points_cost'])}")
+            summary.append("")
+        
+        return {'summary': "\n".join(summary), 'rows': rows}
+
+    def show_comparison_results(self, result: dict):
+        """
+        Fill the comparison table from ``compute_comparison``'s result,
+        updating existing rows in place where their values changed.
+        """
+        items = self.comparison_tree.get_children()
+        for index, values in enumerate(result['rows']):
+            if index < len(items):
+                shown = self.comparison_tree.item(items[index], 'values')
+                if tuple(map(str, shown)) != values:
+                    self.comparison_tree.item(items[index], values=values)
+            else:
+                self.comparison_tree.insert('', 'end', values=values)
+        if len(items) > len(result['rows']):
+            self.comparison_tree.delete(*items[len(result['rows']):])
+        self.update_summary(result['summary'])
+
+    def read_closing_costs_inputs(self) -> dict:
+        """Read the closing costs entries (main thread only)."""
+        title_rate = self.title_rate.get().strip()
+        return {
+            'purchase_price': float(self.closing_price.get()),
+            'loan_amount': float(self.closing_loan.get()),
+            'prepaid_insurance_months': float(self.prepaid_insurance.get()),
+            'prepaid_tax_months': float(self.prepaid_tax.get()),
+            'state': self.closing_state.get(),
+            'county': self.closing_county.get(),
+            # Blank uses the state or county title premium schedule
+            'title_rate': float(title_rate) if title_rate else None
+        }
 
     def calculate_closing_costs(self):
         try:
-            summary = []
-            summary.append("=== Closing Costs Analysis ===\n")
-            
-            # Get values
-            purchase_price = float(self.closing_price.get())
-            loan_amount = float(self.closing_loan.get())
-            prepaid_insurance_months = float(self.prepaid_insurance.get())
-            prepaid_tax_months = float(self.prepaid_tax.get())
-            title_rate = float(self.title_rate.get()) / 100
-            
-            # Calculate buyer's costs
-            loan_origination = loan_amount * 0.01
-            appraisal_fee = 500
-            credit_report = 50
-            tax_service = 75
-            flood_certification = 25
-            title_insurance = purchase_price * title_rate
-            recording_fees = 250
-            
-            # Calculate prepaids
-            insurance_rate = purchase_price * 0.003  # Estimated annual rate
-            tax_rate = purchase_price * 0.015  # Estimated annual rate
-            prepaid_insurance = (insurance_rate / 12) * prepaid_insurance_months
-            prepaid_tax = (tax_rate / 12) * prepaid_tax_months
-            
-            # Calculate escrow/impounds
-            escrow_insurance = (insurance_rate / 12) * 2  # 2 months cushion
-            escrow_tax = (tax_rate / 12) * 2  # 2 months cushion
-            
-            # Calculate seller's costs
-            realtor_fees = purchase_price * 0.06
-            transfer_tax = purchase_price * 0.001
-            seller_other_fees = 500
-            
-            # Calculate totals
-            total_buyer_closing = (loan_origination + appraisal_fee + credit_report + 
-                                 tax_service + flood_certification + title_insurance + 
-                                 recording_fees)
-            total_prepaids = prepaid_insurance + prepaid_tax
-            total_escrow = escrow_insurance + escrow_tax
-            total_seller_costs = realtor_fees + transfer_tax + seller_other_fees
-            
-            # Clear previous results
-            for widget in self.closing_results_frame.winfo_children():
-                widget.destroy()
-            
-            # Build summary
-            summary.append("Buyer's Closing Costs:")
-            summary.append(f"Loan Origination: {self.format_currency(loan_origination)}")
-            summary.append(f"Appraisal: {self.format_currency(appraisal_fee)}")
-            summary.append(f"Credit Report: {self.format_currency(credit_report)}")
-            summary.append(f"Tax Service: {self.format_currency(tax_service)}")
-            summary.append(f"Flood Certification: {self.format_currency(flood_certification)}")
-            summary.append(f"Title Insurance: {self.format_currency(title_insurance)}")
-            summary.append(f"Recording Fees: {self.format_currency(recording_fees)}")
-            summary.append(f"Total Closing Costs: {self.format_currency(total_buyer_closing)}\n")
-            
-            summary.append("Prepaids:")
-            summary.append(f"Insurance ({prepaid_insurance_months} months): "
-                         f"{self.format_currency(prepaid_insurance)}")
-            summary.append(f"Property Tax ({prepaid_tax_months} months): "
-                         f"{self.format_currency(prepaid_tax)}")
-            summary.append(f"Total Prepaids: {self.format_currency(total_prepaids)}\n")
-            
-            summary.append("Escrow/Impounds:")
-            summary.append(f"Insurance Reserves: {self.format_currency(escrow_insurance)}")
-            summary.append(f"Tax Reserves: {self.format_currency(escrow_tax)}")
-            summary.append(f"Total Escrow: {self.format_currency(total_escrow)}\n")
-            
-            summary.append("Total Buyer Funds Needed:")
-            total_buyer_needed = total_buyer_closing + total_prepaids + total_escrow
-            summary.append(f"Total Funds Needed: {self.format_currency(total_buyer_needed)}\n")
-            
-            summary.append("Seller's Costs:")
-            summary.append(f"Realtor Fees: {self.format_currency(realtor_fees)}")
-            summary.append(f"Transfer Tax: {self.format_currency(transfer_tax)}")
-            summary.append(f"Other Fees: {self.format_currency(seller_other_fees)}")
-            summary.append(f"Total Seller Costs: {self.format_currency(total_seller_costs)}")
-            
-            # Calculate seller's net proceeds
-            net_proceeds = purchase_price - total_seller_costs - loan_amount
-            summary.append(f"\nSeller's Net Proceeds: {self.format_currency(net_proceeds)}")
-            
-            # Update summary panel
-            self.update_summary("\n".join(summary))
-            
-            # Display results in frame
-            ttk.Label(self.closing_results_frame, text="Buyer's Costs:", 
-                     style='Title.TLabel').pack(anchor='w')
-            ttk.Label(self.closing_results_frame, 
-                     text=f"Closing Costs: {self.format_currency(total_buyer_closing)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.closing_results_frame, 
-                     text=f"Prepaids: {self.format_currency(total_prepaids)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.closing_results_frame, 
-                     text=f"Escrow: {self.format_currency(total_escrow)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.closing_results_frame, 
-                     text=f"Total Funds Needed: {self.format_currency(total_buyer_needed)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            
-            ttk.Label(self.closing_results_frame, text="\nSeller's Costs:", 
-                     style='Title.TLabel').pack(anchor='w')
-            ttk.Label(self.closing_results_frame, 
-                     text=f"Total Costs: {self.format_currency(total_seller_costs)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            ttk.Label(self.closing_results_frame, 
-                     text=f"Net Proceeds: {self.format_currency(net_proceeds)}", 
-                     style='Result.TLabel').pack(anchor='w')
-            
-        except ValueError as e:
+            inputs = self.read_closing_costs_inputs()
+        except ValueError:
             messagebox.showerror("Error", "Please enter valid numbers in all fields.")
+            return
+        self.run_task('closing_costs', self.compute_closing_costs, inputs,
+                      lambda result: self.show_results(self.closing_results_frame, result))
+
+    def compute_closing_costs(self, task, inputs: dict) -> dict:
+        """Closing costs numbers and text; runs on a worker thread."""
+        summary = []
+        summary.append("=== Closing Costs Analysis ===\n")
+        
+        # Get values
+        purchase_price = inputs['purchase_price']
+        loan_amount = inputs['loan_amount']
+        prepaid_insurance_months = inputs['prepaid_insurance_months']
+        prepaid_tax_months = inputs['prepaid_tax_months']
+        costs = Calculator.calculate_closing_costs({
+            'purchase_price': purchase_price,
+            'loan_amount': loan_amount,
+            'state': inputs['state'],
+            'county': inputs['county']
+        })
+        
+        # Buyer's costs from the state or county fee schedule
+        itemized = costs['itemized_costs']
+        loan_origination = itemized['loan_origination']
+        appraisal_fee = itemized['appraisal']
+        credit_report = itemized['credit_report']
+        tax_service = itemized['tax_service']
+        flood_certification = itemized['flood_cert']
+        title_insurance = itemized['title_insurance']
+        if inputs['title_rate'] is not None:
+            title_insurance = purchase_price * inputs['title_rate'] / 100
+        recording_fees = itemized['recording']
+        
+        # Calculate prepaids
+        insurance_rate = purchase_price * 0.003  # Estimated annual rate
+        tax_rate = purchase_price * 0.015  # Estimated annual rate
+        prepaid_insurance = (insurance_rate / 12) * prepaid_insurance_months
+        prepaid_tax = (tax_rate / 12) * prepaid_tax_months
+        
+        # Calculate escrow/impounds
+        escrow_insurance = (insurance_rate / 12) * 2  # 2 months cushion
+        escrow_tax = (tax_rate / 12) * 2  # 2 months cushion
+        
+        # Seller's costs
+        realtor_fees = costs['seller_costs']['realtor_fees']
+        transfer_tax = costs['seller_costs']['transfer_tax']
+        seller_other_fees = costs['seller_costs']['seller_other_fees']
+        
+        # Calculate totals
+        total_buyer_closing = (loan_origination + appraisal_fee + credit_report + 
+                             tax_service + flood_certification + title_insurance + 
+                             recording_fees)
+        total_prepaids = prepaid_insurance + prepaid_tax
+        total_escrow = escrow_insurance + escrow_tax
+        total_seller_costs = realtor_fees + transfer_tax + seller_other_fees
+        
+        # Build summary
+        summary.append("Buyer's Closing Costs:")
+        summary.append(f"Loan Origination: {self.format_currency(loan_origination)}")
+        summary.append(f"Appraisal: {self.format_currency(appraisal_fee)}")
+        summary.append(f"Credit Report: {self.format_currency(credit_report)}")
+        summary.append(f"Tax Service: {self.format_currency(tax_service)}")
+        summary.append(f"Flood Certification: {self.format_currency(flood_certification)}")
+        summary.append(f"Title Insurance: {self.format_currency(title_insurance)}")
+        summary.append(f"Recording Fees: {self.format_currency(recording_fees)}")
+        summary.append(f"Total Closing Costs: {self.format_currency(total_buyer_closing)}\n")
+        
+        summary.append("Prepaids:")
+        summary.append(f"Insurance ({prepaid_insurance_months} months): "
+                     f"{self.format_currency(prepaid_insurance)}")
+        summary.append(f"Property Tax ({prepaid_tax_months} months): "
+                     f"{self.format_currency(prepaid_tax)}")
+        summary.append(f"Total Prepaids: {self.format_currency(total_prepaids)}\n")
+        
+        summary.append("Escrow/Impounds:")
+        summary.append(f"Insurance Reserves: {self.format_currency(escrow_insurance)}")
+        summary.append(f"Tax Reserves: {self.format_currency(escrow_tax)}")
+        summary.append(f"Total Escrow: {self.format_currency(total_escrow)}\n")
+        
+        summary.append("Total Buyer Funds Needed:")
+        total_buyer_needed = total_buyer_closing + total_prepaids + total_escrow
+        summary.append(f"Total Funds Needed: {self.format_currency(total_buyer_needed)}\n")
+        
+        summary.append("Seller's Costs:")
+        summary.append(f"Realtor Fees: {self.format_currency(realtor_fees)}")
+        summary.append(f"Transfer Tax: {self.format_currency(transfer_tax)}")
+        summary.append(f"Other Fees: {self.format_currency(seller_other_fees)}")
+        summary.append(f"Total Seller Costs: {self.format_currency(total_seller_costs)}")
+        
+        # Calculate seller's net proceeds
+        net_proceeds = purchase_price - total_seller_costs - loan_amount
+        summary.append(f"\nSeller's Net Proceeds: {self.format_currency(net_proceeds)}")
+        
+        return {
+            'summary': "\n".join(summary),
+            'labels': [
+                ("Buyer's Costs:", 'Title.TLabel'),
+                (f"Closing Costs: {self.format_currency(total_buyer_closing)}", 'Result.TLabel'),
+                (f"Prepaids: {self.format_currency(total_prepaids)}", 'Result.TLabel'),
+                (f"Escrow: {self.format_currency(total_escrow)}", 'Result.TLabel'),
+                (f"Total Funds Needed: {self.format_currency(total_buyer_needed)}", 'Result.TLabel'),
+                ("\nSeller's Costs:", 'Title.TLabel'),
+                (f"Total Costs: {self.format_currency(total_seller_costs)}", 'Result.TLabel'),
+                (f"Net Proceeds: {self.format_currency(net_proceeds)}", 'Result.TLabel')
+            ]
+        }
 
     def add_scenario_buttons(self):
         """Add Save Scenario button to each calculator tab."""
@@ -1218,18 +1558,9 @@ class RealEstateCalculator:
         """Get the current calculation data based on the active tab."""
         try:
             if tab == self.seller_financing_tab:
-                return {
-                    'sale_price': float(self.sale_price.get()),
-                    'down_payment': float(self.down_payment.get()),
-                    'rate': float(self.new_rate.get()) / 100,
-                    'loan_amount': float(self.sale_price.get()) - float(self.down_payment.get()),
-                    'monthly_payment': float(self.calculate_monthly_payment(
-                        float(self.sale_price.get()) - float(self.down_payment.get()),
-                        float(self.new_rate.get()) / 100,
-                        30
-                    )),
-                    'total_cost': float(self.sale_price.get())
-                }
+                return {'type': 'seller_financing', **self.read_seller_financing_inputs()}
+            if tab == self.investment_tab:
+                return {'type': 'investment', **self.read_investment_inputs()}
             # Add similar data collection for other tabs
             return {}
         except ValueError:
@@ -1238,13 +1569,14 @@ class RealEstateCalculator:
 
     def show_comparison(self):
         """Show the scenario comparison window."""
-        ScenarioComparisonWindow(self.root, self.scenario_manager)
+        ScenarioComparisonWindow(self.root, self.scenario_manager, self.tasks)
 
 
 def main():
     root = tk.Tk()
     app = RealEstateCalculator(root)
     root.mainloop()
+    app.tasks.shutdown()
 
 
 if __name__ == "__main__":
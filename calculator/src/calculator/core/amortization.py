@@ -0,0 +1,179 @@
+"""Closed-form amortization engine.
+
+Every quantity is derived from the annuity identities instead of stepping
+through the loan one month at a time, so the cost of a lookup does not
+grow with the term of the loan.
+"""
+
+from typing import Dict
+
+import numpy as np
+import numpy.typing as npt
+
+
+def level_payment(
+    principal: float,
+    monthly_rate: float,
+    num_payments: int
+) -> float:
+    """
+    Calculate the level payment that retires a loan in ``num_payments``.
+
+    Args:
+        principal: Loan amount
+        monthly_rate: Periodic (monthly) interest rate as decimal
+        num_payments: Total number of payments
+
+    Returns:
+        Payment amount per period
+
+    Examples:
+        >>> round(level_payment(200000, 0.05 / 12, 360), 2)
+        1073.64
+    """
+    if monthly_rate == 0:
+        return principal / num_payments
+
+    growth = (1 + monthly_rate) ** num_payments
+    return principal * monthly_rate * growth / (growth - 1)
+
+
+def balance_after(
+    principal: float,
+    monthly_rate: float,
+    num_payments: int,
+    payments_made: int
+) -> float:
+    """
+    Calculate the balance left after ``payments_made`` level payments.
+
+    Uses B(k) = P * ((1 + r)^n - (1 + r)^k) / ((1 + r)^n - 1), which is
+    algebraically identical to running the month-by-month recurrence.
+
+    Args:
+        principal: Original loan amount
+        monthly_rate: Periodic (monthly) interest rate as decimal
+        num_payments: Total number of payments in the original term
+        payments_made: Number of payments already made
+
+    Returns:
+        Remaining loan balance
+
+    Examples:
+        >>> round(balance_after(200000, 0.05 / 12, 360, 60), 2)
+        183657.46
+    """
+    if monthly_rate == 0:
+        return principal * (1 - payments_made / num_payments)
+
+    growth_n = (1 + monthly_rate) ** num_payments
+    growth_k = (1 + monthly_rate) ** payments_made
+    return principal * (growth_n - growth_k) / (growth_n - 1)
+
+
+def cumulative_principal(
+    principal: float,
+    monthly_rate: float,
+    num_payments: int,
+    payments_made: int
+) -> float:
+    """
+    Calculate the principal repaid over the first ``payments_made`` payments.
+
+    Args:
+        principal: Original loan amount
+        monthly_rate: Periodic (monthly) interest rate as decimal
+        num_payments: Total number of payments in the original term
+        payments_made: Number of payments already made
+
+    Returns:
+        Cumulative principal paid
+    """
+    return principal - balance_after(
+        principal,
+        monthly_rate,
+        num_payments,
+        payments_made
+    )
+
+
+def cumulative_interest(
+    principal: float,
+    monthly_rate: float,
+    num_payments: int,
+    payments_made: int
+) -> float:
+    """
+    Calculate the interest paid over the first ``payments_made`` payments.
+
+    Args:
+        principal: Original loan amount
+        monthly_rate: Periodic (monthly) interest rate as decimal
+        num_payments: Total number of payments in the original term
+        payments_made: Number of payments already made
+
+    Returns:
+        Cumulative interest paid
+    """
+    payment = level_payment(principal, monthly_rate, num_payments)
+    return payment * payments_made - cumulative_principal(
+        principal,
+        monthly_rate,
+        num_payments,
+        payments_made
+    )
+
+
+def amortization_schedule(
+    principal: float,
+    monthly_rate: float,
+    num_payments: int
+) -> Dict[str, npt.NDArray[np.float64]]:
+    """
+    Build the full amortization schedule in a single vectorized pass.
+
+    Args:
+        principal: Loan amount
+        monthly_rate: Periodic (monthly) interest rate as decimal
+        num_payments: Total number of payments
+
+    Returns:
+        Dictionary of equal-length arrays, one entry per payment:
+            payment_number: 1-based payment index
+            payment: Level payment amount
+            interest: Interest portion of the payment
+            principal: Principal portion of the payment
+            balance: Balance remaining after the payment
+            cumulative_interest: Interest paid to date
+            cumulative_principal: Principal paid to date
+
+    Raises:
+        ValueError: If ``num_payments`` is not positive
+    """
+    if num_payments <= 0:
+        raise ValueError("Number of payments must be positive")
+
+    payment_number = np.arange(1, num_payments + 1, dtype=np.float64)
+    payment = level_payment(principal, monthly_rate, num_payments)
+
+    if monthly_rate == 0:
+        balance = principal * (1 - payment_number / num_payments)
+    else:
+        growth_n = (1 + monthly_rate) ** num_payments
+        growth_k = (1 + monthly_rate) ** payment_number
+        balance = principal * (growth_n - growth_k) / (growth_n - 1)
+    balance[-1] = 0.0
+
+    opening_balance = np.concatenate(([float(principal)], balance[:-1]))
+    interest = opening_balance * monthly_rate
+    principal_paid = opening_balance - balance
+
+    return {
+        'payment_number': payment_number,
+        'payment': np.full(num_payments, payment),
+        'interest': interest,
+        'principal': principal_paid,
+        'balance': balance,
+        'cumulative_interest': np.cumsum(interest),
+        'cumulative_principal': principal - balance
+    }
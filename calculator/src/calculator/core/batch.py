@@ -0,0 +1,264 @@
+"""Vectorized loan calculations over arrays of loans.
+
+Each function accepts scalars or NumPy arrays and broadcasts them against
+each other, so a whole book of loans is priced with a handful of array
+operations instead of one Python call per loan. Zero-rate loans are
+handled with masks rather than per-element branches.
+
+``investment_metrics`` and ``closing_costs`` are the columnar
+counterparts of the ``Calculator`` methods of the same name: they take a
+mapping of field name to array instead of one dictionary per property.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core.fees import fee_schedules
+from calculator.core.validation import check, column
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def _as_arrays(*values: npt.ArrayLike) -> Tuple[FloatArray, ...]:
+    """Convert inputs to float arrays broadcast to a common shape."""
+    return tuple(
+        np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in values))
+    )
+
+
+def _periodic_terms(
+    annual_rate: FloatArray,
+    term_years: FloatArray
+) -> Tuple[FloatArray, FloatArray, npt.NDArray[np.bool_], FloatArray]:
+    """Return monthly rate, payment count, zero-rate mask and (1 + r)^n."""
+    monthly_rate = annual_rate / 12
+    num_payments = term_years * 12
+    zero_rate = monthly_rate == 0
+    growth_n = (1 + monthly_rate) ** num_payments
+    return monthly_rate, num_payments, zero_rate, growth_n
+
+
+def _validate(
+    principal: FloatArray,
+    annual_rate: FloatArray,
+    term_years: FloatArray
+) -> None:
+    """Apply the scalar path's input checks to whole arrays at once."""
+    check('loan', {'principal': principal, 'rate': annual_rate, 'years': term_years})
+
+
+def monthly_payments(
+    principal: npt.ArrayLike,
+    annual_rate: npt.ArrayLike,
+    term_years: npt.ArrayLike
+) -> FloatArray:
+    """
+    Calculate monthly payments for many loans at once.
+
+    Args:
+        principal: Loan amounts
+        annual_rate: Annual interest rates as decimals (e.g., 0.05 for 5%)
+        term_years: Loan terms in years
+
+    Returns:
+        Array of monthly payment amounts
+
+    Examples:
+        >>> monthly_payments([200000, 100000], [0.05, 0.0], 30).round(2)
+        array([1073.64,  277.78])
+    """
+    p, rate, years = _as_arrays(principal, annual_rate, term_years)
+    _validate(p, rate, years)
+    monthly_rate, num_payments, zero_rate, growth_n = _periodic_terms(rate, years)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amortizing = p * monthly_rate * growth_n / (growth_n - 1)
+    return np.where(zero_rate, p / num_payments, amortizing)
+
+
+def loan_balances(
+    principal: npt.ArrayLike,
+    annual_rate: npt.ArrayLike,
+    term_years: npt.ArrayLike,
+    months_elapsed: npt.ArrayLike
+) -> FloatArray:
+    """
+    Calculate remaining balances for many loans at once.
+
+    Args:
+        principal: Original loan amounts
+        annual_rate: Annual interest rates as decimals
+        term_years: Original loan terms in years
+        months_elapsed: Payments already made on each loan
+
+    Returns:
+        Array of remaining loan balances
+    """
+    p, rate, years, elapsed = _as_arrays(
+        principal, annual_rate, term_years, months_elapsed
+    )
+    check('loan', {
+        'principal': p, 'rate': rate, 'years': years, 'months_elapsed': elapsed
+    })
+    monthly_rate, num_payments, zero_rate, growth_n = _periodic_terms(rate, years)
+
+    growth_k = (1 + monthly_rate) ** elapsed
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amortizing = p * (growth_n - growth_k) / (growth_n - 1)
+    return np.where(zero_rate, p * (1 - elapsed / num_payments), amortizing)
+
+
+def balloon_payments(
+    principal: npt.ArrayLike,
+    annual_rate: npt.ArrayLike,
+    term_years: npt.ArrayLike,
+    balloon_months: npt.ArrayLike
+) -> FloatArray:
+    """
+    Calculate the lump sum due when each loan balloons.
+
+    A balloon date at or beyond the end of the term means the loan fully
+    amortizes, so nothing is due.
+
+    Args:
+        principal: Original loan amounts
+        annual_rate: Annual interest rates as decimals
+        term_years: Amortization terms in years
+        balloon_months: Month in which each balloon falls due
+
+    Returns:
+        Array of balloon payment amounts
+    """
+    p, rate, years, balloon = _as_arrays(
+        principal, annual_rate, term_years, balloon_months
+    )
+    return loan_balances(p, rate, years, np.minimum(balloon, years * 12))
+
+
+def evaluate_loans(
+    principal: npt.ArrayLike,
+    annual_rate: npt.ArrayLike,
+    term_years: npt.ArrayLike,
+    months_elapsed: npt.ArrayLike,
+    balloon_months: Optional[npt.ArrayLike] = None
+) -> Dict[str, FloatArray]:
+    """
+    Calculate payment, balance and balloon for many loans at once.
+
+    Args:
+        principal: Original loan amounts
+        annual_rate: Annual interest rates as decimals
+        term_years: Loan terms in years
+        months_elapsed: Payments already made on each loan
+        balloon_months: Month in which each balloon falls due; defaults to
+            ``months_elapsed`` (the payoff if the note were called today)
+
+    Returns:
+        Dictionary of arrays:
+            payment: Monthly payment
+            balance: Remaining balance after ``months_elapsed`` payments
+            balloon: Lump sum due at the balloon date
+    """
+    if balloon_months is None:
+        balloon_months = months_elapsed
+
+    return {
+        'payment': monthly_payments(principal, annual_rate, term_years),
+        'balance': loan_balances(
+            principal, annual_rate, term_years, months_elapsed
+        ),
+        'balloon': balloon_payments(
+            principal, annual_rate, term_years, balloon_months
+        )
+    }
+
+
+def investment_metrics(columns: Mapping[str, npt.ArrayLike]) -> Dict[str, FloatArray]:
+    """
+    Calculate investment property metrics for many properties at once.
+
+    Args:
+        columns: Arrays keyed by the fields accepted by
+            ``Calculator.calculate_investment_metrics``
+
+    Returns:
+        Dictionary of arrays with the same keys as
+        ``Calculator.calculate_investment_metrics``
+
+    Raises:
+        ValueError: If any property fails the scalar path's input checks;
+            use ``validation.validate`` first to drop bad rows instead
+    """
+    check('investment', columns)
+
+    purchase_price = column(columns, 'purchase_price')
+    down_payment = column(columns, 'down_payment')
+    rate = column(columns, 'rate') / 100
+    loan_term = np.trunc(column(columns, 'loan_term', 30))
+    monthly_rent = column(columns, 'monthly_rent')
+    vacancy_rate = column(columns, 'vacancy_rate') / 100
+    other_income = column(columns, 'other_income')
+    parking_income = column(columns, 'parking_income')
+    laundry_income = column(columns, 'laundry_income')
+    property_tax = column(columns, 'property_tax')
+    insurance = column(columns, 'insurance')
+    maintenance = column(columns, 'maintenance')
+    utilities = column(columns, 'utilities')
+    mgmt_fee_rate = column(columns, 'mgmt_fee') / 100
+
+    effective_gross_income = (
+        monthly_rent * 12 * (1 - vacancy_rate)
+        + other_income + parking_income + laundry_income
+    )
+    monthly_payment = monthly_payments(
+        purchase_price - down_payment, rate, loan_term
+    )
+    total_expenses = (
+        property_tax + insurance + maintenance + utilities
+        + mgmt_fee_rate * effective_gross_income
+    )
+    noi = effective_gross_income - total_expenses
+    cash_flow = noi - monthly_payment * 12
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cap_rate = np.where(purchase_price == 0, 0.0, noi / purchase_price * 100)
+        cash_on_cash = np.where(
+            down_payment == 0, 0.0, cash_flow / down_payment * 100
+        )
+
+    return {
+        'monthly_payment': monthly_payment,
+        'annual_cash_flow': cash_flow,
+        'noi': noi,
+        'cap_rate': cap_rate,
+        'cash_on_cash': cash_on_cash,
+        'total_expenses': total_expenses
+    }
+
+
+def closing_costs(columns: Mapping[str, npt.ArrayLike]) -> Dict[str, Any]:
+    """
+    Calculate closing costs for many transactions at once.
+
+    Args:
+        columns: Arrays keyed by the fields accepted by
+            ``Calculator.calculate_closing_costs``, with the state and
+            county replaced by a ``schedule`` column of
+            ``FeeSchedules.lookup`` rows (default: the national schedule)
+
+    Returns:
+        Dictionary of arrays with the same keys as
+        ``Calculator.calculate_closing_costs``
+
+    Raises:
+        ValueError: If any transaction fails the scalar path's input checks;
+            use ``validation.validate`` first to drop bad rows instead
+    """
+    check('closing_costs', columns)
+    return fee_schedules().closing_costs(
+        column(columns, 'purchase_price'),
+        column(columns, 'loan_amount'),
+        np.asarray(columns.get('schedule', 0), dtype=np.intp)
+    )
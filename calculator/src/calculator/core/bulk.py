@@ -0,0 +1,270 @@
+"""Chunked evaluation of heterogeneous calculation records.
+
+Records arrive as plain dictionaries (decoded CSV rows or JSON objects).
+A chunk of records of one kind is parsed a column at a time, evaluated
+with a single call into :mod:`calculator.core.batch`, and split back into
+per-record results and per-record errors. Rows that fail
+:mod:`calculator.core.validation` are masked out before the call rather
+than aborting the chunk. Both the bulk CLI and the web batch endpoint
+are built on this module.
+"""
+
+import csv
+import json
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core import batch
+from calculator.core.batch import FloatArray
+from calculator.core.fees import fee_schedules
+from calculator.core.validation import error_messages, validate
+
+Record = Tuple[int, Any]
+Compute = Callable[[Mapping[str, FloatArray]], Dict[str, Any]]
+
+
+def _loan_results(columns: Mapping[str, FloatArray]) -> Dict[str, Any]:
+    """Payment, balance and balloon for loan records."""
+    balloon = np.where(
+        np.isnan(columns['balloon_months']),
+        columns['months_elapsed'],
+        columns['balloon_months']
+    )
+    return batch.evaluate_loans(
+        columns['principal'],
+        columns['rate'],
+        columns['years'],
+        columns['months_elapsed'],
+        balloon
+    )
+
+
+# Fields read for each record kind, with the default used when a field is
+# missing or empty, and the batch function that evaluates a chunk.
+KINDS: Dict[str, Tuple[Dict[str, float], Compute]] = {
+    'investment': ({
+        'purchase_price': 0.0,
+        'down_payment': 0.0,
+        'rate': 0.0,
+        'loan_term': 30.0,
+        'monthly_rent': 0.0,
+        'vacancy_rate': 0.0,
+        'other_income': 0.0,
+        'parking_income': 0.0,
+        'laundry_income': 0.0,
+        'property_tax': 0.0,
+        'insurance': 0.0,
+        'maintenance': 0.0,
+        'utilities': 0.0,
+        'mgmt_fee': 0.0
+    }, batch.investment_metrics),
+    'closing_costs': ({
+        'purchase_price': 0.0,
+        'loan_amount': 0.0
+    }, batch.closing_costs),
+    'loan': ({
+        'principal': 0.0,
+        'rate': 0.0,
+        'years': 30.0,
+        'months_elapsed': 0.0,
+        'balloon_months': float('nan')
+    }, _loan_results)
+}
+
+
+# Numeric columns derived from a chunk's text fields, for kinds that need
+# them: closing costs look up each record's state and county schedule.
+DERIVED: Dict[str, Callable[[Sequence[Mapping[str, Any]]], Dict[str, Any]]] = {
+    'closing_costs': lambda records: {'schedule': fee_schedules().lookup_many(records)}
+}
+
+
+def read_records(stream: TextIO, fmt: str) -> Iterator[Record]:
+    """
+    Yield (line number, record) pairs from a CSV or NDJSON stream.
+
+    Records that cannot be decoded are yielded as exceptions so the caller
+    can report them in order.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_number, e
+            continue
+        if not isinstance(record, dict):
+            yield line_number, TypeError("Record must be a JSON object")
+            continue
+        yield line_number, record
+
+
+def chunked(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    """Group records into lists of at most ``size``."""
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_column(values: Sequence[Any], default: float) -> Tuple[FloatArray, npt.NDArray[np.bool_]]:
+    """Convert a column to floats, flagging values that are not numbers."""
+    raw = [default if value is None or value == '' else value for value in values]
+    try:
+        return np.array(raw, dtype=np.float64), np.zeros(len(raw), dtype=bool)
+    except (TypeError, ValueError):
+        pass
+
+    parsed = np.empty(len(raw))
+    invalid = np.zeros(len(raw), dtype=bool)
+    for i, value in enumerate(raw):
+        try:
+            parsed[i] = float(value)
+        except (TypeError, ValueError):
+            parsed[i] = np.nan
+            invalid[i] = True
+    return parsed, invalid
+
+
+def _flatten(results: Dict[str, Any]) -> Dict[str, FloatArray]:
+    """Flatten one level of nested result dictionaries into columns."""
+    flat: Dict[str, FloatArray] = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(value)
+        else:
+            flat[key] = value
+    return flat
+
+
+def _compute_rows(
+    kind: str,
+    columns: Mapping[str, FloatArray],
+    rows: npt.NDArray[np.intp]
+) -> Tuple[Dict[str, FloatArray], Dict[int, str]]:
+    """
+    Evaluate selected rows, skipping the ones that fail validation.
+
+    The selection is validated a column at a time and only the valid rows
+    are passed to the engine, in a single call.
+    """
+    selected = {k: v[rows] for k, v in columns.items()}
+    valid, codes = validate(kind, selected)
+    errors = dict(zip(
+        rows[~valid].tolist(), error_messages(kind, codes[~valid])
+    ))
+    if not np.any(valid):
+        return {}, errors
+    _, compute = KINDS[kind]
+    return _flatten(compute({k: v[valid] for k, v in selected.items()})), errors
+
+
+def evaluate_chunk(
+    kind: str,
+    chunk: Sequence[Record]
+) -> Tuple[List[int], Dict[str, List[Any]], List[Tuple[int, str]]]:
+    """
+    Evaluate one chunk of records of a single kind.
+
+    Args:
+        kind: Key of ``KINDS``
+        chunk: (line, record) pairs; a record may be an exception raised
+            while decoding it, which is reported as that line's error
+
+    Returns:
+        Tuple of (lines of the valid records, output columns as lists in the
+        same order, (line, message) errors)
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown record kind: {kind}")
+    fields, _ = KINDS[kind]
+    errors: Dict[int, str] = {}
+    records: List[Mapping[str, Any]] = []
+    for index, (_, record) in enumerate(chunk):
+        if isinstance(record, Exception):
+            errors[index] = f"Could not decode record: {record}"
+            records.append({})
+        else:
+            records.append(record)
+
+    columns: Dict[str, FloatArray] = {}
+    for name, default in fields.items():
+        values, invalid = _parse_column([r.get(name) for r in records], default)
+        columns[name] = values
+        for index in np.flatnonzero(invalid):
+            errors.setdefault(int(index), f"Invalid number for '{name}'")
+    if kind in DERIVED:
+        columns.update(DERIVED[kind](records))
+
+    candidates = np.array(
+        [i for i in range(len(chunk)) if i not in errors], dtype=np.intp
+    )
+    results: Dict[str, FloatArray] = {}
+    if len(candidates):
+        results, rejected = _compute_rows(kind, columns, candidates)
+        errors.update(rejected)
+        candidates = np.array(
+            [i for i in candidates if i not in errors], dtype=np.intp
+        )
+
+    lines = [chunk[index][0] for index in candidates]
+    output = {key: np.asarray(value).tolist() for key, value in results.items()}
+    error_list = [(chunk[index][0], message) for index, message in sorted(errors.items())]
+    return lines, output, error_list
+
+
+def evaluate_mixed(
+    chunk: Sequence[Record],
+    type_field: str = 'type'
+) -> Dict[str, Tuple[List[int], Dict[str, List[Any]], List[Tuple[int, str]]]]:
+    """
+    Evaluate a chunk of records whose kind is given by ``type_field``.
+
+    Records are grouped by kind and each group is evaluated with one
+    vectorized call. Records with an unknown kind are reported as errors
+    under the ``None`` group key.
+
+    Returns:
+        Dictionary mapping each kind to its ``evaluate_chunk`` result
+    """
+    groups: Dict[str, List[Record]] = {}
+    unknown: List[Tuple[int, str]] = []
+    for line, record in chunk:
+        if isinstance(record, Exception):
+            unknown.append((line, f"Could not decode record: {record}"))
+            continue
+        kind = record.get(type_field)
+        if kind not in KINDS:
+            unknown.append((line, 'Invalid calculation type'))
+            continue
+        groups.setdefault(kind, []).append((line, record))
+
+    evaluated: Dict[Any, Tuple[List[int], Dict[str, List[Any]], List[Tuple[int, str]]]] = {
+        kind: evaluate_chunk(kind, records) for kind, records in groups.items()
+    }
+    if unknown:
+        evaluated[None] = ([], {}, unknown)
+    return evaluated
@@ -0,0 +1,228 @@
+"""Canonicalized, bounded result cache for calculation requests.
+
+Requests that differ only in key order, numeric representation (5 and
+5.0) or surrounding whitespace map to the same cache entry. Strings are
+never read as numbers: "01234" is a ZIP code, not 1234. Each
+calculation type gets its own LRU partition so a burst of one kind of
+request cannot evict everything else.
+
+Results that also depend on reference data (closing costs on the fee
+schedules) are keyed on that data's version as well, so reloading the
+schedules never serves costs computed from the old fees.
+"""
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from calculator.core.fees import fee_schedules
+
+# Version of the reference data each calculation type reads, if any
+DATA_VERSIONS: Dict[str, Callable[[], str]] = {
+    'closing_costs': lambda: fee_schedules().digest,
+}
+
+
+def canonicalize(value: Any) -> Any:
+    """
+    Normalize a JSON payload so equivalent requests compare equal.
+
+    Integral floats become ints and other numbers are kept exactly,
+    strings are stripped but not parsed and dictionaries get string keys
+    (ordering is handled at serialization).
+
+    Args:
+        value: Decoded JSON value
+
+    Returns:
+        Canonical form of the value
+
+    Examples:
+        >>> canonicalize({'rate': 5.0, 'term': 30, 'zip': ' 01234 '})
+        {'rate': 5, 'term': 30, 'zip': '01234'}
+    """
+    if isinstance(value, dict):
+        return {str(key): canonicalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [canonicalize(item) for item in value]
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str):
+        return value.strip()
+    return str(value)
+
+
+def cache_key(payload: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the cache key for a calculation request.
+
+    Args:
+        payload: Request body including its ``type`` field
+
+    Returns:
+        Tuple of (calculation type, SHA-256 digest of the canonical payload)
+    """
+    canonical = json.dumps(
+        canonicalize(payload),
+        sort_keys=True,
+        separators=(',', ':')
+    )
+    digest = hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    return str(payload.get('type')), digest
+
+
+def result_key(payload: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Build the key of a calculation's result.
+
+    Like ``cache_key``, but the digest also covers the version of any
+    reference data the calculation type reads (see ``DATA_VERSIONS``).
+
+    Returns:
+        Tuple of (calculation type, SHA-256 digest)
+    """
+    calc_type, digest = cache_key(payload)
+    data_version = DATA_VERSIONS.get(calc_type)
+    if data_version is not None:
+        digest = hashlib.sha256(f'{data_version()}:{digest}'.encode('utf-8')).hexdigest()
+    return calc_type, digest
+
+
+class _Partition:
+    """LRU store and counters for one calculation type."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+class ResultCache:
+    """Thread-safe LRU/TTL cache of calculation results."""
+
+    def __init__(
+        self,
+        default_size: int = 256,
+        sizes: Optional[Dict[str, int]] = None,
+        ttl: Optional[float] = None
+    ):
+        """
+        Args:
+            default_size: Maximum entries for calculation types without an
+                explicit size
+            sizes: Maximum entries per calculation type
+            ttl: Seconds an entry stays valid; ``None`` keeps entries until
+                they are evicted
+        """
+        self.default_size = default_size
+        self.sizes = dict(sizes or {})
+        self.ttl = ttl
+        self._partitions: Dict[str, _Partition] = {}
+        self._lock = threading.Lock()
+
+    def _partition(self, calc_type: str) -> _Partition:
+        partition = self._partitions.get(calc_type)
+        if partition is None:
+            partition = _Partition(self.sizes.get(calc_type, self.default_size))
+            self._partitions[calc_type] = partition
+        return partition
+
+    def get(self, payload: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+
+        Returns:
+            Tuple of (found, result)
+        """
+        calc_type, digest = result_key(payload)
+        now = time.monotonic()
+        with self._lock:
+            partition = self._partition(calc_type)
+            entry = partition.entries.get(digest)
+            if entry is not None and self.ttl is not None and entry[0] <= now:
+                del partition.entries[digest]
+                partition.expirations += 1
+                entry = None
+            if entry is None:
+                partition.misses += 1
+                return False, None
+            partition.entries.move_to_end(digest)
+            partition.hits += 1
+            return True, entry[1]
+
+    def put(self, payload: Dict[str, Any], result: Any) -> None:
+        """Store a result, evicting the least recently used entry if full."""
+        calc_type, digest = result_key(payload)
+        expires = math.inf if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            partition = self._partition(calc_type)
+            if partition.max_entries <= 0:
+                return
+            partition.entries[digest] = (expires, result)
+            partition.entries.move_to_end(digest)
+            while len(partition.entries) > partition.max_entries:
+                partition.entries.popitem(last=False)
+                partition.evictions += 1
+
+    def get_or_compute(
+        self,
+        payload: Dict[str, Any],
+        compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Return the cached result for a payload, computing it on a miss.
+
+        Exceptions raised by ``compute`` propagate and nothing is cached.
+        Cached results are shared between callers and must not be mutated.
+        """
+        found, result = self.get(payload)
+        if found:
+            return result
+        result = compute()
+        self.put(payload, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._partitions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report hit, miss and eviction counters.
+
+        Returns:
+            Dictionary with overall totals and a ``by_type`` breakdown
+        """
+        with self._lock:
+            by_type = {
+                calc_type: {
+                    'hits': p.hits,
+                    'misses': p.misses,
+                    'evictions': p.evictions,
+                    'expirations': p.expirations,
+                    'size': len(p.entries),
+                    'max_entries': p.max_entries
+                }
+                for calc_type, p in self._partitions.items()
+            }
+        hits = sum(s['hits'] for s in by_type.values())
+        misses = sum(s['misses'] for s in by_type.values())
+        return {
+            'hits': hits,
+            'misses': misses,
+            'evictions': sum(s['evictions'] for s in by_type.values()),
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'by_type': by_type
+        }
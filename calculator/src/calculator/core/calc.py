@@ -2,6 +2,19 @@
 
 from typing import Dict, Any
 
+from calculator.core.amortization import (
+    balance_after,
+    cumulative_interest,
+    cumulative_principal,
+    level_payment,
+)
+from calculator.core.fees import fee_schedules
+
+# Version of the calculation engine. Bump it whenever a change alters the
+# numbers any Calculator method returns, so results stored with saved
+# scenarios are recomputed.
+ENGINE_VERSION = '2'
+
 
 class Calculator:
     """Core calculator functionality."""
@@ -42,17 +55,7 @@ class Calculator:
             raise ValueError("Principal and rate must be non-negative, years must be positive")
             
         # ⬤ Breakpoint 2 (Line 43)
-        monthly_rate = rate / 12
-        num_payments = years * 12
-        
-        # ⬤ Breakpoint 3 (Line 46)
-        if monthly_rate == 0:
-            return principal / num_payments
-            
-        # ⬤ Breakpoint 4 (Line 51)
-        numerator = principal * monthly_rate * (1 + monthly_rate)**num_payments
-        denominator = (1 + monthly_rate)**num_payments - 1
-        return numerator / denominator
+        return level_payment(principal, rate / 12, years * 12)
 
     @staticmethod
     def calculate_loan_balance(
@@ -75,7 +78,7 @@ class Calculator:
             
         Examples:
             >>> Calculator.calculate_loan_balance(200000, 0.05, 30, 5)
-            180371.80
+            183657.46
         """
         if original_principal < 0 or annual_rate < 0:
             raise ValueError("Principal and rate must be non-negative")
@@ -85,23 +88,121 @@ class Calculator:
             raise ValueError("Elapsed years cannot exceed original term")
             
         # ⬤ Breakpoint 5 (Line 80)
-        monthly_rate = annual_rate / 12
-        
-        monthly_payment = Calculator.calculate_monthly_payment(
+        return balance_after(
             original_principal,
-            annual_rate,
-            original_term
+            annual_rate / 12,
+            original_term * 12,
+            years_elapsed * 12
         )
+
+    @staticmethod
+    def calculate_seller_financing(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calculate a seller-financed sale that pays off an existing mortgage.
+        
+        Args:
+            data: Dictionary containing:
+                original_price: Original amount of the seller's mortgage
+                current_rate: Rate on the seller's mortgage (as percentage)
+                original_term: Term of the seller's mortgage in years
+                years_remaining: Years left on the seller's mortgage
+                sale_price: Sale price of the property
+                down_payment: Buyer's down payment
+                new_rate: Rate on the seller-financed note (as percentage);
+                    ``rate`` is accepted as an alias
+                loan_term: Amortization term of the note in years;
+                    ``years`` is accepted as an alias
+                balloon_years: Years until the note balloons (defaults to
+                    the full term, i.e. no balloon)
+                
+        Returns:
+            Dictionary containing:
+                current_mortgage: original_payment, years_elapsed,
+                    payments_made, total_paid, principal_paid,
+                    interest_paid and current_balance
+                new_financing: loan_amount, monthly_payment,
+                    balloon_months, total_payments, total_principal,
+                    total_interest, balloon_payment and total_cost
+                
+        Examples:
+            >>> results = Calculator.calculate_seller_financing({
+            ...     'sale_price': 420000,
+            ...     'down_payment': 50000,
+            ...     'new_rate': 1.5,
+            ...     'loan_term': 30,
+            ...     'balloon_years': 11
+            ... })
+            >>> round(results['new_financing']['balloon_payment'], 2)
+            253194.54
+        """
+        if not isinstance(data, dict):
+            raise TypeError("Input must be a dictionary")
+            
+        original_price = float(data.get('original_price', 0))
+        current_rate = float(data.get('current_rate', 0)) / 100
+        original_term = int(data.get('original_term', 30))
+        years_remaining = int(data.get('years_remaining', original_term))
+        years_elapsed = original_term - years_remaining
         
-        remaining_balance = original_principal
-        months_elapsed = years_elapsed * 12
+        original_payment = Calculator.calculate_monthly_payment(
+            original_price, current_rate, original_term
+        )
+        current_balance = Calculator.calculate_loan_balance(
+            original_price, current_rate, original_term, years_elapsed
+        )
+        payments_made = years_elapsed * 12
+        total_paid = original_payment * payments_made
+        principal_paid = original_price - current_balance
         
-        for _ in range(months_elapsed):  # ⬤ Breakpoint 6 (Line 91)
-            interest = remaining_balance * monthly_rate
-            principal_paid = monthly_payment - interest
-            remaining_balance -= principal_paid
+        sale_price = float(data.get('sale_price', 0))
+        down_payment = float(data.get('down_payment', 0))
+        new_rate = float(data.get('new_rate', data.get('rate', 0))) / 100
+        loan_term = int(float(data.get('loan_term', data.get('years', 30))))
+        balloon_years = int(data.get('balloon_years', loan_term))
         
-        return remaining_balance
+        if sale_price < 0 or down_payment < 0:
+            raise ValueError("Financial values cannot be negative")
+        if down_payment > sale_price:
+            raise ValueError("Down payment cannot exceed sale price")
+        if balloon_years < 0:
+            raise ValueError("Balloon years cannot be negative")
+            
+        loan_amount = sale_price - down_payment
+        monthly_payment = Calculator.calculate_monthly_payment(
+            loan_amount, new_rate, loan_term
+        )
+        num_payments = loan_term * 12
+        balloon_months = min(balloon_years * 12, num_payments)
+        balloon_payment = balance_after(
+            loan_amount, new_rate / 12, num_payments, balloon_months
+        )
+        total_payments = monthly_payment * balloon_months
+        
+        return {
+            'current_mortgage': {
+                'original_payment': original_payment,
+                'years_elapsed': years_elapsed,
+                'payments_made': payments_made,
+                'total_paid': total_paid,
+                'principal_paid': principal_paid,
+                'interest_paid': total_paid - principal_paid,
+                'current_balance': current_balance
+            },
+            'new_financing': {
+                'loan_amount': loan_amount,
+                'monthly_payment': monthly_payment,
+                'balloon_months': balloon_months,
+                'total_payments': total_payments,
+                'total_principal': cumulative_principal(
+                    loan_amount, new_rate / 12, num_payments, balloon_months
+                ),
+                'total_interest': cumulative_interest(
+                    loan_amount, new_rate / 12, num_payments, balloon_months
+                ),
+                'balloon_payment': balloon_payment,
+                'total_cost': down_payment + total_payments + balloon_payment
+            }
+        }
 
     @staticmethod
     def calculate_investment_metrics(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -240,6 +341,55 @@ class Calculator:
             'total_expenses': total_expenses
         }
 
+    @staticmethod
+    def calculate_investment(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Calculate a full investment property analysis.
+        
+        Builds on ``calculate_investment_metrics`` and adds the ratios the
+        front ends display.
+        
+        Args:
+            data: Same fields as ``calculate_investment_metrics``
+            
+        Returns:
+            Dictionary containing:
+                monthly: payment, cash_flow and effective_gross_income
+                annual: effective_gross_income, total_expenses, noi,
+                    debt_service and cash_flow
+                returns: cap_rate, cash_on_cash, dscr and expense_ratio
+        """
+        metrics = Calculator.calculate_investment_metrics(data)
+        annual_debt_service = metrics['monthly_payment'] * 12
+        effective_gross_income = metrics['noi'] + metrics['total_expenses']
+        
+        dscr = 0 if annual_debt_service == 0 else metrics['noi'] / annual_debt_service
+        expense_ratio = (
+            0 if effective_gross_income == 0
+            else metrics['total_expenses'] / effective_gross_income * 100
+        )
+        
+        return {
+            'monthly': {
+                'payment': metrics['monthly_payment'],
+                'cash_flow': metrics['annual_cash_flow'] / 12,
+                'effective_gross_income': effective_gross_income / 12
+            },
+            'annual': {
+                'effective_gross_income': effective_gross_income,
+                'total_expenses': metrics['total_expenses'],
+                'noi': metrics['noi'],
+                'debt_service': annual_debt_service,
+                'cash_flow': metrics['annual_cash_flow']
+            },
+            'returns': {
+                'cap_rate': metrics['cap_rate'],
+                'cash_on_cash': metrics['cash_on_cash'],
+                'dscr': dscr,
+                'expense_ratio': expense_ratio
+            }
+        }
+
     @staticmethod
     def calculate_closing_costs(data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -250,11 +400,14 @@ class Calculator:
                 purchase_price: Purchase price of property
                 loan_amount: Amount being borrowed
                 state: State where property is located (affects rates)
+                county: County within the state, for county schedules
                 
         Returns:
             Dictionary containing:
                 total_closing_costs: Total closing costs
                 itemized_costs: Breakdown of individual costs
+                total_seller_costs: Total seller costs
+                seller_costs: Realtor fees, transfer tax and other fees
                 
         Examples:
             >>> data = {
@@ -272,6 +425,12 @@ class Calculator:
                     'flood_cert': 25,
                     'title_insurance': 1000,
                     'recording': 350
+                },
+                'total_seller_costs': 12700,
+                'seller_costs': {
+                    'realtor_fees': 12000,
+                    'transfer_tax': 200,
+                    'seller_other_fees': 500
                 }
             }
         """
@@ -286,34 +445,21 @@ class Calculator:
         if loan_amount > purchase_price:
             raise ValueError("Loan amount cannot exceed purchase price")
             
-        # Calculate standard closing costs
-        loan_origination = loan_amount * 0.01
-        appraisal_fee = 500
-        credit_report = 50
-        tax_service = 75
-        flood_certification = 25
-        title_insurance = purchase_price * 0.005
-        recording_fees = 350
-        
-        total_buyer_closing = (
-            loan_origination +
-            appraisal_fee +
-            credit_report +
-            tax_service +
-            flood_certification +
-            title_insurance +
-            recording_fees
+        # Fees, title premium tiers and transfer tax brackets for the
+        # property's county or state (the national default otherwise)
+        schedules = fee_schedules()
+        results = schedules.closing_costs(
+            purchase_price,
+            loan_amount,
+            schedules.lookup(data.get('state'), data.get('county'))
         )
-        
         return {
-            'total_closing_costs': total_buyer_closing,
+            'total_closing_costs': float(results['total_closing_costs']),
             'itemized_costs': {
-                'loan_origination': loan_origination,
-                'appraisal': appraisal_fee,
-                'credit_report': credit_report,
-                'tax_service': tax_service,
-                'flood_cert': flood_certification,
-                'title_insurance': title_insurance,
-                'recording': recording_fees
+                name: float(value) for name, value in results['itemized_costs'].items()
+            },
+            'total_seller_costs': float(results['total_seller_costs']),
+            'seller_costs': {
+                name: float(value) for name, value in results['seller_costs'].items()
             }
-        }
\ No newline at end of file
+        }
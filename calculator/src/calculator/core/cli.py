@@ -0,0 +1,125 @@
+"""Streaming bulk calculation command line interface.
+
+Reads CSV or NDJSON records in fixed-size chunks, evaluates each chunk
+with the vectorized batch functions and writes results as it goes, so
+memory use stays flat regardless of input size. Rows that cannot be
+parsed or fail validation are reported with their line number and the
+run continues.
+
+Usage:
+    python -m calculator.core.cli investment listings.csv -o scored.csv
+    python -m calculator.core.cli loan loans.ndjson --chunk-size 50000
+"""
+
+import argparse
+import csv
+import json
+import sys
+from typing import Any, Dict, List, Optional, Sequence, TextIO
+
+from calculator.core.bulk import KINDS, chunked, evaluate_chunk, read_records
+
+
+class _Writer:
+    """Incremental CSV or NDJSON writer."""
+
+    def __init__(self, stream: TextIO, fmt: str):
+        self.stream = stream
+        self.fmt = fmt
+        self.csv_writer: Optional['csv.DictWriter[str]'] = None
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        if self.fmt == 'csv':
+            if self.csv_writer is None:
+                self.csv_writer = csv.DictWriter(self.stream, fieldnames=list(rows[0]))
+                self.csv_writer.writeheader()
+            self.csv_writer.writerows(rows)
+        else:
+            self.stream.writelines(json.dumps(row) + '\n' for row in rows)
+        self.stream.flush()
+
+
+def _detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    return 'ndjson' if path.endswith(('.ndjson', '.jsonl', '.json')) else 'csv'
+
+
+def run(
+    kind: str,
+    source: TextIO,
+    destination: TextIO,
+    error_stream: TextIO,
+    input_format: str = 'csv',
+    output_format: str = 'csv',
+    chunk_size: int = 10000
+) -> Dict[str, int]:
+    """
+    Stream records from ``source`` through the calculator.
+
+    Returns:
+        Dictionary with ``rows``, ``valid`` and ``invalid`` counts
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown record kind: {kind}")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    writer = _Writer(destination, output_format)
+    counts = {'rows': 0, 'valid': 0, 'invalid': 0}
+    for chunk in chunked(read_records(source, input_format), chunk_size):
+        lines, columns, errors = evaluate_chunk(kind, chunk)
+        writer.write([
+            {'line': line, **{key: values[i] for key, values in columns.items()}}
+            for i, line in enumerate(lines)
+        ])
+        error_stream.writelines(
+            json.dumps({'line': line, 'error': message}) + '\n'
+            for line, message in errors
+        )
+        counts['rows'] += len(chunk)
+        counts['valid'] += len(lines)
+        counts['invalid'] += len(errors)
+    return counts
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Bulk-score property and loan records from CSV or NDJSON."
+    )
+    parser.add_argument('kind', choices=sorted(KINDS))
+    parser.add_argument('input', help="Input file, or - for standard input")
+    parser.add_argument('-o', '--output', default='-',
+                        help="Output file, or - for standard output")
+    parser.add_argument('--errors', default=None,
+                        help="File for per-line errors (default: standard error)")
+    parser.add_argument('--input-format', choices=('csv', 'ndjson'))
+    parser.add_argument('--output-format', choices=('csv', 'ndjson'))
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    input_format = _detect_format(args.input, args.input_format)
+    output_format = _detect_format(args.output, args.output_format)
+
+    source = sys.stdin if args.input == '-' else open(args.input, newline='')
+    destination = (sys.stdout if args.output == '-'
+                   else open(args.output, 'w', newline=''))
+    error_stream = sys.stderr if args.errors is None else open(args.errors, 'w')
+    try:
+        counts = run(args.kind, source, destination, error_stream,
+                     input_format, output_format, args.chunk_size)
+    finally:
+        for stream in (source, destination, error_stream):
+            if stream not in (sys.stdin, sys.stdout, sys.stderr):
+                stream.close()
+
+    print(f"Processed {counts['rows']} rows: {counts['valid']} valid, "
+          f"{counts['invalid']} invalid", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Vectorized loan comparison over arbitrary scenario grids.
+
+The months to payoff with an extra monthly payment are solved directly
+with the logarithmic NPER formula, so every cell of a down payment x
+rate x term x extra payment grid is evaluated in one array pass.
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core.batch import FloatArray, monthly_payments
+
+# Tolerance that keeps an exact payoff (e.g. no extra payment) from being
+# rounded up to an extra month by floating point noise.
+_PAYOFF_EPSILON = 1e-9
+
+
+def _solve_months(
+    start_balance: FloatArray,
+    target_balance: FloatArray,
+    monthly_rate: FloatArray,
+    payment: FloatArray
+) -> FloatArray:
+    """
+    Solve the number of payments that bring a balance down to a target.
+
+    For r > 0 the balance after k payments of M is
+    B(k) = B0 * g^k - M * (g^k - 1) / r with g = 1 + r, which gives
+    k = ln((M - r * target) / (M - r * B0)) / ln(g).
+    """
+    zero_rate = monthly_rate == 0
+    safe_rate = np.where(zero_rate, 1.0, monthly_rate)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amortizing = (
+            np.log((payment - safe_rate * target_balance)
+                   / (payment - safe_rate * start_balance))
+            / np.log1p(safe_rate)
+        )
+        interest_free = (start_balance - target_balance) / payment
+    months = np.where(zero_rate, interest_free, amortizing)
+    return np.ceil(np.maximum(months, 0) - _PAYOFF_EPSILON)
+
+
+def compare_loans(
+    purchase_price: float,
+    down_payment_fractions: Sequence[float],
+    rates: Sequence[float],
+    terms: Sequence[int] = (30,),
+    extra_payments: Sequence[float] = (0.0,),
+    points: float = 0.0,
+    tax_rate: float = 0.0,
+    pmi_rate: float = 0.005,
+    pmi_threshold: float = 0.2
+) -> Dict[str, FloatArray]:
+    """
+    Compare every combination of down payment, rate, term and extra payment.
+
+    Args:
+        purchase_price: Purchase price of the property
+        down_payment_fractions: Down payments as fractions of the price
+        rates: Annual interest rates as decimals
+        terms: Loan terms in years
+        extra_payments: Extra principal paid each month
+        points: Points paid at closing (as percentage of the loan)
+        tax_rate: Marginal tax rate as decimal, for interest deduction
+        pmi_rate: Annual PMI premium as decimal of the loan amount
+        pmi_threshold: Down payment fraction below which PMI is charged
+            and the loan-to-value at which it drops off
+
+    Returns:
+        Dictionary of arrays shaped (downs, rates, terms, extras):
+            down_payment: Down payment amount
+            loan_amount: Amount financed
+            rate: Annual interest rate as decimal
+            term_years: Loan term in years
+            extra_payment: Extra monthly payment
+            monthly_payment: Scheduled principal and interest payment
+            total_payment: Scheduled payment plus extra payment
+            months_to_payoff: Payments until the loan is retired
+            years_to_pay: ``months_to_payoff`` in years
+            total_interest: Interest paid until payoff
+            tax_savings: First-year tax savings from deducted interest
+            points_cost: Cost of points paid at closing
+            monthly_pmi: PMI premium per month while it applies
+            pmi_months: Payments until PMI drops off
+            total_pmi: PMI paid until it drops off
+
+    Examples:
+        >>> grid = compare_loans(420000, [0.12, 0.2], [0.015, 0.02])
+        >>> grid['monthly_payment'].shape
+        (2, 2, 1, 1)
+    """
+    down = np.asarray(down_payment_fractions, dtype=np.float64)
+    rate = np.asarray(rates, dtype=np.float64)
+    term = np.asarray(terms, dtype=np.float64)
+    extra = np.asarray(extra_payments, dtype=np.float64)
+    if np.any(down < 0) or np.any(down > 1):
+        raise ValueError("Down payment must be between 0 and 100 percent")
+    if np.any(extra < 0):
+        raise ValueError("Extra payment cannot be negative")
+
+    down, rate, term, extra = np.broadcast_arrays(
+        down[:, None, None, None],
+        rate[None, :, None, None],
+        term[None, None, :, None],
+        extra[None, None, None, :]
+    )
+    down_payment = purchase_price * down
+    loan_amount = purchase_price - down_payment
+    monthly_rate = rate / 12
+
+    base_payment = monthly_payments(loan_amount, rate, term)
+    total_payment = base_payment + extra
+    paying = total_payment > 0
+    safe_payment = np.where(paying, total_payment, 1.0)
+
+    months = _solve_months(
+        loan_amount, np.zeros_like(loan_amount), monthly_rate, safe_payment
+    )
+    months = np.where(paying, np.minimum(months, term * 12), 0)
+
+    # Interest over k payments follows from the closed-form balance:
+    # sum of interest = k * M - (B0 - B(k)).
+    growth = (1 + monthly_rate) ** months
+    safe_rate = np.where(monthly_rate == 0, 1.0, monthly_rate)
+    end_balance = np.where(
+        monthly_rate == 0,
+        loan_amount - total_payment * months,
+        loan_amount * growth - total_payment * (growth - 1) / safe_rate
+    )
+    total_interest = months * total_payment - (loan_amount - end_balance)
+
+    pmi_required = down < pmi_threshold
+    monthly_pmi = np.where(pmi_required, loan_amount * pmi_rate / 12, 0.0)
+    pmi_months = _solve_months(
+        loan_amount,
+        (1 - pmi_threshold) * purchase_price * np.ones_like(loan_amount),
+        monthly_rate,
+        safe_payment
+    )
+    pmi_months = np.where(pmi_required, np.minimum(pmi_months, months), 0)
+
+    return {
+        'down_payment': down_payment,
+        'loan_amount': loan_amount,
+        'rate': rate,
+        'term_years': term,
+        'extra_payment': extra,
+        'monthly_payment': base_payment,
+        'total_payment': total_payment,
+        'months_to_payoff': months,
+        'years_to_pay': months / 12,
+        'total_interest': total_interest,
+        'tax_savings': loan_amount * rate * tax_rate,
+        'points_cost': loan_amount * points / 100,
+        'monthly_pmi': monthly_pmi,
+        'pmi_months': pmi_months,
+        'total_pmi': monthly_pmi * pmi_months
+    }
+
+
+def flatten_grid(grid: Dict[str, FloatArray]) -> Dict[str, npt.NDArray[np.float64]]:
+    """
+    Flatten a comparison grid into one row per scenario.
+
+    Args:
+        grid: Output of :func:`compare_loans`
+
+    Returns:
+        Dictionary of one-dimensional arrays in down payment, rate, term,
+        extra payment order
+    """
+    return {key: np.ravel(values) for key, values in grid.items()}
@@ -0,0 +1,245 @@
+"""Exact integer-cents amortization.
+
+Balances are carried as integer cents and every period's interest is
+rounded half-up to the cent, the way loan servicers post it to the
+ledger. The last scheduled payment is trued up so the balance lands on
+exactly zero. All arithmetic is integer NumPy arithmetic applied to every
+loan at once; only the month index is iterated.
+"""
+
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core.batch import FloatArray, monthly_payments
+
+IntArray = npt.NDArray[np.int64]
+
+CENTS_PER_DOLLAR = 100
+# Annual rates are held as integers scaled by this factor (1e-8 precision),
+# so 6.125% is carried exactly as 6_125_000.
+RATE_SCALE = 10**8
+# Keeps balance * scaled rate inside int64 with room for the half-up step.
+_MAX_PRODUCT = 2**62
+
+
+def to_cents(amount: npt.ArrayLike) -> IntArray:
+    """
+    Convert dollar amounts to integer cents, rounding half away from zero.
+
+    Args:
+        amount: Dollar amounts
+
+    Returns:
+        Array of integer cents
+
+    Examples:
+        >>> to_cents([1073.645, 0.015, -2.5])
+        array([107365,      2,   -250])
+    """
+    dollars = np.asarray(amount, dtype=np.float64)
+    # Strip binary noise (0.015 * 100 == 1.4999...) before rounding.
+    scaled = np.round(np.abs(dollars) * CENTS_PER_DOLLAR, 6)
+    return (np.sign(dollars) * np.floor(scaled + 0.5)).astype(np.int64)
+
+
+def from_cents(cents: npt.ArrayLike) -> FloatArray:
+    """Convert integer cents back to dollar amounts."""
+    return np.asarray(cents, dtype=np.int64) / CENTS_PER_DOLLAR
+
+
+def _divide_half_up(numerator: IntArray, denominator: int) -> IntArray:
+    """Integer division of non-negative values, rounding half up."""
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def _prepare(
+    principal: npt.ArrayLike,
+    annual_rate: npt.ArrayLike,
+    term_years: npt.ArrayLike
+) -> Tuple[IntArray, IntArray, IntArray, IntArray]:
+    """Return principal cents, scaled rates, payment counts and payment cents."""
+    dollars, rate, years = np.broadcast_arrays(
+        np.asarray(principal, dtype=np.float64),
+        np.asarray(annual_rate, dtype=np.float64),
+        np.asarray(term_years, dtype=np.float64)
+    )
+    principal_cents = to_cents(dollars)
+    payment_cents = to_cents(
+        monthly_payments(from_cents(principal_cents), rate, years)
+    )
+    scaled_rate = np.round(rate * RATE_SCALE).astype(np.int64)
+    if np.any(principal_cents.astype(np.float64) * scaled_rate >= _MAX_PRODUCT):
+        raise ValueError("Loan amount and rate are too large for exact mode")
+    num_payments = np.round(years * 12).astype(np.int64)
+    return principal_cents, scaled_rate, num_payments, payment_cents
+
+
+def _ledger(
+    principal_cents: IntArray,
+    scaled_rate: IntArray,
+    num_payments: IntArray,
+    payment_cents: IntArray,
+    months: IntArray
+) -> Iterator[Tuple[IntArray, IntArray, IntArray, npt.NDArray[np.bool_]]]:
+    """
+    Post payments month by month for every loan at once.
+
+    Yields:
+        Tuples of (interest, amount paid, balance after, final-payment mask)
+        for each month, with zeros for loans that are no longer paying
+    """
+    balance = principal_cents.copy()
+    period_denominator = 12 * RATE_SCALE
+    last_month = int(months.max(initial=0))
+
+    for month in range(1, last_month + 1):
+        active = (month <= months) & (balance > 0)
+        if not active.any():
+            return
+        interest = np.where(
+            active, _divide_half_up(balance * scaled_rate, period_denominator), 0
+        )
+        amount_due = balance + interest
+        final = active & ((month == num_payments) | (amount_due <= payment_cents))
+        paid = np.where(final, amount_due, np.where(active, payment_cents, 0))
+        balance = balance + interest - paid
+        yield interest, paid, balance, final
+
+
+def amortize_cents(
+    principal: npt.ArrayLike,
+    annual_rate: npt.ArrayLike,
+    term_years: npt.ArrayLike,
+    months: Optional[npt.ArrayLike] = None
+) -> Dict[str, IntArray]:
+    """
+    Run the exact servicer ledger for many loans at once.
+
+    Args:
+        principal: Loan amounts in dollars
+        annual_rate: Annual interest rates as decimals
+        term_years: Loan terms in years
+        months: Payments to post on each loan; defaults to the full term.
+            A shorter run leaves the balloon balance outstanding.
+
+    Returns:
+        Dictionary of integer-cent arrays:
+            payment: Scheduled monthly payment
+            final_payment: Trued-up last payment (0 if the loan was not
+                retired within ``months``)
+            balance: Balance outstanding after ``months`` payments
+            total_interest: Interest posted
+            total_paid: Sum of all payments posted
+    """
+    principal_cents, scaled_rate, num_payments, payment_cents = _prepare(
+        principal, annual_rate, term_years
+    )
+    if months is None:
+        run_months = num_payments
+    else:
+        run_months = np.broadcast_to(
+            np.asarray(months, dtype=np.int64), num_payments.shape
+        )
+        if np.any(run_months < 0):
+            raise ValueError("Months must be non-negative")
+
+    total_interest = np.zeros_like(principal_cents)
+    total_paid = np.zeros_like(principal_cents)
+    final_payment = np.zeros_like(principal_cents)
+    balance = principal_cents.copy()
+
+    for interest, paid, balance, final in _ledger(
+        principal_cents, scaled_rate, num_payments, payment_cents, run_months
+    ):
+        total_interest += interest
+        total_paid += paid
+        final_payment = np.where(final, paid, final_payment)
+
+    return {
+        'payment': payment_cents,
+        'final_payment': final_payment,
+        'balance': balance,
+        'total_interest': total_interest,
+        'total_paid': total_paid
+    }
+
+
+def cents_schedule(
+    principal: float,
+    annual_rate: float,
+    term_years: int
+) -> Dict[str, IntArray]:
+    """
+    Build the exact month-by-month ledger for a single loan.
+
+    Args:
+        principal: Loan amount in dollars
+        annual_rate: Annual interest rate as decimal
+        term_years: Loan term in years
+
+    Returns:
+        Dictionary of integer-cent arrays, one entry per payment:
+            payment_number: 1-based payment index
+            payment: Amount paid (the last entry is trued up)
+            interest: Interest posted
+            principal: Principal repaid
+            balance: Balance after the payment
+    """
+    principal_cents, scaled_rate, num_payments, payment_cents = _prepare(
+        [principal], [annual_rate], [term_years]
+    )
+    rows = [
+        (interest[0], paid[0], balance[0])
+        for interest, paid, balance, _ in _ledger(
+            principal_cents, scaled_rate, num_payments, payment_cents,
+            num_payments
+        )
+    ]
+    interest, paid, balance = (
+        np.array(column, dtype=np.int64) for column in zip(*rows)
+    )
+    return {
+        'payment_number': np.arange(1, len(rows) + 1, dtype=np.int64),
+        'payment': paid,
+        'interest': interest,
+        'principal': paid - interest,
+        'balance': balance
+    }
+
+
+def evaluate_loans_exact(
+    principal: npt.ArrayLike,
+    annual_rate: npt.ArrayLike,
+    term_years: npt.ArrayLike,
+    months_elapsed: npt.ArrayLike,
+    balloon_months: Optional[npt.ArrayLike] = None
+) -> Dict[str, FloatArray]:
+    """
+    Exact counterpart of :func:`calculator.core.batch.evaluate_loans`.
+
+    Results are computed in integer cents and returned in dollars, so the
+    values reconcile to the cent with a servicer's ledger.
+
+    Args:
+        principal: Original loan amounts
+        annual_rate: Annual interest rates as decimals
+        term_years: Loan terms in years
+        months_elapsed: Payments already made on each loan
+        balloon_months: Month in which each balloon falls due; defaults to
+            ``months_elapsed``
+
+    Returns:
+        Dictionary of arrays with payment, balance and balloon in dollars
+    """
+    if balloon_months is None:
+        balloon_months = months_elapsed
+
+    elapsed = amortize_cents(principal, annual_rate, term_years, months_elapsed)
+    balloon = amortize_cents(principal, annual_rate, term_years, balloon_months)
+    return {
+        'payment': from_cents(elapsed['payment']),
+        'balance': from_cents(elapsed['balance']),
+        'balloon': from_cents(balloon['balance'])
+    }
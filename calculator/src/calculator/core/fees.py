@@ -0,0 +1,234 @@
+"""Closing cost fee schedules by state and county.
+
+Schedules are read once from a JSON or CSV file into flat NumPy arrays:
+one row per jurisdiction, one column per flat fee or rate, and padded
+bracket tables for tiered title premiums and transfer taxes. County rows
+are stored fully resolved (county over state over the default), so a
+lookup is a single dictionary hit and computing closing costs for a batch
+of properties is array indexing plus a few vectorized sums, with no file
+access or per-property dictionaries.
+
+The bundled ``data/fee_schedules.json`` holds the national default the
+calculator has always used plus a few sample states. Point
+``CALCULATOR_FEE_SCHEDULES`` at a local file to use your own schedules.
+
+JSON layout::
+
+    {
+      "default": {"appraisal": 500, "title_tiers": [[null, 0.005]], ...},
+      "states": {
+        "FL": {"fees": {...}, "counties": {"Miami-Dade": {...}}}
+      }
+    }
+
+CSV layout: one row per jurisdiction with ``state`` and ``county``
+columns (both empty for the default) and one column per field. Empty
+cells inherit, and brackets are written ``upto:rate;upto:rate;:rate``.
+"""
+
+import csv
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+
+DEFAULT_PATH = Path(__file__).parent / 'data' / 'fee_schedules.json'
+
+# Flat fees (dollars) and rates (fractions of the loan or price)
+FIELDS = (
+    'origination_rate', 'appraisal', 'credit_report', 'tax_service', 'flood_cert',
+    'recording', 'title_minimum', 'realtor_rate', 'seller_other_fees',
+)
+# Marginal bracket tables: [[upper limit or None, rate], ...]
+BRACKETS = ('title_tiers', 'transfer_tax_brackets')
+
+Brackets = List[Tuple[Optional[float], float]]
+
+
+def _parse_brackets(value: Union[str, Sequence[Sequence[Any]]]) -> Brackets:
+    """Read brackets from a JSON list or a CSV ``upto:rate;...`` string."""
+    if isinstance(value, str):
+        value = [part.split(':') for part in value.split(';') if part.strip()]
+    brackets = []
+    for limit, rate in value:
+        limit = None if limit in (None, '') else float(limit)
+        brackets.append((limit, float(rate)))
+    if not brackets or brackets[-1][0] is not None:
+        raise ValueError("The last bracket must have no upper limit")
+    return brackets
+
+
+def _key(state: Optional[str], county: Optional[str] = None) -> Tuple[str, str]:
+    return ((state or '').strip().upper(), (county or '').strip().upper())
+
+
+class FeeSchedules:
+    """Resolved fee schedules indexed by (state, county)."""
+
+    def __init__(self, schedules: Mapping[Tuple[str, str], Mapping[str, Any]]):
+        """
+        Args:
+            schedules: Fields for each (state, county) key; ``('', '')``
+                is the default and must define every field, states
+                inherit from it and counties from their state
+
+        Raises:
+            ValueError: If the default is missing a field or a bracket
+                table is malformed
+        """
+        default = schedules.get(('', ''))
+        missing = [name for name in FIELDS + BRACKETS if default is None or name not in default]
+        if missing:
+            raise ValueError(f"Default fee schedule is missing: {', '.join(missing)}")
+
+        resolved: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for key in sorted(schedules, key=lambda key: (key[0] != '', key[1] != '', key)):
+            state, county = _key(*key)
+            parent = (resolved[(state, '')] if county and (state, '') in resolved
+                      else resolved.get(('', ''), {}))
+            resolved[(state, county)] = {**parent, **schedules[key]}
+
+        self.index: Dict[Tuple[str, str], int] = {key: i for i, key in enumerate(resolved)}
+        rows = list(resolved.values())
+        self.fields = {
+            name: np.array([float(row[name]) for row in rows]) for name in FIELDS
+        }
+        self.brackets = {name: self._bracket_arrays([row[name] for row in rows])
+                         for name in BRACKETS}
+
+        # Identifies the resolved schedules whatever file they came from, so
+        # cached closing costs and their ETags change when the fees do
+        content = hashlib.sha256(json.dumps(list(self.index)).encode())
+        arrays = list(self.fields.values())
+        for tables in self.brackets.values():
+            arrays.extend(tables)
+        for array in arrays:
+            content.update(repr(array.shape).encode())
+            content.update(array.tobytes())
+        self.digest = content.hexdigest()
+
+    @staticmethod
+    def _bracket_arrays(tables: Sequence[Any]) -> Tuple[FloatArray, FloatArray, FloatArray]:
+        """Pad bracket tables into (lower, upper, rate) arrays of rows x tiers."""
+        tables = [_parse_brackets(table) for table in tables]
+        width = max(len(table) for table in tables)
+        lower = np.zeros((len(tables), width))
+        upper = np.zeros((len(tables), width))
+        rate = np.zeros((len(tables), width))
+        for row, table in enumerate(tables):
+            floor = 0.0
+            for tier, (limit, tier_rate) in enumerate(table):
+                lower[row, tier] = floor
+                upper[row, tier] = np.inf if limit is None else limit
+                rate[row, tier] = tier_rate
+                floor = upper[row, tier]
+        return lower, upper, rate
+
+    def lookup(self, state: Optional[str] = None, county: Optional[str] = None) -> int:
+        """Row of the most specific schedule for a county, state or the default."""
+        state, county = _key(state, county)
+        index = self.index
+        return index.get((state, county), index.get((state, ''), index[('', '')]))
+
+    def lookup_many(self, records: Iterable[Mapping[str, Any]]) -> npt.NDArray[np.intp]:
+        """Schedule rows for records with optional ``state`` and ``county``."""
+        return np.array([
+            self.lookup(record.get('state'), record.get('county')) for record in records
+        ], dtype=np.intp)
+
+    def get(self, state: Optional[str] = None, county: Optional[str] = None) -> Dict[str, Any]:
+        """Flat fees and rates of one jurisdiction as a dictionary."""
+        row = self.lookup(state, county)
+        return {name: float(values[row]) for name, values in self.fields.items()}
+
+    def _bracketed(self, name: str, amount: FloatArray, rows: npt.NDArray[np.intp]) -> FloatArray:
+        lower, upper, rate = (array[rows] for array in self.brackets[name])
+        taxed = np.clip(amount[..., None] - lower, 0.0, upper - lower)
+        return (taxed * rate).sum(axis=-1)
+
+    def closing_costs(
+        self,
+        purchase_price: npt.ArrayLike,
+        loan_amount: npt.ArrayLike,
+        schedule: npt.ArrayLike = 0
+    ) -> Dict[str, Any]:
+        """
+        Buyer and seller closing costs for many transactions at once.
+
+        Args:
+            purchase_price: Purchase prices
+            loan_amount: Loan amounts
+            schedule: Rows from ``lookup`` for each transaction
+
+        Returns:
+            Dictionary with ``total_closing_costs`` and ``itemized_costs``
+            (buyer) and ``total_seller_costs`` and ``seller_costs``, each
+            an array per transaction
+        """
+        price, loan, rows = np.broadcast_arrays(
+            np.asarray(purchase_price, dtype=np.float64),
+            np.asarray(loan_amount, dtype=np.float64),
+            np.asarray(schedule, dtype=np.intp)
+        )
+        fields = {name: values[rows] for name, values in self.fields.items()}
+
+        itemized = {
+            'loan_origination': loan * fields['origination_rate'],
+            'appraisal': fields['appraisal'],
+            'credit_report': fields['credit_report'],
+            'tax_service': fields['tax_service'],
+            'flood_cert': fields['flood_cert'],
+            'title_insurance': np.maximum(
+                self._bracketed('title_tiers', price, rows), fields['title_minimum']
+            ),
+            'recording': fields['recording']
+        }
+        seller = {
+            'realtor_fees': price * fields['realtor_rate'],
+            'transfer_tax': self._bracketed('transfer_tax_brackets', price, rows),
+            'seller_other_fees': fields['seller_other_fees']
+        }
+        return {
+            'total_closing_costs': sum(itemized.values()),
+            'itemized_costs': itemized,
+            'total_seller_costs': sum(seller.values()),
+            'seller_costs': seller
+        }
+
+
+def load(path: Union[str, Path]) -> FeeSchedules:
+    """
+    Read fee schedules from a JSON or CSV file.
+
+    Raises:
+        ValueError: If the file is malformed or the default is incomplete
+    """
+    path = Path(path)
+    schedules: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    if path.suffix.lower() == '.csv':
+        with open(path, newline='') as source:
+            for row in csv.DictReader(source):
+                key = _key(row.pop('state', ''), row.pop('county', ''))
+                schedules[key] = {name: value for name, value in row.items() if value not in (None, '')}
+    else:
+        with open(path) as source:
+            document = json.load(source)
+        schedules[('', '')] = document['default']
+        for state, entry in document.get('states', {}).items():
+            schedules[_key(state)] = entry.get('fees', {})
+            for county, fees in entry.get('counties', {}).items():
+                schedules[_key(state, county)] = fees
+    return FeeSchedules(schedules)
+
+
+@lru_cache(maxsize=None)
+def fee_schedules() -> FeeSchedules:
+    """The process-wide schedules, loaded on first use."""
+    return load(os.environ.get('CALCULATOR_FEE_SCHEDULES') or DEFAULT_PATH)
@@ -0,0 +1,236 @@
+"""Formula graph with incremental recomputation.
+
+A ``FormulaGraph`` declares each metric as a node with the names it
+depends on. An ``Evaluation`` holds one set of inputs and the cached
+value of every node; changing an input only marks the nodes downstream
+of it stale, and reading a metric recomputes just the stale nodes it
+needs. ``Evaluation.recomputed`` lists what the last read recomputed,
+which is the profile of what an edit cost.
+
+Formulas are NumPy expressions, so the same graph serves one property in
+an interactive session (scalar inputs) and a whole portfolio (one array
+per field). Changing a shared assumption such as the rate for every
+property recomputes the financing branch for all of them at once and
+leaves income and expenses cached.
+"""
+
+from collections import Counter
+from typing import (
+    Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence,
+    Set, Tuple
+)
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core.batch import monthly_payments
+from calculator.core.validation import check
+
+
+class Node(NamedTuple):
+    """A metric computed by ``formula`` from the values of ``inputs``."""
+
+    name: str
+    inputs: Tuple[str, ...]
+    formula: Callable[..., Any]
+
+
+class FormulaGraph:
+    """Immutable set of input fields and the nodes computed from them."""
+
+    def __init__(
+        self,
+        inputs: Mapping[str, float],
+        nodes: Sequence[Node],
+        schema: Optional[str] = None
+    ):
+        """
+        Args:
+            inputs: Input field names and their defaults
+            nodes: Metric nodes, each listed after the nodes it uses
+            schema: ``validation.RULES`` schema that inputs must pass
+
+        Raises:
+            ValueError: If a node uses a name that is not an input or an
+                earlier node, or a name is declared twice
+        """
+        self.defaults = dict(inputs)
+        self.nodes: Dict[str, Node] = {}
+        self.schema = schema
+        self.dependents: Dict[str, List[str]] = {name: [] for name in self.defaults}
+        for node in nodes:
+            if node.name in self.dependents:
+                raise ValueError(f"Duplicate node: {node.name}")
+            for name in node.inputs:
+                if name not in self.dependents:
+                    raise ValueError(f"Node {node.name} uses undefined {name}")
+                self.dependents[name].append(node.name)
+            self.nodes[node.name] = node
+            self.dependents[node.name] = []
+
+    def downstream(self, names: Iterable[str]) -> Set[str]:
+        """Return every node that depends, directly or not, on ``names``."""
+        affected: Set[str] = set()
+        stack = list(names)
+        while stack:
+            for dependent in self.dependents[stack.pop()]:
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+        return affected
+
+    def evaluate(
+        self,
+        inputs: Mapping[str, npt.ArrayLike],
+        names: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """One-off evaluation of ``names`` (default: every node)."""
+        return Evaluation(self, inputs).results(names)
+
+
+class Evaluation:
+    """Inputs and cached node values for one graph."""
+
+    def __init__(self, graph: FormulaGraph, inputs: Optional[Mapping[str, npt.ArrayLike]] = None):
+        self.graph = graph
+        self.values: Dict[str, Any] = {}
+        self.stale: Set[str] = set(graph.nodes)
+        self.recomputed: List[str] = []
+        self.counts: Counter = Counter()
+        self.update({**graph.defaults, **(inputs or {})})
+
+    def update(self, changes: Mapping[str, npt.ArrayLike]) -> Set[str]:
+        """
+        Change some inputs.
+
+        Inputs set to the value they already have are ignored.
+
+        Returns:
+            The nodes made stale by the change
+
+        Raises:
+            KeyError: For a name that is not an input of the graph
+            ValueError: If the new inputs fail the graph's schema; the
+                evaluation keeps its previous inputs
+        """
+        changed = {}
+        for name, value in changes.items():
+            if name not in self.graph.defaults:
+                raise KeyError(f"Unknown input: {name}")
+            value = np.asarray(value, dtype=np.float64)
+            current = self.values.get(name)
+            if current is None or not np.array_equal(current, value):
+                changed[name] = value
+        if not changed:
+            return set()
+
+        if self.graph.schema is not None:
+            current = {
+                name: self.values[name] for name in self.graph.defaults if name in self.values
+            }
+            check(self.graph.schema, {**current, **changed})
+        self.values.update(changed)
+        stale = self.graph.downstream(changed)
+        self.stale |= stale
+        return stale
+
+    def get(self, name: str) -> Any:
+        """Value of an input or node, recomputing stale nodes it needs."""
+        self.recomputed = []
+        return _plain(self._value(name))
+
+    def results(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Values of ``names`` (default: every node) after one refresh."""
+        self.recomputed = []
+        names = list(self.graph.nodes) if names is None else list(names)
+        return {name: _plain(self._value(name)) for name in names}
+
+    def _value(self, name: str) -> Any:
+        if name in self.stale:
+            node = self.graph.nodes[name]
+            self.values[name] = node.formula(*(self._value(arg) for arg in node.inputs))
+            self.stale.discard(name)
+            self.recomputed.append(name)
+            self.counts[name] += 1
+        return self.values[name]
+
+
+def _plain(value: Any) -> Any:
+    """Unwrap 0-d results so scalar sessions get plain floats back."""
+    if np.ndim(value) == 0:
+        return float(value)
+    return value
+
+
+def _percent_of(numerator: npt.ArrayLike, denominator: npt.ArrayLike) -> Any:
+    """``numerator / denominator * 100``, or 0 where the denominator is 0."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator == 0, 0.0, numerator / denominator * 100)
+
+
+# Same formulas and units as ``batch.investment_metrics``: rates and
+# percentages as percentages, expenses annual, income monthly.
+INVESTMENT_GRAPH = FormulaGraph(
+    inputs={
+        'purchase_price': 0.0, 'down_payment': 0.0, 'rate': 0.0, 'loan_term': 30.0,
+        'monthly_rent': 0.0, 'vacancy_rate': 0.0, 'other_income': 0.0,
+        'parking_income': 0.0, 'laundry_income': 0.0, 'property_tax': 0.0,
+        'insurance': 0.0, 'maintenance': 0.0, 'utilities': 0.0, 'mgmt_fee': 0.0,
+    },
+    nodes=[
+        Node('loan_amount', ('purchase_price', 'down_payment'),
+             lambda price, down: price - down),
+        Node('monthly_payment', ('loan_amount', 'rate', 'loan_term'),
+             lambda loan, rate, term: monthly_payments(loan, rate / 100, np.trunc(term))),
+        Node('annual_debt_service', ('monthly_payment',),
+             lambda payment: payment * 12),
+        Node('effective_gross_income',
+             ('monthly_rent', 'vacancy_rate', 'other_income', 'parking_income',
+              'laundry_income'),
+             lambda rent, vacancy, other, parking, laundry: (
+                 rent * 12 * (1 - vacancy / 100) + other + parking + laundry)),
+        Node('management_fee', ('mgmt_fee', 'effective_gross_income'),
+             lambda rate, income: rate / 100 * income),
+        Node('total_expenses',
+             ('property_tax', 'insurance', 'maintenance', 'utilities', 'management_fee'),
+             lambda tax, insurance, maintenance, utilities, management: (
+                 tax + insurance + maintenance + utilities + management)),
+        Node('noi', ('effective_gross_income', 'total_expenses'),
+             lambda income, expenses: income - expenses),
+        Node('annual_cash_flow', ('noi', 'annual_debt_service'),
+             lambda noi, debt_service: noi - debt_service),
+        Node('cap_rate', ('noi', 'purchase_price'), _percent_of),
+        Node('cash_on_cash', ('annual_cash_flow', 'down_payment'), _percent_of),
+    ],
+    schema='investment',
+)
+
+# Keys of ``Calculator.calculate_investment_metrics``
+INVESTMENT_METRICS = (
+    'monthly_payment', 'annual_cash_flow', 'noi', 'cap_rate', 'cash_on_cash',
+    'total_expenses'
+)
+
+
+def investment_evaluation(data: Optional[Mapping[str, npt.ArrayLike]] = None) -> Evaluation:
+    """
+    Start an incremental investment evaluation.
+
+    Args:
+        data: ``Calculator.calculate_investment_metrics`` style fields,
+            scalars or arrays; keys the graph does not use are ignored
+
+    Examples:
+        >>> session = investment_evaluation({
+        ...     'purchase_price': 200000, 'down_payment': 40000, 'rate': 5,
+        ...     'monthly_rent': 2000, 'vacancy_rate': 5,
+        ... })
+        >>> round(session.get('noi'), 2)
+        22800.0
+        >>> sorted(session.update({'rate': 6}))
+        ['annual_cash_flow', 'annual_debt_service', 'cash_on_cash', 'monthly_payment']
+    """
+    fields = INVESTMENT_GRAPH.defaults
+    return Evaluation(INVESTMENT_GRAPH, {
+        name: value for name, value in (data or {}).items() if name in fields
+    })
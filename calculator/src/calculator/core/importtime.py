@@ -0,0 +1,110 @@
+"""Cold-start import time report.
+
+Imports a module in a fresh interpreter with ``-X importtime`` and parses
+the per-module timings Python writes to stderr, so start-up regressions
+show up as numbers rather than as a vague feeling that workers respawn
+slowly.
+
+Usage:
+    python -m calculator.core.importtime calculator.web.app
+    python -m calculator.core.importtime calculator.core.calc --top 15
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import List, NamedTuple, Optional, Sequence
+
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+class ImportRecord(NamedTuple):
+    """Timing of one module import, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse(stderr: str) -> List[ImportRecord]:
+    """
+    Parse ``-X importtime`` output.
+
+    Examples:
+        >>> parse('import time: self [us] | cumulative | imported package\\n'
+        ...       'import time:       120 |        120 |   numpy.version\\n'
+        ...       'import time:      2066 |     141371 | numpy\\n')
+        [ImportRecord(module='numpy.version', self_us=120, cumulative_us=120, depth=1), ImportRecord(module='numpy', self_us=2066, cumulative_us=141371, depth=0)]
+    """
+    records = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(
+                module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2
+            ))
+    return records
+
+
+def measure(module: str, python: str = sys.executable) -> List[ImportRecord]:
+    """
+    Import ``module`` in a fresh interpreter and return its import timings.
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    result = subprocess.run(
+        [python, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return parse(result.stderr)
+
+
+def total_seconds(records: Sequence[ImportRecord], module: str) -> float:
+    """Cumulative import time of ``module`` in seconds."""
+    for record in records:
+        if record.module == module:
+            return record.cumulative_us / 1e6
+    raise KeyError(module)
+
+
+def children(records: Sequence[ImportRecord], module: str) -> List[ImportRecord]:
+    """Modules imported directly by ``module`` (output lists them before it)."""
+    for index, record in enumerate(records):
+        if record.module == module:
+            break
+    else:
+        raise KeyError(module)
+    found = []
+    for child in reversed(records[:index]):
+        if child.depth <= record.depth:
+            break
+        if child.depth == record.depth + 1:
+            found.append(child)
+    return found
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='+', help="Modules to import")
+    parser.add_argument('--top', type=int, default=10,
+                        help="Number of slowest direct imports to list")
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        records = measure(module)
+        print(f"{module}: {total_seconds(records, module) * 1000:.1f} ms")
+        slowest = sorted(children(records, module),
+                         key=lambda record: record.cumulative_us, reverse=True)
+        for record in slowest[:args.top]:
+            print(f"  {record.cumulative_us / 1000:8.1f} ms  {record.module}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Helpers for recalculating as the user types.
+
+``Debouncer`` coalesces a burst of edits into one call once typing pauses,
+and ``line_edits`` turns an old and a new block of text into the few line
+replacements that get from one to the other, so a front end can update
+only what changed instead of redrawing everything.
+"""
+
+import difflib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+LineEdit = Tuple[int, int, List[str]]
+
+
+class Debouncer:
+    """Delay calls until input has been quiet for a while."""
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], Any],
+        cancel: Callable[[Any], None],
+        delay: int = 300
+    ):
+        """
+        Args:
+            schedule: ``schedule(delay_ms, callback)`` returning a handle,
+                e.g. Tk's ``root.after``
+            cancel: Cancels a handle from ``schedule``, e.g. ``after_cancel``
+            delay: Milliseconds of quiet before the call runs
+        """
+        self.schedule = schedule
+        self.cancel_handle = cancel
+        self.delay = delay
+        self._pending: Dict[str, Any] = {}
+
+    def call(self, key: str, fn: Callable[[], None]) -> None:
+        """Run ``fn`` after the delay, replacing any call pending for ``key``."""
+        self.cancel(key)
+
+        def run():
+            self._pending.pop(key, None)
+            fn()
+
+        self._pending[key] = self.schedule(self.delay, run)
+
+    def cancel(self, key: Optional[str] = None) -> None:
+        """Drop the call pending for ``key``, or every call when ``key`` is None."""
+        keys = list(self._pending) if key is None else [key]
+        for name in keys:
+            handle = self._pending.pop(name, None)
+            if handle is not None:
+                self.cancel_handle(handle)
+
+
+def line_edits(old: Sequence[str], new: Sequence[str]) -> List[LineEdit]:
+    """
+    Line replacements that turn ``old`` into ``new``.
+
+    Returns:
+        ``(start, stop, lines)`` edits meaning "replace ``old[start:stop]``
+        with ``lines``", ordered bottom-up so they can be applied one after
+        another without shifting the positions of the rest
+
+    Examples:
+        >>> line_edits(['a', 'b', 'c'], ['a', 'B', 'c', 'd'])
+        [(3, 3, ['d']), (1, 2, ['B'])]
+    """
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    return [
+        (i1, i2, list(new[j1:j2]))
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes())
+        if tag != 'equal'
+    ]
@@ -0,0 +1,146 @@
+"""Multi-year pro forma projections for many properties at once.
+
+Inputs are columnar: every field is an array with one entry per property
+(or a scalar shared by all of them). Outputs are year x property arrays,
+so a whole portfolio is projected with array arithmetic instead of a
+Python loop per property per year. Loan balances come from the
+closed-form amortization math, so equity reflects actual paydown.
+
+Year ``t`` collects a full year of rent and expenses grown ``t - 1``
+times, and values the property at the end of the year.
+"""
+
+from typing import Any, Dict, Mapping
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core.batch import loan_balances, monthly_payments
+from calculator.core.validation import column
+
+MAX_YEARS = 40
+
+DEFAULT_GROWTH: Dict[str, float] = {
+    'appreciation_rate': 3.0,
+    'rent_increase': 2.0,
+    'expense_inflation': 2.0
+}
+
+
+def project_investments(
+    columns: Mapping[str, npt.ArrayLike],
+    years: int = 5
+) -> Dict[str, Any]:
+    """
+    Project a year-by-year pro forma for every property.
+
+    Args:
+        columns: Investment fields as arrays, named as in
+            ``Calculator.calculate_investment_metrics`` (rates and
+            percentages as percentages), plus optional growth fields:
+                appreciation_rate: Annual property appreciation (%)
+                rent_increase: Annual rent and other income growth (%)
+                expense_inflation: Annual growth of fixed expenses (%)
+        years: Number of years to project (1 to ``MAX_YEARS``)
+
+    Returns:
+        Dictionary with ``year`` (1..years) and year x property arrays:
+            property_value: Value at the end of the year
+            gross_rent: Scheduled rent for the year
+            effective_gross_income: Rent after vacancy plus other income
+            operating_expenses: Fixed expenses plus management fee
+            noi: Net operating income
+            debt_service: Loan payments made during the year
+            cash_flow: NOI less debt service
+            cumulative_cash_flow: Cash flow to date
+            loan_balance: Loan balance at the end of the year
+            equity: Property value less loan balance
+            return_on_equity: Cash flow as percentage of equity
+
+    Examples:
+        >>> pro_forma = project_investments({
+        ...     'purchase_price': [200000, 420000],
+        ...     'down_payment': [40000, 50000],
+        ...     'rate': [5, 1.5],
+        ...     'monthly_rent': [2000, 2500],
+        ... }, years=10)
+        >>> pro_forma['equity'].shape
+        (10, 2)
+    """
+    if not 1 <= years <= MAX_YEARS:
+        raise ValueError(f"Years must be between 1 and {MAX_YEARS}")
+
+    price = column(columns, 'purchase_price')
+    down_payment = column(columns, 'down_payment')
+    rate = column(columns, 'rate') / 100
+    loan_term = column(columns, 'loan_term', 30)
+    monthly_rent = column(columns, 'monthly_rent')
+    vacancy_rate = column(columns, 'vacancy_rate') / 100
+    other_income = (
+        column(columns, 'other_income')
+        + column(columns, 'parking_income')
+        + column(columns, 'laundry_income')
+    )
+    fixed_expenses = (
+        column(columns, 'property_tax')
+        + column(columns, 'insurance')
+        + column(columns, 'maintenance')
+        + column(columns, 'utilities')
+    )
+    mgmt_fee_rate = column(columns, 'mgmt_fee') / 100
+    appreciation = column(
+        columns, 'appreciation_rate', DEFAULT_GROWTH['appreciation_rate']
+    ) / 100
+    rent_increase = column(
+        columns, 'rent_increase', DEFAULT_GROWTH['rent_increase']
+    ) / 100
+    expense_inflation = column(
+        columns, 'expense_inflation', DEFAULT_GROWTH['expense_inflation']
+    ) / 100
+
+    if np.any(down_payment > price):
+        raise ValueError("Down payment cannot exceed purchase price")
+
+    year = np.arange(1, years + 1, dtype=np.float64)[:, None]
+    loan_amount = price - down_payment
+    term_months = loan_term * 12
+
+    rent_index = (1 + rent_increase) ** (year - 1)
+    gross_rent = monthly_rent * 12 * rent_index
+    effective_gross_income = (
+        gross_rent * (1 - vacancy_rate) + other_income * rent_index
+    )
+    operating_expenses = (
+        fixed_expenses * (1 + expense_inflation) ** (year - 1)
+        + mgmt_fee_rate * effective_gross_income
+    )
+    noi = effective_gross_income - operating_expenses
+
+    payment = monthly_payments(loan_amount, rate, loan_term)
+    months_paid = np.clip(term_months - 12 * (year - 1), 0, 12)
+    debt_service = payment * months_paid
+    loan_balance = loan_balances(
+        loan_amount, rate, loan_term, np.minimum(12 * year, term_months)
+    )
+
+    property_value = price * (1 + appreciation) ** year
+    cash_flow = noi - debt_service
+    equity = property_value - loan_balance
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return_on_equity = np.where(equity != 0, cash_flow / equity * 100, 0.0)
+
+    shape = np.broadcast_shapes(year.shape, price.shape, cash_flow.shape)
+    return {
+        'year': year[:, 0].astype(int),
+        'property_value': np.broadcast_to(property_value, shape),
+        'gross_rent': np.broadcast_to(gross_rent, shape),
+        'effective_gross_income': np.broadcast_to(effective_gross_income, shape),
+        'operating_expenses': np.broadcast_to(operating_expenses, shape),
+        'noi': np.broadcast_to(noi, shape),
+        'debt_service': np.broadcast_to(debt_service, shape),
+        'cash_flow': np.broadcast_to(cash_flow, shape),
+        'cumulative_cash_flow': np.cumsum(np.broadcast_to(cash_flow, shape), axis=0),
+        'loan_balance': np.broadcast_to(loan_balance, shape),
+        'equity': np.broadcast_to(equity, shape),
+        'return_on_equity': np.broadcast_to(return_on_equity, shape)
+    }
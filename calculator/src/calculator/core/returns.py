@@ -0,0 +1,264 @@
+"""Vectorized investment return measures over many cash-flow series.
+
+Cash flows are laid out as a matrix with one row per investment and one
+column per period, where column 0 is the initial (usually negative)
+outlay. Every row is solved at the same time, so ranking tens of
+thousands of candidate deals costs a few array passes rather than one
+root-finding loop per deal.
+"""
+
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core.batch import FloatArray
+
+# Search interval for the bisection fallback, as periodic rates.
+IRR_LOWER_BOUND = -0.99
+IRR_UPPER_BOUND = 10.0
+
+
+def _as_matrix(cash_flows: npt.ArrayLike) -> FloatArray:
+    """Return cash flows as a 2-D float matrix (rows x periods)."""
+    matrix = np.asarray(cash_flows, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    if matrix.ndim != 2:
+        raise ValueError("Cash flows must be a 1-D series or a 2-D matrix")
+    return matrix
+
+
+def _npv_and_slope(
+    matrix: FloatArray,
+    rate: FloatArray
+) -> Tuple[FloatArray, FloatArray]:
+    """NPV of each row at its own rate, and the derivative with respect to rate."""
+    periods = np.arange(matrix.shape[1], dtype=np.float64)
+    discount = (1 + rate[:, None]) ** -periods
+    npv = np.sum(matrix * discount, axis=1)
+    slope = -np.sum(periods * matrix * discount / (1 + rate[:, None]), axis=1)
+    return npv, slope
+
+
+def _bisect(
+    matrix: FloatArray,
+    tol: float,
+    max_iter: int
+) -> FloatArray:
+    """Bisection over [IRR_LOWER_BOUND, IRR_UPPER_BOUND] for every row."""
+    rows = matrix.shape[0]
+    low = np.full(rows, IRR_LOWER_BOUND)
+    high = np.full(rows, IRR_UPPER_BOUND)
+    npv_low, _ = _npv_and_slope(matrix, low)
+    npv_high, _ = _npv_and_slope(matrix, high)
+    bracketed = np.sign(npv_low) != np.sign(npv_high)
+
+    for _ in range(max_iter):
+        mid = (low + high) / 2
+        npv_mid, _ = _npv_and_slope(matrix, mid)
+        same_side = np.sign(npv_mid) == np.sign(npv_low)
+        low = np.where(same_side, mid, low)
+        npv_low = np.where(same_side, npv_mid, npv_low)
+        high = np.where(same_side, high, mid)
+        if np.all(high - low < tol):
+            break
+
+    return np.where(bracketed, (low + high) / 2, np.nan)
+
+
+def irr(
+    cash_flows: npt.ArrayLike,
+    guess: float = 0.1,
+    tol: float = 1e-10,
+    max_iter: int = 50
+) -> FloatArray:
+    """
+    Solve the internal rate of return of every cash-flow row at once.
+
+    Newton iterations run on all rows together; rows that fail to
+    converge or step outside the valid range are re-solved by bisection.
+    Rows without a sign change in NPV over the search interval get NaN.
+
+    Args:
+        cash_flows: Matrix of cash flows (rows x periods) or a single series
+        guess: Starting periodic rate for Newton iterations
+        tol: Convergence tolerance on the rate
+        max_iter: Maximum Newton iterations
+
+    Returns:
+        Array of periodic IRRs, one per row
+
+    Examples:
+        >>> irr([[-100, 110, 0], [-100, 0, 121]]).round(6)
+        array([0.1, 0.1])
+    """
+    matrix = _as_matrix(cash_flows)
+    rate = np.full(matrix.shape[0], guess)
+    converged = np.zeros(matrix.shape[0], dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(max_iter):
+            npv, slope = _npv_and_slope(matrix, rate)
+            step = np.where(converged, 0.0, npv / slope)
+            rate = rate - step
+            converged |= np.abs(step) < tol
+            invalid = ~np.isfinite(rate) | (rate <= -1)
+            rate = np.where(invalid, guess, rate)
+            converged &= ~invalid
+            if np.all(converged):
+                break
+
+        if not np.all(converged):
+            unsolved = ~converged
+            rate[unsolved] = _bisect(matrix[unsolved], tol, 200)
+
+    return rate
+
+
+def npv(
+    cash_flows: npt.ArrayLike,
+    discount_rates: npt.ArrayLike
+) -> FloatArray:
+    """
+    Calculate net present value of every row at every discount rate.
+
+    Args:
+        cash_flows: Matrix of cash flows (rows x periods) or a single series
+        discount_rates: Periodic discount rate or vector of rates
+
+    Returns:
+        Array shaped (rows, rates); a scalar rate gives shape (rows, 1)
+
+    Examples:
+        >>> npv([[-100, 121]], [0.0, 0.1]).round(6)
+        array([[21., 10.]])
+    """
+    matrix = _as_matrix(cash_flows)
+    rates = np.atleast_1d(np.asarray(discount_rates, dtype=np.float64))
+    if np.any(rates <= -1):
+        raise ValueError("Discount rates must be greater than -100%")
+    periods = np.arange(matrix.shape[1], dtype=np.float64)
+    discount = (1 + rates[:, None]) ** -periods
+    return matrix @ discount.T
+
+
+def equity_multiple(cash_flows: npt.ArrayLike) -> FloatArray:
+    """
+    Calculate total distributions divided by total contributions per row.
+
+    Args:
+        cash_flows: Matrix of cash flows (rows x periods) or a single series
+
+    Returns:
+        Array of equity multiples; rows with no contributions get NaN
+
+    Examples:
+        >>> equity_multiple([[-100, 10, 10, 130]])
+        array([1.5])
+    """
+    matrix = _as_matrix(cash_flows)
+    contributions = -np.sum(np.minimum(matrix, 0), axis=1)
+    distributions = np.sum(np.maximum(matrix, 0), axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(contributions > 0, distributions / contributions, np.nan)
+
+
+def investment_cash_flows(
+    metrics: Sequence[Mapping[str, Any]],
+    equity_invested: npt.ArrayLike,
+    sale_proceeds: npt.ArrayLike,
+    years: int
+) -> FloatArray:
+    """
+    Build cash-flow rows from ``calculate_investment_metrics`` results.
+
+    Each deal is held for ``years`` years at its constant annual cash flow
+    and sold at the end for ``sale_proceeds`` (net of the loan payoff).
+
+    Args:
+        metrics: One ``Calculator.calculate_investment_metrics`` result per
+            deal
+        equity_invested: Initial cash invested per deal (e.g. down payment)
+        sale_proceeds: Net sale proceeds per deal at the end of the hold
+        years: Holding period in years
+
+    Returns:
+        Matrix shaped (deals, years + 1)
+    """
+    if years <= 0:
+        raise ValueError("Holding period must be positive")
+    annual = np.array(
+        [float(m['annual_cash_flow']) for m in metrics], dtype=np.float64
+    )
+    flows = np.empty((len(annual), years + 1))
+    flows[:, 0] = -np.broadcast_to(
+        np.asarray(equity_invested, dtype=np.float64), annual.shape
+    )
+    flows[:, 1:] = annual[:, None]
+    flows[:, -1] += np.broadcast_to(
+        np.asarray(sale_proceeds, dtype=np.float64), annual.shape
+    )
+    return flows
+
+
+def pro_forma_cash_flows(
+    pro_forma: Mapping[str, Any],
+    equity_invested: npt.ArrayLike,
+    selling_costs: float = 6.0
+) -> FloatArray:
+    """
+    Build cash-flow rows from a ``project_investments`` pro forma.
+
+    The property is sold at the end of the last projected year at its
+    projected value less selling costs and the remaining loan balance.
+
+    Args:
+        pro_forma: Output of ``calculator.core.projection.project_investments``
+        equity_invested: Initial cash invested per property
+        selling_costs: Cost of sale as percentage of the sale price
+
+    Returns:
+        Matrix shaped (properties, years + 1)
+    """
+    cash_flow = np.asarray(pro_forma['cash_flow'], dtype=np.float64).T
+    sale = (
+        np.asarray(pro_forma['property_value'])[-1] * (1 - selling_costs / 100)
+        - np.asarray(pro_forma['loan_balance'])[-1]
+    )
+    flows = np.empty((cash_flow.shape[0], cash_flow.shape[1] + 1))
+    flows[:, 0] = -np.broadcast_to(
+        np.asarray(equity_invested, dtype=np.float64), cash_flow.shape[0]
+    )
+    flows[:, 1:] = cash_flow
+    flows[:, -1] += sale
+    return flows
+
+
+def evaluate_returns(
+    cash_flows: npt.ArrayLike,
+    discount_rates: npt.ArrayLike = 0.08
+) -> Dict[str, FloatArray]:
+    """
+    Calculate IRR, NPV and equity multiple for every cash-flow row.
+
+    Args:
+        cash_flows: Matrix of cash flows (rows x periods) or a single series
+        discount_rates: Periodic discount rate or vector of rates for NPV
+
+    Returns:
+        Dictionary containing:
+            irr: IRR per row (periodic, as decimal)
+            npv: NPV per row and discount rate
+            equity_multiple: Equity multiple per row
+            rank: Row indices ordered from highest to lowest IRR, with
+                unsolvable rows last
+    """
+    matrix = _as_matrix(cash_flows)
+    rates = irr(matrix)
+    return {
+        'irr': rates,
+        'npv': npv(matrix, discount_rates),
+        'equity_multiple': equity_multiple(matrix),
+        'rank': np.argsort(np.where(np.isnan(rates), np.inf, -rates), kind='stable')
+    }
@@ -1,5 +1,104 @@
+"""Risk scoring for creative financing strategies.
+
+Every risk factor is scored from 0 (low) to 1 (high). Legal and
+operational factors come from per-strategy tables. Capital, cash flow,
+leverage and liquidity are computed from the deal itself (cash-on-cash,
+DSCR, LTV and cash flow margin from ``batch.investment_metrics``), and
+each strategy's exposure to them is another table row.
+
+The tables become matrices once, when the analyzer is created, so scoring
+P properties against S strategies is a few array operations producing an
+S x P x factor array rather than S x P rounds of dictionary building.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from calculator.core.batch import investment_metrics
+
+STRATEGIES = ('master-lease', 'subject-to', 'wrap', 'lease-option')
+
+# Factors of each risk category, in scoring order
+CATEGORIES = {
+    'legal': ('documentation', 'compliance', 'enforceability'),
+    'financial': ('capital', 'cashflow', 'leverage'),
+    'market': ('valuation', 'liquidity', 'competition'),
+    'operational': ('management', 'maintenance', 'tenant'),
+}
+FACTORS = tuple(factor for factors in CATEGORIES.values() for factor in factors)
+
+# Factors scored from the deal's numbers rather than the strategy alone
+DEAL_FACTORS = ('capital', 'cashflow', 'leverage', 'liquidity')
+
+NEUTRAL = 0.5
+
+# Strategy-only factor scores; factors not listed are NEUTRAL
+STRATEGY_SCORES = {
+    'documentation': {
+        'master-lease': 0.7, 'subject-to': 0.8, 'wrap': 0.9, 'lease-option': 0.6
+    },
+    'compliance': {
+        'master-lease': 0.6, 'subject-to': 0.8, 'wrap': 0.7, 'lease-option': 0.5
+    },
+}
+
+# How far each strategy's deal factors move from NEUTRAL toward the score
+# the deal's numbers earn: 1 means the investor carries that risk fully.
+# Subject-to and wrap buyers carry the existing loan; master-lease and
+# lease-option operators mostly carry the rent roll.
+DEAL_EXPOSURE = {
+    'master-lease': {'capital': 0.5, 'cashflow': 1.0, 'leverage': 0.3, 'liquidity': 0.7},
+    'subject-to': {'capital': 0.7, 'cashflow': 1.0, 'leverage': 1.0, 'liquidity': 1.0},
+    'wrap': {'capital': 0.6, 'cashflow': 0.8, 'leverage': 1.0, 'liquidity': 0.8},
+    'lease-option': {'capital': 0.4, 'cashflow': 0.7, 'leverage': 0.2, 'liquidity': 0.5},
+}
+
+# Deal numbers at which a factor reaches low (0) and high (1) risk
+THRESHOLDS = {
+    'leverage': (0.5, 1.0),       # loan-to-value
+    'cashflow': (1.5, 1.0),       # debt service coverage ratio
+    'capital': (12.0, 0.0),       # cash-on-cash return, percent
+    'liquidity': (0.25, 0.0),     # annual cash flow / effective gross income
+}
+
+# Average score at or above which a risk is medium, and high
+LEVELS = (0.4, 0.7)
+
+# Fields accepted for each property, with their defaults
+PROPERTY_FIELDS = {
+    'purchase_price': 0.0, 'down_payment': 0.0, 'rate': 0.0, 'loan_term': 30.0,
+    'monthly_rent': 0.0, 'vacancy_rate': 0.0, 'other_income': 0.0,
+    'parking_income': 0.0, 'laundry_income': 0.0, 'property_tax': 0.0,
+    'insurance': 0.0, 'maintenance': 0.0, 'utilities': 0.0, 'mgmt_fee': 0.0,
+}
+
+
+def _scale(value: npt.NDArray[np.float64], low: float, high: float) -> npt.NDArray[np.float64]:
+    """Map ``value`` linearly from ``low`` (0) to ``high`` (1), clipped."""
+    with np.errstate(invalid='ignore'):
+        return np.nan_to_num(np.clip((value - low) / (high - low), 0.0, 1.0), nan=1.0)
+
+
+def property_columns(properties: Sequence[Mapping[str, Any]]) -> Dict[str, npt.NDArray[np.float64]]:
+    """Turn property dictionaries into the column mapping the analyzer scores."""
+    return {
+        name: np.array([
+            float(data.get(name) if data.get(name) not in (None, '') else default)
+            for data in properties
+        ], dtype=np.float64)
+        for name, default in PROPERTY_FIELDS.items()
+    }
+
+
 class RiskAnalyzer:
-    def __init__(self):
+    def __init__(self, risk_weights: Optional[Mapping[str, float]] = None):
+        """
+        Args:
+            risk_weights: Weight of each factor within its category;
+                weights are normalized per category
+        """
         self.risk_weights = {
             'documentation': 0.3,
             'compliance': 0.4,
@@ -14,113 +113,176 @@ class RiskAnalyzer:
             'maintenance': 0.3,
             'tenant': 0.4
         }
+        self.risk_weights.update(risk_weights or {})
 
-    def get_risk_score(self, risk):
-        """Convert risk level to score."""
-        if isinstance(risk, (int, float)):
-            return risk
-        risk_scores = {'low': 0.3, 'medium': 0.6, 'high': 0.9}
-        return risk_scores.get(risk, 0.5)
+        # Strategy x factor baselines and exposures
+        self.base = np.full((len(STRATEGIES), len(FACTORS)), NEUTRAL)
+        self.exposure = np.zeros((len(STRATEGIES), len(FACTORS)))
+        for s, strategy in enumerate(STRATEGIES):
+            for f, factor in enumerate(FACTORS):
+                self.base[s, f] = STRATEGY_SCORES.get(factor, {}).get(strategy, NEUTRAL)
+                self.exposure[s, f] = DEAL_EXPOSURE[strategy].get(factor, 0.0)
+
+        # Factor x category weights, each category's column summing to 1
+        self.weights = np.zeros((len(FACTORS), len(CATEGORIES)))
+        for c, factors in enumerate(CATEGORIES.values()):
+            total = sum(self.risk_weights[factor] for factor in factors)
+            for factor in factors:
+                self.weights[FACTORS.index(factor), c] = self.risk_weights[factor] / total
 
-    def assess_compliance_requirements(self, strategy):
-        """Assess compliance requirements."""
-        compliance_levels = {
-            'master-lease': 0.6,
-            'subject-to': 0.8,
-            'wrap': 0.7,
-            'lease-option': 0.5
+    def deal_metrics(self, columns: Mapping[str, npt.ArrayLike]) -> Dict[str, npt.NDArray[np.float64]]:
+        """
+        LTV, DSCR, cash-on-cash and cash flow margin for each property.
+
+        Raises:
+            ValueError: If any property fails the investment input checks
+        """
+        metrics = investment_metrics(columns)
+        price = np.asarray(columns.get('purchase_price', 0.0), dtype=np.float64)
+        down_payment = np.asarray(columns.get('down_payment', 0.0), dtype=np.float64)
+        debt_service = metrics['monthly_payment'] * 12
+        income = metrics['noi'] + metrics['total_expenses']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ltv = np.where(price > 0, (price - down_payment) / price, 0.0)
+            dscr = np.where(debt_service > 0, metrics['noi'] / debt_service, np.inf)
+            margin = np.where(income > 0, metrics['annual_cash_flow'] / income, -np.inf)
+        return {
+            'ltv': ltv,
+            'dscr': dscr,
+            'cash_on_cash': metrics['cash_on_cash'],
+            'cash_flow_margin': margin,
         }
-        return compliance_levels.get(strategy, 0.5)
 
-    def assess_enforceability(self, strategy, data):
-        """Assess enforceability of the strategy."""
-        return 0.5  # Default medium risk
+    def score(
+        self,
+        columns: Mapping[str, npt.ArrayLike],
+        strategies: Sequence[str] = STRATEGIES
+    ) -> Dict[str, Any]:
+        """
+        Score every property under every strategy in one pass.
 
-    def assess_capital_requirements(self, strategy, data):
-        """Assess capital requirements."""
-        return 0.5  # Default medium risk
+        Args:
+            columns: Investment fields, one array (or scalar) per field
+            strategies: Strategies to score, from ``STRATEGIES``
 
-    def assess_cashflow_risk(self, strategy, data):
-        """Assess cashflow risk."""
-        return 0.5  # Default medium risk
+        Returns:
+            Dictionary with ``metrics`` (arrays of P), ``factors``
+            (S x P x factor), ``categories`` (S x P x category) and
+            ``overall`` (S x P) scores
 
-    def assess_leverage_risk(self, strategy, data):
-        """Assess leverage risk."""
-        return 0.5  # Default medium risk
+        Raises:
+            ValueError: For an unknown strategy or invalid property data
+        """
+        unknown = set(strategies) - set(STRATEGIES)
+        if unknown:
+            raise ValueError(f"Unknown strategy: {', '.join(sorted(unknown))}")
+        rows = [STRATEGIES.index(strategy) for strategy in strategies]
 
-    def assess_valuation_risk(self, strategy, data):
-        """Assess valuation risk."""
-        return 0.5  # Default medium risk
+        metrics = self.deal_metrics(columns)
+        price = np.atleast_1d(np.asarray(columns.get('purchase_price', 0.0), dtype=np.float64))
+        has_deal = price > 0
+        deal = np.full((len(price), len(FACTORS)), NEUTRAL)
+        for factor, metric in (('leverage', 'ltv'), ('cashflow', 'dscr'),
+                               ('capital', 'cash_on_cash'), ('liquidity', 'cash_flow_margin')):
+            deal[:, FACTORS.index(factor)] = np.where(
+                has_deal, _scale(np.atleast_1d(metrics[metric]), *THRESHOLDS[factor]), NEUTRAL
+            )
+        # No capital is at risk without a down payment
+        no_capital = np.atleast_1d(np.asarray(columns.get('down_payment', 0.0))) <= 0
+        deal[has_deal & no_capital, FACTORS.index('capital')] = 0.0
 
-    def assess_liquidity_risk(self, strategy, data):
-        """Assess liquidity risk."""
-        return 0.5  # Default medium risk
+        base = self.base[rows][:, None, :]
+        exposure = self.exposure[rows][:, None, :]
+        factors = base + exposure * (deal[None, :, :] - NEUTRAL)
+        categories = factors @ self.weights
+        return {
+            'metrics': metrics,
+            'factors': factors,
+            'categories': categories,
+            'overall': categories.mean(axis=-1),
+        }
 
-    def assess_competition_risk(self, strategy, data):
-        """Assess competition risk."""
-        return 0.5  # Default medium risk
+    def compare_strategies(
+        self,
+        properties: Sequence[Mapping[str, Any]],
+        strategies: Sequence[str] = STRATEGIES
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank strategies from lowest to highest overall risk for each property.
 
-    def assess_management_risk(self, strategy, data):
-        """Assess management risk."""
-        return 0.5  # Default medium risk
+        Returns:
+            One dictionary per property with its deal ``metrics`` and a
+            ``ranking`` of strategies, each with its overall ``score``
+            and ``level`` and per-category scores and levels
+        """
+        result = self.score(property_columns(properties), strategies)
+        overall = result['overall']
+        categories = result['categories']
+        levels = risk_levels(categories)
+        overall_levels = risk_levels(overall)
 
-    def assess_maintenance_risk(self, strategy, data):
-        """Assess maintenance risk."""
-        return 0.5  # Default medium risk
+        comparisons = []
+        for p in range(len(properties)):
+            ranking = []
+            for s in np.argsort(overall[:, p], kind='stable'):
+                ranking.append({
+                    'strategy': strategies[s],
+                    'score': round(float(overall[s, p]), 4),
+                    'level': str(overall_levels[s, p]),
+                    'categories': {
+                        category: {
+                            'score': round(float(categories[s, p, c]), 4),
+                            'level': str(levels[s, p, c])
+                        }
+                        for c, category in enumerate(CATEGORIES)
+                    }
+                })
+            comparisons.append({
+                'metrics': {
+                    name: _json_number(values[p]) for name, values in result['metrics'].items()
+                },
+                'ranking': ranking
+            })
+        return comparisons
 
-    def assess_tenant_risk(self, strategy, data):
-        """Assess tenant risk."""
-        return 0.5  # Default medium risk
+    def get_risk_score(self, risk):
+        """Convert risk level to score."""
+        if isinstance(risk, (int, float)):
+            return risk
+        risk_scores = {'low': 0.3, 'medium': 0.6, 'high': 0.9}
+        return risk_scores.get(risk, 0.5)
 
     def analyze_legal_risks(self, strategy, data):
-        risks = {
-            'documentation': self.assess_documentation_complexity(strategy),
-            'compliance': self.assess_compliance_requirements(strategy),
-            'enforceability': self.assess_enforceability(strategy, data)
-        }
-        return self.calculate_risk_level(risks)
-    
+        return self._category_level('legal', strategy, data)
+
     def analyze_financial_risks(self, strategy, data):
-        risks = {
-            'capital': self.assess_capital_requirements(strategy, data),
-            'cashflow': self.assess_cashflow_risk(strategy, data),
-            'leverage': self.assess_leverage_risk(strategy, data)
-        }
-        return self.calculate_risk_level(risks)
-    
+        return self._category_level('financial', strategy, data)
+
     def analyze_market_risks(self, strategy, data):
-        risks = {
-            'valuation': self.assess_valuation_risk(strategy, data),
-            'liquidity': self.assess_liquidity_risk(strategy, data),
-            'competition': self.assess_competition_risk(strategy, data)
-        }
-        return self.calculate_risk_level(risks)
-    
+        return self._category_level('market', strategy, data)
+
     def analyze_operational_risks(self, strategy, data):
-        risks = {
-            'management': self.assess_management_risk(strategy, data),
-            'maintenance': self.assess_maintenance_risk(strategy, data),
-            'tenant': self.assess_tenant_risk(strategy, data)
-        }
-        return self.calculate_risk_level(risks)
+        return self._category_level('operational', strategy, data)
 
     def calculate_risk_level(self, risks):
-        risk_scores = [self.get_risk_score(risk) for risk in risks.values()]
-        avg_score = sum(risk_scores) / len(risk_scores)
-        
-        if avg_score >= 0.7:
-            return 'high'
-        elif avg_score >= 0.4:
-            return 'medium'
-        return 'low'
-
-    def assess_documentation_complexity(self, strategy):
-        complexity_scores = {
-            'master-lease': 0.7,
-            'subject-to': 0.8,
-            'wrap': 0.9,
-            'lease-option': 0.6
-        }
-        return complexity_scores.get(strategy, 0.5)
-    
-    # Add more risk assessment methods... 
\ No newline at end of file
+        """Level of the weighted average of factor risks (scores or levels)."""
+        weights = [self.risk_weights.get(name, 1.0) for name in risks]
+        scores = [self.get_risk_score(risk) for risk in risks.values()]
+        return str(risk_levels(np.average(scores, weights=weights)))
+
+    def _category_level(self, category, strategy, data):
+        result = self.score(property_columns([data or {}]), [strategy])
+        c = list(CATEGORIES).index(category)
+        return str(risk_levels(result['categories'][0, 0, c]))
+
+
+def risk_levels(scores: npt.ArrayLike) -> npt.NDArray[np.str_]:
+    """Map scores to 'low', 'medium' or 'high'."""
+    scores = np.asarray(scores)
+    medium, high = LEVELS
+    return np.select([scores >= high, scores >= medium], ['high', 'medium'], 'low')
+
+
+def _json_number(value: float) -> Optional[float]:
+    """Round a metric for JSON; infinities (e.g. no debt) become None."""
+    return round(float(value), 4) if np.isfinite(value) else None
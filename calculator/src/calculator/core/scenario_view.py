@@ -0,0 +1,95 @@
+"""Filter, sort and window model behind the scenario comparison view.
+
+The view keeps an index of the visible rows rather than copies of them,
+so filtering or sorting tens of thousands of scenarios is a pass over a
+list of integers, and a screen's worth of rows is a slice of it. Typing
+more characters into the filter only rescans the rows that matched the
+shorter text.
+"""
+
+from numbers import Real
+from typing import Any, Collection, Dict, List, Optional, Sequence
+
+
+class ScenarioTable:
+    """Sortable, filterable row model for a virtualized table widget."""
+
+    def __init__(self, rows: Sequence[Dict[str, Any]]):
+        """
+        Args:
+            rows: One dictionary per scenario with at least ``id`` and
+                ``name``; every other key is a sortable column
+        """
+        self.rows = list(rows)
+        self._names = [str(row.get('name', '')).casefold() for row in self.rows]
+        self.filter_text = ''
+        self.only: Optional[Collection[str]] = None
+        self.sort_column: Optional[str] = None
+        self.descending = False
+        self._order = list(range(len(self.rows)))
+        self.view = list(self._order)
+        # Rows examined by filtering, a measure of the work done
+        self.scanned = 0
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def set_filter(self, text: str) -> None:
+        """Show only rows whose name contains ``text`` (case-insensitive)."""
+        text = text.strip().casefold()
+        if text == self.filter_text:
+            return
+        narrowing = self.filter_text in text
+        self.filter_text = text
+        if narrowing:
+            self.scanned += len(self.view)
+            self.view = [i for i in self.view if text in self._names[i]]
+        else:
+            self._refilter()
+
+    def set_only(self, ids: Optional[Collection[str]]) -> None:
+        """Restrict the view to the given scenario IDs; ``None`` shows all."""
+        self.only = None if ids is None else set(ids)
+        self._refilter()
+
+    def sort(self, column: str, descending: Optional[bool] = None) -> None:
+        """
+        Sort by a column.
+
+        Sorting the current column again without ``descending`` reverses
+        it. Rows with no numeric value in the column go last either way.
+        """
+        if descending is None:
+            descending = column == self.sort_column and not self.descending
+        self.sort_column = column
+        self.descending = descending
+
+        if column == 'name':
+            self._order = sorted(range(len(self.rows)),
+                                 key=self._names.__getitem__, reverse=descending)
+        else:
+            present = []
+            missing = []
+            for i, row in enumerate(self.rows):
+                value = row.get(column)
+                if isinstance(value, Real) and not isinstance(value, bool):
+                    present.append(i)
+                else:
+                    missing.append(i)
+            present.sort(key=lambda i: self.rows[i][column], reverse=descending)
+            self._order = present + missing
+        self._refilter()
+
+    def window(self, offset: int, count: int) -> List[Dict[str, Any]]:
+        """Return up to ``count`` visible rows starting at ``offset``."""
+        return [self.rows[i] for i in self.view[offset:offset + count]]
+
+    def _refilter(self) -> None:
+        """Rebuild the view from the sort order and the active filters."""
+        text = self.filter_text
+        self.scanned += len(self._order)
+        self.view = [
+            i for i in self._order
+            if text in self._names[i]
+            and (self.only is None or self.rows[i]['id'] in self.only)
+        ]
@@ -0,0 +1,478 @@
+"""SQLite storage for saved calculation scenarios.
+
+Each scenario is one row, so saving or deleting touches a single row in
+its own transaction instead of rewriting every scenario. Name, creation
+time and calculation type are indexed columns, which lets listing and
+search run as queries that never decode the stored scenario data.
+
+On first use an existing ``scenarios.json`` (the format the Tk
+application used to write) is imported in one transaction.
+
+Computed outputs are stored next to each scenario's inputs, tagged with
+the ``ENGINE_VERSION`` that produced them and a hash of the inputs. They
+are only recomputed when that version changes, when outputs were never
+computed (imported scenarios), or when a caller asks for a metric the
+stored outputs lack.
+"""
+
+import json
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Union
+
+from calculator.core.cache import cache_key
+from calculator.core.calc import ENGINE_VERSION, Calculator
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    calc_type TEXT,
+    data TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    last_modified TEXT NOT NULL,
+    outputs TEXT,
+    engine_version TEXT,
+    input_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_name ON scenarios (name);
+CREATE INDEX IF NOT EXISTS idx_scenarios_created_at ON scenarios (created_at);
+CREATE INDEX IF NOT EXISTS idx_scenarios_calc_type ON scenarios (calc_type, created_at);
+CREATE INDEX IF NOT EXISTS idx_scenarios_engine_version ON scenarios (engine_version);
+"""
+
+# Upgrades a version 1 database, which had no stored outputs.
+_MIGRATE_V2 = """
+ALTER TABLE scenarios ADD COLUMN outputs TEXT;
+ALTER TABLE scenarios ADD COLUMN engine_version TEXT;
+ALTER TABLE scenarios ADD COLUMN input_hash TEXT;
+CREATE INDEX IF NOT EXISTS idx_scenarios_engine_version ON scenarios (engine_version);
+"""
+
+_COLUMNS = 'id, name, calc_type, data, created_at, last_modified'
+
+# Columns returned by list queries; scenario data is left undecoded.
+_SUMMARY_COLUMNS = ('id', 'name', 'calc_type', 'created_at', 'last_modified')
+_ORDER_COLUMNS = ('name', 'created_at', 'last_modified', 'calc_type')
+
+PathLike = Union[str, Path]
+
+
+def _seller_financing_outputs(data: Dict[str, Any]) -> Dict[str, Any]:
+    results = Calculator.calculate_seller_financing(data)
+    return {
+        **results['new_financing'],
+        'current_balance': results['current_mortgage']['current_balance']
+    }
+
+
+def _closing_costs_outputs(data: Dict[str, Any]) -> Dict[str, Any]:
+    results = Calculator.calculate_closing_costs(data)
+    return {
+        'total_closing_costs': results['total_closing_costs'],
+        **results['itemized_costs'],
+        'total_seller_costs': results['total_seller_costs'],
+        **results['seller_costs']
+    }
+
+
+# Flat output metrics for each calculation type that can be recomputed.
+OUTPUTS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    'seller_financing': _seller_financing_outputs,
+    'investment': Calculator.calculate_investment_metrics,
+    'closing_costs': _closing_costs_outputs
+}
+
+# Metrics each type's outputs contain; callers may ask for any key, but
+# only a missing one of these makes stored outputs stale.
+OUTPUT_METRICS: Dict[str, FrozenSet[str]] = {
+    'seller_financing': frozenset({
+        'loan_amount', 'monthly_payment', 'balloon_months', 'total_payments',
+        'total_principal', 'total_interest', 'balloon_payment', 'total_cost',
+        'current_balance'
+    }),
+    'investment': frozenset({
+        'monthly_payment', 'annual_cash_flow', 'noi', 'cap_rate', 'cash_on_cash',
+        'total_expenses'
+    }),
+    'closing_costs': frozenset({
+        'total_closing_costs', 'loan_origination', 'appraisal', 'credit_report',
+        'tax_service', 'flood_cert', 'title_insurance', 'recording',
+        'total_seller_costs', 'realtor_fees', 'transfer_tax', 'seller_other_fees'
+    })
+}
+
+
+def compute_outputs(calc_type: Optional[str], data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the stored outputs for a scenario.
+
+    Returns:
+        Flat dictionary of metrics; ``{'error': message}`` if the inputs
+        are rejected, or empty if the type has no engine
+    """
+    compute = OUTPUTS.get(calc_type)
+    if compute is None:
+        return {}
+    try:
+        return compute(data)
+    except (TypeError, ValueError) as e:
+        return {'error': str(e)}
+
+
+def input_hash(calc_type: Optional[str], data: Dict[str, Any]) -> str:
+    """Hash a scenario's inputs so equivalent inputs share one digest."""
+    return cache_key({**data, 'type': calc_type})[1]
+
+
+class ScenarioManager:
+    """Saved scenario store backed by a SQLite database."""
+
+    def __init__(
+        self,
+        db_path: PathLike = 'scenarios.db',
+        json_path: Optional[PathLike] = 'scenarios.json'
+    ):
+        """
+        Open (and if needed create) the scenario database.
+
+        Args:
+            db_path: SQLite database file, or ``':memory:'``
+            json_path: Legacy JSON file imported the first time the
+                database is created; ``None`` to skip the import
+        """
+        self.db_path = str(db_path)
+        self.scenarios_file = json_path
+        self.connection = sqlite3.connect(self.db_path, timeout=10)
+        self.connection.row_factory = sqlite3.Row
+        self.load_scenarios()
+
+    def load_scenarios(self) -> None:
+        """Create the schema and import legacy JSON on first run."""
+        if self.db_path != ':memory:':
+            self.connection.execute('PRAGMA journal_mode=WAL')
+        with self.connection:
+            version = self.connection.execute('PRAGMA user_version').fetchone()[0]
+            if version == 0:
+                self.connection.executescript(_SCHEMA)
+                self._import_json()
+            elif version == 1:
+                self.connection.executescript(_MIGRATE_V2)
+            if version < SCHEMA_VERSION:
+                self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _import_json(self) -> None:
+        """Copy scenarios from the legacy JSON file, if there is one."""
+        if self.scenarios_file is None:
+            return
+        try:
+            with open(self.scenarios_file, 'r') as f:
+                scenarios = json.load(f)
+        except FileNotFoundError:
+            return
+
+        self.connection.executemany(
+            f'INSERT OR IGNORE INTO scenarios ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                (
+                    scenario_id,
+                    scenario['name'],
+                    scenario['data'].get('type'),
+                    json.dumps(scenario['data']),
+                    scenario.get('created_at', ''),
+                    scenario.get('last_modified', scenario.get('created_at', ''))
+                )
+                for scenario_id, scenario in scenarios.items()
+            )
+        )
+
+    def add_scenario(
+        self,
+        name: str,
+        data: dict,
+        calc_type: Optional[str] = None
+    ) -> str:
+        """
+        Save a scenario together with its computed outputs.
+
+        Args:
+            name: Display name
+            data: Scenario inputs
+            calc_type: Calculation type; defaults to ``data['type']``
+
+        Returns:
+            The new scenario's ID
+        """
+        scenario_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+        calc_type = calc_type or data.get('type')
+        with self.connection:
+            self.connection.execute(
+                'INSERT INTO scenarios VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (scenario_id, name, calc_type, json.dumps(data), now, now,
+                 json.dumps(compute_outputs(calc_type, data)), ENGINE_VERSION,
+                 input_hash(calc_type, data))
+            )
+        return scenario_id
+
+    def get_scenario(self, scenario_id: str) -> Optional[dict]:
+        """Return one scenario, or ``None`` if it does not exist."""
+        row = self.connection.execute(
+            'SELECT * FROM scenarios WHERE id = ?', (scenario_id,)
+        ).fetchone()
+        return None if row is None else self._scenario(row)
+
+    def get_scenarios(self, scenario_ids: Iterable[str]) -> Dict[str, dict]:
+        """Return the requested scenarios keyed by ID, in one query."""
+        ids = list(scenario_ids)
+        if not ids:
+            return {}
+        rows = self.connection.execute(
+            f'SELECT * FROM scenarios WHERE id IN ({", ".join("?" * len(ids))})',
+            ids
+        )
+        found = {row['id']: self._scenario(row) for row in rows}
+        return {scenario_id: found[scenario_id] for scenario_id in ids
+                if scenario_id in found}
+
+    def delete_scenario(self, scenario_id: str) -> None:
+        """Delete a scenario; unknown IDs are ignored."""
+        with self.connection:
+            self.connection.execute(
+                'DELETE FROM scenarios WHERE id = ?', (scenario_id,)
+            )
+
+    def get_all_scenarios(self) -> dict:
+        """
+        Return every scenario keyed by ID, oldest first.
+
+        This decodes all stored data; prefer ``list_scenarios`` when only
+        names and metadata are needed.
+        """
+        rows = self.connection.execute(
+            'SELECT * FROM scenarios ORDER BY created_at'
+        )
+        return {row['id']: self._scenario(row) for row in rows}
+
+    def list_scenarios(
+        self,
+        search: Optional[str] = None,
+        calc_type: Optional[str] = None,
+        order_by: str = 'created_at',
+        descending: bool = False,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        List scenario metadata without loading scenario data.
+
+        Args:
+            search: Case-insensitive substring the name must contain
+            calc_type: Only scenarios of this calculation type
+            order_by: One of name, created_at, last_modified, calc_type
+            descending: Sort in descending order
+            limit: Maximum number of rows to return
+            offset: Number of matching rows to skip
+
+        Returns:
+            List of dictionaries with id, name, calc_type, created_at and
+            last_modified
+        """
+        if order_by not in _ORDER_COLUMNS:
+            raise ValueError(f"Cannot order scenarios by {order_by}")
+
+        where, params = self._filters(search, calc_type)
+        query = (
+            f'SELECT {", ".join(_SUMMARY_COLUMNS)} FROM scenarios{where} '
+            f'ORDER BY {order_by} {"DESC" if descending else "ASC"}, id'
+        )
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params += [limit, offset]
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def count_scenarios(
+        self,
+        search: Optional[str] = None,
+        calc_type: Optional[str] = None
+    ) -> int:
+        """Count scenarios matching the same filters as ``list_scenarios``."""
+        where, params = self._filters(search, calc_type)
+        return self.connection.execute(
+            f'SELECT COUNT(*) FROM scenarios{where}', params
+        ).fetchone()[0]
+
+    def column_values(self, key: str) -> Dict[str, Any]:
+        """
+        Return one value per scenario for an output or input key.
+
+        Values are read inside SQLite with ``json_extract``, so no
+        scenario is decoded in Python. Current outputs take precedence
+        over an input of the same name; scenarios with neither get None.
+        """
+        path = f'$.{json.dumps(key)}'
+        rows = self.connection.execute(
+            'SELECT id, COALESCE('
+            'CASE WHEN engine_version = ? THEN json_extract(outputs, ?) END, '
+            'json_extract(data, ?)) FROM scenarios',
+            (ENGINE_VERSION, path, path)
+        )
+        return {row[0]: row[1] for row in rows}
+
+    def get_outputs(
+        self,
+        scenario_ids: Iterable[str],
+        metrics: Sequence[str] = (),
+        recompute: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return stored outputs, recomputing only those that are stale.
+
+        Outputs are stale when they were computed by another engine
+        version, were never computed, or lack one of ``metrics`` that
+        their type produces (see ``OUTPUT_METRICS``); other keys, such as
+        inputs, are ignored. Current outputs are returned as stored
+        without touching the inputs.
+
+        Args:
+            scenario_ids: Scenarios to fetch
+            metrics: Keys the caller needs
+            recompute: Recompute stale outputs; when false they are left
+                out, e.g. for a UI thread that refreshes them elsewhere
+
+        Returns:
+            Outputs keyed by scenario ID, in the order requested
+        """
+        ids = list(scenario_ids)
+        if not ids:
+            return {}
+        rows = self.connection.execute(
+            'SELECT id, calc_type, data, outputs, engine_version FROM scenarios '
+            f'WHERE id IN ({", ".join("?" * len(ids))})',
+            ids
+        ).fetchall()
+
+        outputs: Dict[str, Dict[str, Any]] = {}
+        stale = []
+        for row in rows:
+            stored = None if row['outputs'] is None else json.loads(row['outputs'])
+            if self._is_current(row, stored, metrics):
+                outputs[row['id']] = stored
+            else:
+                stale.append(row)
+        if recompute:
+            outputs.update(self._recompute(stale))
+        return {scenario_id: outputs[scenario_id] for scenario_id in ids
+                if scenario_id in outputs}
+
+    def refresh_outputs(self, batch_size: int = 500) -> int:
+        """
+        Recompute every scenario whose outputs predate ``ENGINE_VERSION``.
+
+        Returns:
+            Number of scenarios recomputed
+        """
+        refreshed = 0
+        while True:
+            rows = self.connection.execute(
+                'SELECT id, calc_type, data FROM scenarios '
+                'WHERE engine_version IS NULL OR engine_version != ? LIMIT ?',
+                (ENGINE_VERSION, batch_size)
+            ).fetchall()
+            if not rows:
+                return refreshed
+            self._recompute(rows)
+            refreshed += len(rows)
+
+    def refresh_outputs_in_background(self) -> Optional[threading.Thread]:
+        """
+        Run ``refresh_outputs`` on a daemon thread with its own connection.
+
+        In-memory databases cannot be shared between connections, so they
+        are refreshed immediately instead and ``None`` is returned.
+        """
+        if self.db_path == ':memory:':
+            self.refresh_outputs()
+            return None
+
+        def refresh() -> None:
+            manager = ScenarioManager(self.db_path, None)
+            try:
+                manager.refresh_outputs()
+            finally:
+                manager.close()
+
+        thread = threading.Thread(target=refresh, daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    @staticmethod
+    def _is_current(
+        row: sqlite3.Row,
+        outputs: Optional[Dict[str, Any]],
+        metrics: Sequence[str]
+    ) -> bool:
+        """Whether stored outputs can be served without recomputing."""
+        if outputs is None or row['engine_version'] != ENGINE_VERSION:
+            return False
+        if 'error' in outputs or row['calc_type'] not in OUTPUTS:
+            return True
+        produced = OUTPUT_METRICS.get(row['calc_type'], frozenset())
+        return all(metric in outputs for metric in metrics if metric in produced)
+
+    def _recompute(self, rows: Iterable[sqlite3.Row]) -> Dict[str, Dict[str, Any]]:
+        """Recompute and store outputs, once per distinct set of inputs."""
+        by_hash: Dict[str, Dict[str, Any]] = {}
+        updates = []
+        outputs: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            data = json.loads(row['data'])
+            digest = input_hash(row['calc_type'], data)
+            if digest not in by_hash:
+                by_hash[digest] = compute_outputs(row['calc_type'], data)
+            outputs[row['id']] = by_hash[digest]
+            updates.append((json.dumps(by_hash[digest]), ENGINE_VERSION,
+                            digest, row['id']))
+        if updates:
+            with self.connection:
+                self.connection.executemany(
+                    'UPDATE scenarios SET outputs = ?, engine_version = ?, '
+                    'input_hash = ? WHERE id = ?',
+                    updates
+                )
+        return outputs
+
+    @staticmethod
+    def _filters(search: Optional[str], calc_type: Optional[str]):
+        """Build the WHERE clause shared by list and count queries."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if search:
+            escaped = (search.replace('\\', '\\\\')
+                       .replace('%', '\\%').replace('_', '\\_'))
+            clauses.append("name LIKE ? ESCAPE '\\'")
+            params.append(f'%{escaped}%')
+        if calc_type is not None:
+            clauses.append('calc_type = ?')
+            params.append(calc_type)
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        return where, params
+
+    @staticmethod
+    def _scenario(row: sqlite3.Row) -> dict:
+        """Convert a row to the dictionary shape the JSON store used."""
+        return {
+            'name': row['name'],
+            'data': json.loads(row['data']),
+            'created_at': row['created_at'],
+            'last_modified': row['last_modified']
+        }
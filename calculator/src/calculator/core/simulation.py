@@ -0,0 +1,222 @@
+"""Monte Carlo simulation of rental property investments.
+
+Annual appreciation, rent growth, vacancy and expense inflation are drawn
+for thousands of paths at once as NumPy arrays. Large runs are split into
+fixed-size shards, each with its own child seed, and spread across a
+process pool. Because the shard layout depends only on the number of
+paths, results are reproducible for a given seed regardless of how many
+worker processes are used.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from calculator.core.amortization import balance_after, level_payment
+from calculator.core.batch import FloatArray
+from calculator.core.returns import irr
+from calculator.core.validation import check
+
+DEFAULT_ASSUMPTIONS: Dict[str, float] = {
+    'appreciation_rate': 3.0,
+    'appreciation_volatility': 5.0,
+    'rent_increase': 2.0,
+    'rent_volatility': 2.0,
+    'vacancy_volatility': 3.0,
+    'expense_inflation': 3.0,
+    'expense_volatility': 1.5,
+    'selling_costs': 6.0
+}
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Investment fields read from the property data
+INPUT_FIELDS = (
+    'purchase_price', 'down_payment', 'rate', 'loan_term', 'monthly_rent',
+    'vacancy_rate', 'other_income', 'parking_income', 'laundry_income',
+    'property_tax', 'insurance', 'maintenance', 'utilities', 'mgmt_fee'
+)
+
+
+def _property_inputs(data: Dict[str, Any]) -> Dict[str, float]:
+    """Extract the investment fields used by the simulation."""
+    return {
+        'purchase_price': float(data.get('purchase_price', 0)),
+        'down_payment': float(data.get('down_payment', 0)),
+        'rate': float(data.get('rate', 0)) / 100,
+        'loan_term': int(data.get('loan_term', 30)),
+        'monthly_rent': float(data.get('monthly_rent', 0)),
+        'vacancy_rate': float(data.get('vacancy_rate', 0)) / 100,
+        'other_income': (
+            float(data.get('other_income', 0))
+            + float(data.get('parking_income', 0))
+            + float(data.get('laundry_income', 0))
+        ),
+        'fixed_expenses': (
+            float(data.get('property_tax', 0))
+            + float(data.get('insurance', 0))
+            + float(data.get('maintenance', 0))
+            + float(data.get('utilities', 0))
+        ),
+        'mgmt_fee_rate': float(data.get('mgmt_fee', 0)) / 100
+    }
+
+
+def _growth_index(rates: FloatArray) -> FloatArray:
+    """Cumulative growth factors where year 1 uses the base amount."""
+    index = np.cumprod(1 + rates, axis=1)
+    return np.concatenate((np.ones((rates.shape[0], 1)), index[:, :-1]), axis=1)
+
+
+def _simulate_shard(
+    task: Tuple[Dict[str, float], Dict[str, float], int, int, np.random.SeedSequence]
+) -> Dict[str, FloatArray]:
+    """Simulate one shard of paths; runs inside a worker process."""
+    inputs, assumptions, paths, years, seed = task
+    rng = np.random.default_rng(seed)
+    shape = (paths, years)
+
+    appreciation = rng.normal(
+        assumptions['appreciation_rate'] / 100,
+        assumptions['appreciation_volatility'] / 100,
+        shape
+    )
+    rent_growth = rng.normal(
+        assumptions['rent_increase'] / 100,
+        assumptions['rent_volatility'] / 100,
+        shape
+    )
+    vacancy = np.clip(rng.normal(
+        inputs['vacancy_rate'],
+        assumptions['vacancy_volatility'] / 100,
+        shape
+    ), 0, 1)
+    expense_inflation = rng.normal(
+        assumptions['expense_inflation'] / 100,
+        assumptions['expense_volatility'] / 100,
+        shape
+    )
+
+    property_value = inputs['purchase_price'] * np.cumprod(1 + appreciation, axis=1)
+    rent_index = _growth_index(rent_growth)
+    income = (
+        inputs['monthly_rent'] * 12 * rent_index * (1 - vacancy)
+        + inputs['other_income'] * rent_index
+    )
+    expenses = (
+        inputs['fixed_expenses'] * _growth_index(expense_inflation)
+        + inputs['mgmt_fee_rate'] * income
+    )
+
+    loan_amount = inputs['purchase_price'] - inputs['down_payment']
+    monthly_rate = inputs['rate'] / 12
+    num_payments = inputs['loan_term'] * 12
+    debt_service = level_payment(loan_amount, monthly_rate, num_payments) * 12
+    months = np.minimum(np.arange(1, years + 1) * 12, num_payments)
+    loan_balance = np.array([
+        balance_after(loan_amount, monthly_rate, num_payments, int(m))
+        for m in months
+    ])
+
+    cash_flow = income - expenses - debt_service
+    equity = property_value - loan_balance
+    sale_proceeds = (
+        property_value[:, -1] * (1 - assumptions['selling_costs'] / 100)
+        - loan_balance[-1]
+    )
+
+    flows = np.empty((paths, years + 1))
+    flows[:, 0] = -inputs['down_payment']
+    flows[:, 1:] = cash_flow
+    flows[:, -1] += sale_proceeds
+
+    return {
+        'cash_flow': cash_flow,
+        'equity': equity,
+        'irr': irr(flows)
+    }
+
+
+def _bands(values: FloatArray) -> Dict[str, Any]:
+    """Percentile bands along the path axis (per year for 2-D values)."""
+    finite = np.where(np.isfinite(values), values, np.nan)
+    bands = np.nanpercentile(finite, PERCENTILES, axis=0)
+    return {f'p{p}': band.tolist() for p, band in zip(PERCENTILES, bands)}
+
+
+def simulate_investment(
+    data: Dict[str, Any],
+    paths: int = 10000,
+    years: int = 5,
+    seed: Optional[int] = None,
+    assumptions: Optional[Dict[str, float]] = None,
+    shard_size: int = 25000,
+    workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Simulate the investment over many random market paths.
+
+    Args:
+        data: Investment property data in the same format as
+            ``Calculator.calculate_investment_metrics``
+        paths: Number of simulated paths
+        years: Holding period in years
+        seed: Seed for reproducible runs
+        assumptions: Overrides for ``DEFAULT_ASSUMPTIONS`` (all percentages)
+        shard_size: Paths simulated per shard
+        workers: Worker processes; defaults to the CPU count. Runs that fit
+            in one shard, or ``workers=1``, stay in the calling process.
+
+    Returns:
+        Dictionary containing:
+            paths: Number of paths simulated
+            cash_flow: Percentile bands of annual cash flow per year
+            equity: Percentile bands of equity per year
+            irr: Percentiles of IRR (as percentage)
+            mean_irr: Mean IRR across paths (as percentage)
+            probability_of_loss: Share of paths with a negative IRR
+
+    Raises:
+        ValueError: For non-positive run sizes or invalid property data
+    """
+    if paths <= 0 or years <= 0:
+        raise ValueError("Paths and years must be positive")
+    if shard_size <= 0:
+        raise ValueError("Shard size must be positive")
+
+    check('investment', {name: data[name] for name in INPUT_FIELDS if name in data})
+    inputs = _property_inputs(data)
+    merged = {**DEFAULT_ASSUMPTIONS, **(assumptions or {})}
+
+    shard_paths = [shard_size] * (paths // shard_size)
+    if paths % shard_size:
+        shard_paths.append(paths % shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(shard_paths))
+    tasks = [
+        (inputs, merged, count, years, shard_seed)
+        for count, shard_seed in zip(shard_paths, seeds)
+    ]
+
+    max_workers = min(workers or os.cpu_count() or 1, len(tasks))
+    shards: List[Dict[str, FloatArray]]
+    if max_workers <= 1:
+        shards = [_simulate_shard(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            shards = list(pool.map(_simulate_shard, tasks))
+
+    cash_flow = np.concatenate([s['cash_flow'] for s in shards])
+    equity = np.concatenate([s['equity'] for s in shards])
+    returns = np.concatenate([s['irr'] for s in shards]) * 100
+    solved = returns[np.isfinite(returns)]
+
+    return {
+        'paths': paths,
+        'cash_flow': _bands(cash_flow),
+        'equity': _bands(equity),
+        'irr': _bands(returns),
+        'mean_irr': float(solved.mean()) if solved.size else float('nan'),
+        'probability_of_loss': float(np.mean(solved < 0)) if solved.size else 0.0
+    }
@@ -0,0 +1,192 @@
+"""Background task runner for event-loop driven front ends.
+
+Work is submitted to a thread (or process) pool and its results are
+delivered back on the event loop by polling a queue through a
+``schedule(delay_ms, callback)`` function such as Tk's ``root.after``.
+Worker threads never touch widgets; only the ``on_done``, ``on_error``
+and ``on_progress`` callbacks run on the loop.
+
+Tasks are keyed, e.g. by the tab that started them. Submitting a new task
+under a key cancels the one it replaces, and results from a cancelled or
+superseded task are dropped, so a slow stale run can never overwrite a
+newer one.
+"""
+
+import itertools
+import queue
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+Schedule = Callable[[int, Callable[[], None]], Any]
+
+
+class Cancelled(Exception):
+    """Raised inside a task at a checkpoint after it has been cancelled."""
+
+
+class Task:
+    """Handle passed to task functions for progress and cancellation."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, key: str, post: Callable[[tuple], None]):
+        self.key = key
+        self.id = next(Task._ids)
+        self.future: Optional[Future] = None
+        self._post = post
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Request cancellation; queued work never starts."""
+        self._cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+    def check(self) -> None:
+        """Checkpoint for long loops: raise ``Cancelled`` if cancelled."""
+        if self._cancelled:
+            raise Cancelled(self.key)
+
+    def report(self, done: float, total: float = 1.0, message: str = '') -> None:
+        """Post progress (``done`` out of ``total``) back to the event loop."""
+        self.check()
+        self._post(('progress', self, (done / total if total else 1.0, message)))
+
+
+class TaskRunner:
+    """Run functions off the event loop and deliver results on it."""
+
+    def __init__(
+        self,
+        schedule: Schedule,
+        executor: Optional[Executor] = None,
+        poll_interval: int = 50
+    ):
+        """
+        Args:
+            schedule: ``schedule(delay_ms, callback)`` that runs
+                ``callback`` on the event loop, e.g. ``root.after``
+            executor: Pool to run tasks on; defaults to two threads
+            poll_interval: Milliseconds between checks for results
+        """
+        self.schedule = schedule
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='calculator-task'
+        )
+        self.poll_interval = poll_interval
+        self._results: 'queue.SimpleQueue[tuple]' = queue.SimpleQueue()
+        self._active: Dict[str, Task] = {}
+        self._callbacks: Dict[int, Dict[str, Optional[Callable]]] = {}
+        self._polling = False
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._active)
+
+    def submit(
+        self,
+        key: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        on_progress: Optional[Callable[[float, str], None]] = None,
+        pass_task: bool = True
+    ) -> Task:
+        """
+        Start ``fn`` in the pool, replacing any task running under ``key``.
+
+        Args:
+            key: Slot the task occupies
+            fn: Work to run; called as ``fn(task, *args)`` so it can report
+                progress and check for cancellation, or as ``fn(*args)``
+                when ``pass_task`` is false (required for process pools)
+            on_done: Called on the event loop with ``fn``'s result
+            on_error: Called on the event loop with the exception ``fn``
+                raised; without it the exception is re-raised there
+            on_progress: Called on the event loop with (fraction, message)
+
+        Returns:
+            The task handle
+        """
+        self.cancel(key)
+        task = Task(key, self._results.put)
+        self._active[key] = task
+        self._callbacks[task.id] = {
+            'done': on_done, 'error': on_error, 'progress': on_progress
+        }
+        call_args = (task, *args) if pass_task else args
+        task.future = self.executor.submit(fn, *call_args)
+        task.future.add_done_callback(
+            lambda future: self._results.put(('done', task, future))
+        )
+        self._ensure_polling()
+        return task
+
+    def cancel(self, key: Optional[str] = None) -> bool:
+        """
+        Cancel the task under ``key``, or every task when ``key`` is None.
+
+        Returns:
+            Whether anything was cancelled
+        """
+        keys = list(self._active) if key is None else [key]
+        cancelled = False
+        for name in keys:
+            task = self._active.pop(name, None)
+            if task is not None:
+                task.cancel()
+                self._callbacks.pop(task.id, None)
+                cancelled = True
+        return cancelled
+
+    def shutdown(self) -> None:
+        """Cancel everything and stop the pool without waiting."""
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_polling(self) -> None:
+        if not self._polling:
+            self._polling = True
+            self.schedule(self.poll_interval, self._poll)
+
+    def _poll(self) -> None:
+        """Deliver queued results and progress for tasks still current."""
+        try:
+            while True:
+                try:
+                    kind, task, payload = self._results.get_nowait()
+                except queue.Empty:
+                    return
+                if self._active.get(task.key) is task:
+                    self._deliver(kind, task, payload)
+        finally:
+            if self._active:
+                self.schedule(self.poll_interval, self._poll)
+            else:
+                self._polling = False
+
+    def _deliver(self, kind: str, task: Task, payload: Any) -> None:
+        callbacks = self._callbacks[task.id]
+        if kind == 'progress':
+            if callbacks['progress'] is not None:
+                callbacks['progress'](*payload)
+            return
+
+        del self._active[task.key]
+        del self._callbacks[task.id]
+        if payload.cancelled():
+            return
+        error = payload.exception()
+        if isinstance(error, Cancelled):
+            return
+        if error is None:
+            callbacks['done'](payload.result())
+        elif callbacks['error'] is not None:
+            callbacks['error'](error)
+        else:
+            raise error
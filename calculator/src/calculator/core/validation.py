@@ -0,0 +1,168 @@
+"""Vectorized input validation for the core calculation schemas.
+
+Each schema is an ordered table of rules. A rule names an error code, the
+message the scalar ``Calculator`` path raises for it, and a function that
+flags the failing rows of a whole column mapping at once. Rules are listed
+in the order the scalar path checks them, so the first rule a row fails is
+the error that row would raise on its own.
+
+``validate`` returns a per-row mask and error codes so callers can report
+bad rows and compute only the good ones; ``check`` raises like the scalar
+path for callers that want all-or-nothing behaviour.
+"""
+
+from functools import reduce
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+BoolArray = npt.NDArray[np.bool_]
+CodeArray = npt.NDArray[np.int8]
+Rule = Tuple[str, str, Callable[[Mapping[str, npt.ArrayLike]], BoolArray]]
+
+
+def column(
+    columns: Mapping[str, npt.ArrayLike],
+    name: str,
+    default: float = 0.0
+) -> npt.NDArray[np.float64]:
+    """Return a field as a float array, using ``default`` when absent."""
+    return np.asarray(columns.get(name, default), dtype=np.float64)
+
+
+def _negative(*names: str) -> Callable[[Mapping[str, npt.ArrayLike]], BoolArray]:
+    """Rule that fails rows where any of ``names`` is negative."""
+    def fails(columns: Mapping[str, npt.ArrayLike]) -> BoolArray:
+        return reduce(np.logical_or, (column(columns, name) < 0 for name in names))
+    return fails
+
+
+def _outside_percent(name: str) -> Callable[[Mapping[str, npt.ArrayLike]], BoolArray]:
+    """Rule that fails rows where a percentage is outside 0-100."""
+    def fails(columns: Mapping[str, npt.ArrayLike]) -> BoolArray:
+        value = column(columns, name) / 100
+        return (value < 0) | (value > 1)
+    return fails
+
+
+def _not_finite(*names: str) -> Callable[[Mapping[str, npt.ArrayLike]], BoolArray]:
+    """Rule that fails rows where any of ``names`` is NaN or infinite."""
+    def fails(columns: Mapping[str, npt.ArrayLike]) -> BoolArray:
+        return reduce(np.logical_or, (~np.isfinite(column(columns, name)) for name in names))
+    return fails
+
+
+# Rates and percentages are in the units each schema's callers use:
+# percentages for investment data, decimals for loans.
+RULES: Dict[str, Tuple[Rule, ...]] = {
+    'investment': (
+        ('negative_financials', "Financial values cannot be negative",
+         _negative('purchase_price', 'down_payment', 'rate')),
+        ('down_payment_exceeds_price', "Down payment cannot exceed purchase price",
+         lambda c: column(c, 'down_payment') > column(c, 'purchase_price')),
+        ('nonpositive_term', "Loan term must be positive",
+         lambda c: np.trunc(column(c, 'loan_term', 30)) <= 0),
+        ('negative_rent', "Rent cannot be negative",
+         _negative('monthly_rent')),
+        ('vacancy_out_of_range', "Vacancy rate must be between 0 and 100",
+         _outside_percent('vacancy_rate')),
+        ('negative_income', "Income values cannot be negative",
+         _negative('other_income', 'parking_income', 'laundry_income')),
+        ('negative_expenses', "Expense values cannot be negative",
+         _negative('property_tax', 'insurance', 'maintenance', 'utilities')),
+        ('mgmt_fee_out_of_range', "Management fee rate must be between 0 and 100",
+         _outside_percent('mgmt_fee')),
+        ('not_finite', "Values must be finite numbers",
+         _not_finite('purchase_price', 'down_payment', 'rate', 'loan_term',
+                     'monthly_rent', 'vacancy_rate', 'other_income', 'parking_income',
+                     'laundry_income', 'property_tax', 'insurance', 'maintenance',
+                     'utilities', 'mgmt_fee')),
+    ),
+    'closing_costs': (
+        ('negative_financials', "Financial values cannot be negative",
+         _negative('purchase_price', 'loan_amount')),
+        ('loan_exceeds_price', "Loan amount cannot exceed purchase price",
+         lambda c: column(c, 'loan_amount') > column(c, 'purchase_price')),
+        ('not_finite', "Values must be finite numbers",
+         _not_finite('purchase_price', 'loan_amount')),
+    ),
+    'loan': (
+        ('invalid_loan_terms',
+         "Principal and rate must be non-negative, years must be positive",
+         lambda c: (_negative('principal', 'rate')(c)
+                    | (column(c, 'years', 30) <= 0))),
+        ('elapsed_out_of_range', "Elapsed months must be between 0 and the loan term",
+         lambda c: ((column(c, 'months_elapsed') < 0)
+                    | (column(c, 'months_elapsed') > column(c, 'years', 30) * 12))),
+        ('negative_balloon', "Balloon month cannot be negative",
+         _negative('balloon_months')),
+        # A NaN balloon month means "no balloon", so it is not checked here
+        ('not_finite', "Values must be finite numbers",
+         _not_finite('principal', 'rate', 'years', 'months_elapsed')),
+    ),
+}
+
+
+def validate(
+    schema: str,
+    columns: Mapping[str, npt.ArrayLike]
+) -> Tuple[BoolArray, CodeArray]:
+    """
+    Validate every row of a column mapping at once.
+
+    Args:
+        schema: Key of ``RULES``
+        columns: Arrays (or scalars) keyed by field name; missing fields
+            take the scalar path's defaults
+
+    Returns:
+        Tuple of (valid mask, error codes). A code of 0 means the row is
+        valid; otherwise it is the 1-based position in ``RULES[schema]`` of
+        the first rule the row fails.
+
+    Examples:
+        >>> valid, codes = validate('closing_costs', {
+        ...     'purchase_price': [300000, 100000, -5],
+        ...     'loan_amount': [240000, 150000, 0],
+        ... })
+        >>> valid.tolist(), codes.tolist()
+        ([True, False, False], [0, 2, 1])
+    """
+    if schema not in RULES:
+        raise ValueError(f"Unknown schema: {schema}")
+    rules = RULES[schema]
+    failures = [fails(columns) for _, _, fails in rules]
+    shape = np.broadcast_shapes(
+        *(np.shape(value) for value in columns.values()),
+        *(failure.shape for failure in failures)
+    )
+
+    codes = np.zeros(shape, dtype=np.int8)
+    for number in range(len(rules), 0, -1):
+        codes[np.broadcast_to(failures[number - 1], shape)] = number
+    return codes == 0, codes
+
+
+def error_messages(schema: str, codes: CodeArray) -> List[Optional[str]]:
+    """Map error codes from ``validate`` to messages, ``None`` for valid rows."""
+    rules = RULES[schema]
+    return [rules[code - 1][1] if code else None for code in np.ravel(codes)]
+
+
+def error_names(schema: str, codes: CodeArray) -> List[Optional[str]]:
+    """Map error codes from ``validate`` to rule names, ``None`` for valid rows."""
+    rules = RULES[schema]
+    return [rules[code - 1][0] if code else None for code in np.ravel(codes)]
+
+
+def check(schema: str, columns: Mapping[str, npt.ArrayLike]) -> None:
+    """
+    Raise the scalar path's error if any row is invalid.
+
+    Raises:
+        ValueError: With the message of the earliest rule any row fails
+    """
+    valid, codes = validate(schema, columns)
+    if not np.all(valid):
+        raise ValueError(RULES[schema][int(codes[~valid].min()) - 1][1])
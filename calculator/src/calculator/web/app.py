@@ -1,17 +1,25 @@
 """Web application module for the calculator suite."""
 
+import io
+import json
 from pathlib import Path
 from flask import (
     Flask,
+    Response,
     render_template,
     jsonify,
     request,
+    stream_with_context,
     url_for
 )
-from docxtpl import DocxTemplate
+from flask.helpers import get_debug_flag
 
+from calculator.core.bulk import chunked, evaluate_mixed, read_records
+from calculator.core.cache import ResultCache
 from calculator.core.calc import Calculator
-from calculator.core.risk_analyzer import RiskAnalyzer
+from calculator.core.risk_analyzer import STRATEGIES, RiskAnalyzer
+from calculator.web import caching, serving
+from calculator.web.documents import DocumentJobs, JobQueueFull, bulk_documents
 
 
 app = Flask(
@@ -21,14 +29,45 @@ app = Flask(
 )
 
 
-@app.after_request
-def add_header(response):
-    """Ensure static files aren't cached during development."""
-    response.headers['Cache-Control'] = 'no-store'
-    return response
+caching.install(app)
+
+
+# Records evaluated per vectorized call in /calculate/batch.
+BATCH_CHUNK_SIZE = 5000
 
+# Longest a /generate-document/<job_id> request may block.
+DOCUMENT_MAX_WAIT = 30
+
+# Processes rendering a /generate-documents request. With at most
+# documents.MAX_BULK_RENDERS requests rendering at once, this bounds the
+# render processes each web worker can start.
+BULK_DOCUMENT_WORKERS = 2
 
 risk_analyzer = RiskAnalyzer()
+document_jobs = DocumentJobs(
+    template_dir=Path(__file__).parent / 'templates' / 'documents',
+    output_dir=Path(__file__).parent / 'static' / 'generated',
+    max_workers=2,
+    max_pending=32
+)
+result_cache = ResultCache(
+    default_size=256,
+    sizes={'investment': 2048, 'closing_costs': 1024}
+)
+readiness = serving.install(app, modules=('docxtpl',))
+
+
+@readiness.warmer('documents')
+def load_document_templates():
+    """Read every DOCX template into the template cache."""
+    for path in document_jobs.templates.directory.glob('*.docx'):
+        document_jobs.templates.get(path.name)
+
+
+@readiness.warmer('risk')
+def score_sample_property():
+    """Build the risk analyzer's first comparison."""
+    risk_analyzer.compare_strategies([serving.SAMPLE])
 
 
 @app.route('/')
@@ -46,83 +85,234 @@ def calculate():
     
     try:
         if calc_type == 'investment':
-            results = calculator.calculate_investment_metrics(data)
+            compute = calculator.calculate_investment_metrics
         elif calc_type == 'closing_costs':
-            results = calculator.calculate_closing_costs(data)
+            compute = calculator.calculate_closing_costs
         else:
             return jsonify({'error': 'Invalid calculation type'})
             
-        return jsonify(results)
+        return caching.conditional_calculation(
+            data,
+            lambda: result_cache.get_or_compute(data, lambda: compute(data))
+        )
         
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
 
+@app.route('/calculate/batch', methods=['POST'])
+def calculate_batch():
+    """
+    Handle many calculation requests in one call.
+
+    The body is a JSON array or an NDJSON stream (``application/x-ndjson``)
+    of requests of any supported type. Results stream back as NDJSON in
+    input order, one ``{"index", "type", "result"}`` or ``{"index",
+    "error"}`` object per request. ``?format=columnar`` returns one JSON
+    object of arrays per field for each type instead.
+    """
+    if request.mimetype == 'application/x-ndjson':
+        stream = io.TextIOWrapper(request.stream, encoding='utf-8')
+        records = enumerate(
+            record for _, record in read_records(stream, 'ndjson')
+        )
+    else:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, list):
+            return jsonify({'error': 'Expected a JSON array of calculations'}), 400
+        records = enumerate(
+            item if isinstance(item, dict)
+            else TypeError("Record must be a JSON object")
+            for item in payload
+        )
+
+    if request.args.get('format') == 'columnar':
+        return jsonify(_columnar_batch(records))
+
+    def generate():
+        for chunk in chunked(records, BATCH_CHUNK_SIZE):
+            lines = {}
+            for calc_type, (indexes, columns, errors) in evaluate_mixed(chunk).items():
+                for i, index in enumerate(indexes):
+                    lines[index] = {
+                        'index': index,
+                        'type': calc_type,
+                        'result': {key: values[i] for key, values in columns.items()}
+                    }
+                for index, message in errors:
+                    lines[index] = {'index': index, 'error': message}
+            yield ''.join(json.dumps(lines[index]) + '\n' for index, _ in chunk)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson'
+    )
+
+
+def _columnar_batch(records):
+    """Collect batch results as arrays per field, grouped by type."""
+    response = {'errors': {'index': [], 'error': []}}
+    for chunk in chunked(records, BATCH_CHUNK_SIZE):
+        for calc_type, (indexes, columns, errors) in evaluate_mixed(chunk).items():
+            if indexes:
+                group = response.setdefault(calc_type, {'index': []})
+                group['index'].extend(indexes)
+                for key, values in columns.items():
+                    group.setdefault(key, []).extend(values)
+            for index, message in errors:
+                response['errors']['index'].append(index)
+                response['errors']['error'].append(message)
+    return response
+
+
+@app.route('/calculate/cache-stats')
+def calculate_cache_stats():
+    """Report result cache hits, misses and evictions."""
+    return jsonify(result_cache.stats())
+
+
 @app.route('/generate-document', methods=['POST'])
 def generate_document():
-    """Generate document from template."""
+    """
+    Queue a document render.
+
+    Responds 202 with a job ID to poll, or 200 with the file URL when an
+    identical document has already been rendered.
+    """
     data = request.get_json()
     template_name = data.get('template')
-    doc_data = data.get('data')
-    
-    template_path = (
-        Path(__file__).parent
-        / 'templates'
-        / 'documents'
-        / template_name
-    )
-    
-    if not template_path.exists():
+    doc_data = data.get('data') or {}
+
+    try:
+        job = document_jobs.submit(str(template_name), doc_data)
+    except FileNotFoundError:
         return jsonify({'error': 'Template not found'}), 404
-    
-    doc = DocxTemplate(template_path)
-    doc.render(doc_data)
-    
-    output_path = (
-        Path(__file__).parent
-        / 'static'
-        / 'generated'
-        / f'generated_{template_name}'
-    )
-    doc.save(output_path)
-    
-    return jsonify({
-        'success': True,
-        'file_url': url_for(
-            'static',
-            filename=f'generated/generated_{template_name}'
+    except TypeError as e:
+        return jsonify({'error': str(e)}), 400
+    except JobQueueFull as e:
+        response = jsonify({'error': str(e)})
+        response.headers['Retry-After'] = '5'
+        return response, 503
+
+    return _document_job_response(job)
+
+
+@app.route('/generate-documents', methods=['POST'])
+def generate_documents():
+    """
+    Mail-merge one template with many records into a streamed ZIP archive.
+
+    The body is ``{"template": name, "records": [...]}``, or an NDJSON
+    stream of records (``application/x-ndjson``) with the template named
+    in ``?template=``. Documents are rendered in a process pool and added
+    to the archive as they finish; failed records are listed in its
+    ``errors.ndjson``.
+    """
+    if request.mimetype == 'application/x-ndjson':
+        template_name = request.args.get('template')
+        stream = io.TextIOWrapper(request.stream, encoding='utf-8')
+        records = enumerate(
+            record for _, record in read_records(stream, 'ndjson')
+        )
+    else:
+        payload = request.get_json(silent=True) or {}
+        template_name = payload.get('template')
+        if not isinstance(payload.get('records'), list):
+            return jsonify({'error': 'Expected a JSON array of records'}), 400
+        records = enumerate(
+            item if isinstance(item, dict)
+            else TypeError("Record must be a JSON object")
+            for item in payload['records']
         )
-    })
+
+    try:
+        template, _ = document_jobs.templates.get(str(template_name))
+    except FileNotFoundError:
+        return jsonify({'error': 'Template not found'}), 404
+
+    stem = Path(str(template_name)).stem
+    return Response(
+        stream_with_context(
+            bulk_documents(template, records, stem, BULK_DOCUMENT_WORKERS)
+        ),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename="{stem}.zip"'}
+    )
+
+
+@app.route('/generate-document/<job_id>')
+def document_status(job_id):
+    """Report a document job; ``?wait=<seconds>`` long-polls until it finishes."""
+    wait = min(request.args.get('wait', 0, type=float), DOCUMENT_MAX_WAIT)
+    job = document_jobs.status(job_id, wait=max(wait, 0))
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    return _document_job_response(job)
+
+
+def _document_job_response(job):
+    body = {
+        'success': job['status'] != 'failed',
+        'job_id': job['job_id'],
+        'status': job['status'],
+        'status_url': url_for('document_status', job_id=job['job_id'])
+    }
+    if job['status'] == 'done':
+        body['file_url'] = url_for('static', filename=f"generated/{job['file']}")
+        return jsonify(body)
+    if job['status'] == 'failed':
+        body['error'] = job['error']
+        return jsonify(body), 500
+    return jsonify(body), 202
 
 
 @app.route('/analyze-risks', methods=['POST'])
 def analyze_risks():
-    """Analyze risks for a given strategy."""
-    data = request.get_json()
+    """
+    Compare the risk of financing strategies for one or more properties.
+
+    The body has ``property`` (one deal) or ``properties`` (a list) and
+    optionally ``strategies`` to limit the comparison. Every property is
+    scored against every strategy in one pass; each gets its deal metrics
+    and a ranking from lowest to highest risk. When ``strategy`` names a
+    single strategy, its category levels are also returned at the top
+    level as before.
+    """
+    data = request.get_json(silent=True) or {}
+    properties = data.get('properties')
+    single = properties is None
+    if single:
+        properties = [data.get('property') or {}]
+    if not isinstance(properties, list) or not all(
+        isinstance(item, dict) for item in properties
+    ):
+        return jsonify({'error': 'Expected property objects'}), 400
+    strategies = data.get('strategies') or list(STRATEGIES)
+    if not isinstance(strategies, list) or not all(
+        isinstance(item, str) for item in strategies
+    ):
+        return jsonify({'error': 'Expected strategies as a list of names'}), 400
     strategy = data.get('strategy')
-    property_data = data.get('property')
-    
-    risk_analysis = {
-        'legal': risk_analyzer.analyze_legal_risks(
-            strategy,
-            property_data
-        ),
-        'financial': risk_analyzer.analyze_financial_risks(
-            strategy,
-            property_data
-        ),
-        'market': risk_analyzer.analyze_market_risks(
-            strategy,
-            property_data
-        ),
-        'operational': risk_analyzer.analyze_operational_risks(
-            strategy,
-            property_data
-        )
-    }
-    
+    if strategy is not None and not isinstance(strategy, str):
+        return jsonify({'error': 'Expected strategy as a name'}), 400
+    if strategy and strategy not in strategies:
+        strategies = [*strategies, strategy]
+
+    try:
+        comparisons = risk_analyzer.compare_strategies(properties, strategies)
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+
+    if not single:
+        return jsonify({'properties': comparisons})
+    risk_analysis = dict(comparisons[0])
+    if strategy:
+        chosen = next(item for item in risk_analysis['ranking'] if item['strategy'] == strategy)
+        for category, values in chosen['categories'].items():
+            risk_analysis[category] = values['level']
     return jsonify(risk_analysis)
 
 
 if __name__ == '__main__':
-    app.run(debug=True) 
\ No newline at end of file
+    # The Werkzeug debugger runs code from the browser; opt in with FLASK_DEBUG=1
+    app.run(debug=get_debug_flag())
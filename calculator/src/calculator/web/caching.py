@@ -0,0 +1,117 @@
+"""HTTP caching for the calculator web applications.
+
+Static files get fingerprinted URLs: ``url_for('static', ...)`` appends
+``?v=<content hash>``, and a request carrying the current hash is served
+as immutable for a year. Editing a file changes its URL, so browsers
+never see a stale asset and never re-download an unchanged one.
+
+Calculation responses are a pure function of the canonical request, the
+engine version and, for closing costs, the loaded fee schedules, so their
+strong ETag is derived from exactly that.
+A client that sends the ETag back in ``If-None-Match`` gets a 304 before
+anything is computed.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from flask import Flask, Response, jsonify, request
+
+from calculator.core.cache import result_key
+from calculator.core.calc import ENGINE_VERSION
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+
+class StaticFingerprints:
+    """Content hashes of static files, recomputed when a file changes."""
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self._hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, filename: str) -> str:
+        """Short SHA-256 of a static file, or '' if it does not exist."""
+        path = os.path.join(self.folder, filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ''
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._hashes.get(filename)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as source:
+            for block in iter(lambda: source.read(1 << 16), b''):
+                digest.update(block)
+        fingerprint = digest.hexdigest()[:16]
+        with self._lock:
+            self._hashes[filename] = (version, fingerprint)
+        return fingerprint
+
+
+def install(app: Flask) -> None:
+    """
+    Fingerprint ``app``'s static URLs and set Cache-Control on responses.
+
+    Fingerprinted static files are immutable. Other static requests and
+    pages must revalidate (``no-cache``); responses that set no policy of
+    their own and are not 200 or 304 are ``no-store``.
+    """
+    fingerprints = StaticFingerprints(app.static_folder)
+
+    @app.url_defaults
+    def add_fingerprint(endpoint, values):
+        if endpoint == 'static' and 'filename' in values and 'v' not in values:
+            fingerprint = fingerprints.get(values['filename'])
+            if fingerprint:
+                values['v'] = fingerprint
+
+    @app.after_request
+    def add_cache_headers(response):
+        if request.endpoint == 'static' and response.status_code in (200, 304):
+            version = request.args.get('v')
+            if version and version == fingerprints.get(request.view_args['filename']):
+                response.headers['Cache-Control'] = IMMUTABLE
+            else:
+                response.headers['Cache-Control'] = 'no-cache'
+        elif 'Cache-Control' not in response.headers:
+            cacheable = response.status_code in (200, 304)
+            response.headers['Cache-Control'] = 'no-cache' if cacheable else 'no-store'
+        return response
+
+
+def calculation_etag(payload: Dict[str, Any]) -> str:
+    """Strong ETag for a calculation: engine version plus its result key."""
+    _, digest = result_key(payload)
+    return f'{ENGINE_VERSION}-{digest}'
+
+
+def conditional_calculation(
+    payload: Dict[str, Any],
+    compute: Callable[[], Any]
+) -> Response:
+    """
+    Answer a calculation request, or 304 if the client already has it.
+
+    Args:
+        payload: The request body, including ``type``
+        compute: Returns the result to send as JSON; not called when the
+            request's ``If-None-Match`` matches
+
+    Returns:
+        A 304 response, or a JSON response carrying the ETag
+    """
+    etag = calculation_etag(payload)
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(compute())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
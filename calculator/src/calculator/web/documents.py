@@ -0,0 +1,481 @@
+"""Background DOCX generation for the web application.
+
+Templates are read once and kept in memory until their file changes on
+disk (modification time or size). Rendering runs on a small bounded
+worker pool; a request gets a job ID back immediately and polls for the
+result instead of holding a web worker for the whole render.
+
+Output files are content-addressed: the job ID is a hash of the template
+contents and the render context, and the file is named after it. Two
+users never overwrite each other's documents, and a repeated request is
+served from the file that already exists (or joins the job that is
+already rendering it).
+
+Job state is kept on disk next to the outputs, so any worker process
+can answer a poll: ``<stem>-<job id>.pending`` while a job waits or
+runs, ``<stem>-<job id>.failed`` (holding the error) once it has failed
+and the ``.docx`` itself once it is done. A pending marker left by a
+worker that died is replaced by the next submit of the same request.
+
+``bulk_documents`` is the mail-merge path: one template and many records
+rendered across a process pool and streamed out as a ZIP archive while
+renders finish. Only a bounded number of documents is in flight at once,
+so memory stays flat however many records there are. At most
+``MAX_BULK_RENDERS`` pools run in a process at a time; further bulk
+requests wait for a slot. Pool workers start from a forkserver (spawn
+where that is unavailable), never by forking a threaded web worker.
+
+Usage:
+    python -m calculator.web.documents master_lease.docx deals.csv -o leases.zip
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import wait as wait_for
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from calculator.core.bulk import read_records
+
+# Finished job records kept for status queries; files outlive them
+MAX_FINISHED_JOBS = 1024
+
+# Job IDs are truncated SHA-256 digests
+JOB_ID = re.compile(r'[0-9a-f]{32}')
+
+# Bulk render process pools that may run at once in one process
+MAX_BULK_RENDERS = 2
+
+# Seconds between marker checks when long polling a job another process runs
+MARKER_POLL_INTERVAL = 0.1
+
+
+class JobQueueFull(Exception):
+    """Raised when every worker is busy and the pending queue is full."""
+
+
+class TemplateCache:
+    """DOCX template contents keyed by name, reloaded when the file changes."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory).resolve()
+        self._entries: Dict[str, Tuple[Tuple[int, int], bytes, str]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def path(self, name: str) -> Path:
+        """
+        Resolve a template name inside the template directory.
+
+        Raises:
+            FileNotFoundError: If the name escapes the directory or does
+                not exist
+        """
+        path = (self.directory / name).resolve()
+        if path.parent != self.directory or not path.is_file():
+            raise FileNotFoundError(name)
+        return path
+
+    def get(self, name: str) -> Tuple[bytes, str]:
+        """
+        Return a template's bytes and their SHA-256 digest.
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+        """
+        path = self.path(name)
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry[0] == version:
+                return entry[1], entry[2]
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._entries[name] = (version, content, digest)
+            self.loads += 1
+        return content, digest
+
+
+def render_bytes(template: bytes, context: Dict[str, Any]) -> bytes:
+    """Render a DOCX template in memory."""
+    # docxtpl pulls in python-docx and lxml; only document jobs need them
+    from docxtpl import DocxTemplate
+
+    document = DocxTemplate(io.BytesIO(template))
+    document.render(context)
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Write ``content`` to ``path`` so readers never see a partial file."""
+    handle, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix='.', suffix=path.suffix
+    )
+    try:
+        with os.fdopen(handle, 'wb') as output:
+            output.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def render_docx(template: bytes, context: Dict[str, Any], output_path: Path) -> None:
+    """Render a DOCX template and write it to ``output_path`` atomically."""
+    write_atomic(output_path, render_bytes(template, context))
+
+
+class DocumentJobs:
+    """Queue of document renders with content-addressed outputs."""
+
+    def __init__(
+        self,
+        template_dir: Path,
+        output_dir: Path,
+        max_workers: int = 2,
+        max_pending: int = 32
+    ):
+        """
+        Args:
+            template_dir: Directory holding the ``.docx`` templates
+            output_dir: Directory rendered documents are written to
+            max_workers: Renders that run at the same time
+            max_pending: Jobs that may wait or run before new ones are
+                refused with ``JobQueueFull``
+        """
+        self.templates = TemplateCache(template_dir)
+        self.output_dir = Path(output_dir)
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='calculator-docx'
+        )
+        self._jobs: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._events: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, template_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Start rendering ``template_name`` with ``context``, or reuse the
+        job or file for an identical earlier request.
+
+        Returns:
+            The job's status, as returned by ``status``
+
+        Raises:
+            FileNotFoundError: If the template does not exist
+            TypeError: If the context is not JSON serializable
+            JobQueueFull: If too many jobs are already pending
+        """
+        template, template_digest = self.templates.get(template_name)
+        context_json = json.dumps(context, sort_keys=True, separators=(',', ':'))
+        job_id = hashlib.sha256(
+            f'{template_digest}:{context_json}'.encode()
+        ).hexdigest()[:32]
+        filename = f'{Path(template_name).stem}-{job_id}.docx'
+        output_path = self.output_dir / filename
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job['status'] in ('pending', 'running', 'done'):
+                if job['status'] != 'done' or output_path.exists():
+                    return dict(job)
+            if output_path.exists():
+                job = {'job_id': job_id, 'status': 'done', 'file': filename}
+                self._remember(job_id, job)
+                return dict(job)
+            in_flight = sum(
+                1 for job in self._jobs.values() if job['status'] in ('pending', 'running')
+            )
+            if in_flight >= self.max_pending:
+                raise JobQueueFull(f"{in_flight} documents are already queued")
+            job = {'job_id': job_id, 'status': 'pending', 'file': filename}
+            self._remember(job_id, job)
+            self._events[job_id] = threading.Event()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(output_path.with_suffix('.pending'), b'')
+        output_path.with_suffix('.failed').unlink(missing_ok=True)
+        self.executor.submit(self._run, job_id, template, json.loads(context_json), output_path)
+        return dict(job)
+
+    def status(self, job_id: str, wait: float = 0) -> Optional[Dict[str, Any]]:
+        """
+        Return a job's status, or None if the job is unknown.
+
+        Jobs submitted through another ``DocumentJobs`` (another worker
+        process) are found from their marker files.
+
+        Args:
+            job_id: ID returned by ``submit``
+            wait: Seconds to block for an unfinished job to finish
+                (long polling)
+
+        Returns:
+            Dictionary with ``job_id``, ``status`` (``pending``,
+            ``running``, ``done`` or ``failed``), ``file`` and, for failed
+            jobs, ``error``; None for anything that is not a job ID
+        """
+        if not JOB_ID.fullmatch(job_id):
+            return None
+        with self._lock:
+            event = self._events.get(job_id)
+        if event is not None and wait > 0:
+            event.wait(wait)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job['status'] in ('pending', 'running'):
+                return dict(job)
+
+        # Finished jobs are read from disk; another process may have
+        # retried the job since this one recorded it
+        deadline = time.monotonic() + wait
+        job = self._stored_status(job_id)
+        while job is not None and job['status'] == 'pending' and time.monotonic() < deadline:
+            time.sleep(MARKER_POLL_INTERVAL)
+            job = self._stored_status(job_id)
+        return job
+
+    def _stored_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """A job's status from its files under <template stem>-<job id>."""
+        for template in self.templates.directory.glob('*.docx'):
+            output_path = self.output_dir / f'{template.stem}-{job_id}.docx'
+            job = {'job_id': job_id, 'file': output_path.name}
+            if output_path.is_file():
+                return {**job, 'status': 'done'}
+            try:
+                error = output_path.with_suffix('.failed').read_text()
+            except FileNotFoundError:
+                pass
+            else:
+                return {**job, 'status': 'failed', 'error': error}
+            if output_path.with_suffix('.pending').is_file():
+                return {**job, 'status': 'pending'}
+        return None
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    def _remember(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Record a job, pruning the oldest finished ones (lock held)."""
+        self._jobs[job_id] = job
+        self._jobs.move_to_end(job_id)
+        finished = [
+            key for key, record in self._jobs.items()
+            if record['status'] in ('done', 'failed')
+        ]
+        for key in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[key]
+
+    def _run(
+        self,
+        job_id: str,
+        template: bytes,
+        context: Dict[str, Any],
+        output_path: Path
+    ) -> None:
+        with self._lock:
+            self._jobs[job_id]['status'] = 'running'
+        try:
+            render_docx(template, context, output_path)
+            update = {'status': 'done'}
+        except Exception as e:
+            update = {'status': 'failed', 'error': str(e)}
+            write_atomic(output_path.with_suffix('.failed'), str(e).encode())
+        output_path.with_suffix('.pending').unlink(missing_ok=True)
+        with self._lock:
+            self._jobs[job_id].update(update)
+            self._remember(job_id, self._jobs[job_id])
+            event = self._events.pop(job_id)
+        event.set()
+
+
+# Template bytes of a bulk render worker process, set once at start-up
+_worker_template: Optional[bytes] = None
+
+_bulk_renders = threading.BoundedSemaphore(MAX_BULK_RENDERS)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for bulk render workers; forking a threaded process is unsafe."""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _load_worker_template(template: bytes) -> None:
+    """Process pool initializer: keep the template and import docxtpl once."""
+    global _worker_template
+    _worker_template = template
+    import docxtpl  # noqa: F401
+
+
+def _render_record(index: int, context: Dict[str, Any]) -> Tuple[int, Optional[bytes], Optional[str]]:
+    try:
+        return index, render_bytes(_worker_template, context), None
+    except Exception as e:
+        return index, None, f"{type(e).__name__}: {e}"
+
+
+def render_many(
+    template: bytes,
+    records: Iterable[Tuple[int, Any]],
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None
+) -> Iterator[Tuple[int, Optional[bytes], Optional[str]]]:
+    """
+    Render one template for many records across a process pool.
+
+    Blocks until one of the ``MAX_BULK_RENDERS`` pool slots is free.
+
+    Args:
+        template: DOCX template bytes, sent to each worker once
+        records: (index, context) pairs; a context that is an exception
+            is reported as that record's error without rendering
+        max_workers: Worker processes (default: CPU count)
+        max_in_flight: Renders submitted but not yet yielded; bounds
+            memory (default: four per worker)
+
+    Yields:
+        ``(index, content, error)`` in completion order, with either the
+        rendered bytes or an error message
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or max_workers * 4
+    _bulk_renders.acquire()
+    try:
+        pool = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_pool_context(),
+            initializer=_load_worker_template,
+            initargs=(template,)
+        )
+    except BaseException:
+        _bulk_renders.release()
+        raise
+    pending = set()
+    try:
+        for index, context in records:
+            if isinstance(context, Exception):
+                yield index, None, str(context)
+                continue
+            pending.add(pool.submit(_render_record, index, context))
+            if len(pending) >= max_in_flight:
+                done, pending = wait_for(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait_for(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        _bulk_renders.release()
+
+
+class _ZipSink:
+    """Write-only file object that hands ZipFile output to a generator."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def bulk_documents(
+    template: bytes,
+    records: Iterable[Tuple[int, Any]],
+    stem: str = 'document',
+    max_workers: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Mail-merge ``records`` into ``template`` and stream a ZIP archive.
+
+    Each document is added as ``<stem>-<index>.docx`` as soon as it is
+    rendered. Records that fail are listed in ``errors.ndjson`` at the end
+    of the archive as ``{"index", "error"}`` lines.
+
+    Yields:
+        Consecutive pieces of the ZIP file
+    """
+    sink = _ZipSink()
+    errors = []
+    # DOCX files are already deflated; storing them keeps this cheap
+    with zipfile.ZipFile(sink, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for index, content, error in render_many(template, records, max_workers):
+            if error is not None:
+                errors.append({'index': index, 'error': error})
+                continue
+            archive.writestr(f'{stem}-{index:05d}.docx', content)
+            yield sink.take()
+        if errors:
+            archive.writestr(
+                'errors.ndjson', ''.join(json.dumps(error) + '\n' for error in errors)
+            )
+    yield sink.take()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command line entry point for bulk mail merge."""
+    parser = argparse.ArgumentParser(
+        description="Render a DOCX template for every record of a CSV or NDJSON file."
+    )
+    parser.add_argument('template', help="DOCX template file")
+    parser.add_argument('input', help="Records file, or - for standard input")
+    parser.add_argument('-o', '--output', required=True, help="ZIP archive to write")
+    parser.add_argument('--input-format', choices=('csv', 'ndjson'))
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format or (
+        'csv' if args.input.lower().endswith('.csv') else 'ndjson'
+    )
+    template = Path(args.template).read_bytes()
+    source = sys.stdin if args.input == '-' else open(args.input, newline='')
+    try:
+        records = enumerate(record for _, record in read_records(source, input_format))
+        with open(args.output, 'wb') as output:
+            for piece in bulk_documents(template, records, Path(args.template).stem,
+                                        args.workers):
+                output.write(piece)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    with zipfile.ZipFile(args.output) as archive:
+        names = archive.namelist()
+    documents = sum(1 for name in names if name.endswith('.docx'))
+    print(f"Wrote {documents} documents to {args.output}"
+          + (" (see errors.ndjson)" if 'errors.ndjson' in names else ""),
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
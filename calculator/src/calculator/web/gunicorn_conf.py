@@ -0,0 +1,66 @@
+"""Production gunicorn settings for the calculator web applications.
+
+Use with ``gunicorn -c python:calculator.web.gunicorn_conf app:app``. The
+repository's top-level ``gunicorn.conf.py`` re-exports this module, so a
+plain ``gunicorn app:app`` run from there picks it up too.
+
+Environment overrides: ``PORT`` or ``GUNICORN_BIND``, ``WEB_CONCURRENCY``
+(workers), ``GUNICORN_THREADS``, ``GUNICORN_MAX_REQUESTS`` and
+``GUNICORN_TIMEOUT``.
+"""
+
+import gc
+import os
+
+from calculator.web import serving
+
+
+def _cpu_count() -> int:
+    """CPUs this process may run on, honouring container CPU affinity."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+bind = os.environ.get('GUNICORN_BIND') or f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Calculations are CPU bound and hold the GIL, so one process per CPU.
+# Threads cover requests that mostly wait: document long polls and ZIP
+# streams.
+workers = int(os.environ.get('WEB_CONCURRENCY', _cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Import and warm the app once in the master; workers fork from it
+preload_app = True
+
+# Recycle workers to bound slow leaks; the jitter keeps them from all
+# restarting at once
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+graceful_timeout = 30
+keepalive = 5
+
+# Keep the worker heartbeat files off a possibly slow container disk
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = '-'
+
+
+def when_ready(server):
+    """Warm the preloaded app in the master, before any worker forks."""
+    if server.cfg.preload_app:
+        serving.warm_up(server.app.wsgi())
+        # Move everything warm-up allocated out of the collector's reach
+        # so collections in workers do not touch (and copy) those pages
+        gc.collect()
+        gc.freeze()
+
+
+def post_worker_init(worker):
+    """Warm the worker's app; a no-op when it forked from a warm master."""
+    serving.warm_up(worker.wsgi)
@@ -0,0 +1,152 @@
+"""Warm-up and readiness for the calculator web applications.
+
+In production the apps run under gunicorn with ``preload_app`` (see
+``calculator.web.gunicorn_conf``). The master imports the app, runs
+``warm_up`` once and only then forks workers. The workers share the
+loaded modules, fee schedules and compiled templates copy-on-write and
+never pay first-request initialization. Without preloading each worker
+warms itself before it accepts requests.
+
+``/ready`` answers 503 until the app is warm. Under any other server the
+first probe starts warm-up in the background.
+"""
+
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask, jsonify, render_template
+
+from calculator.core.calc import ENGINE_VERSION, Calculator
+from calculator.core.fees import fee_schedules
+
+EXTENSION = 'calculator.serving'
+
+# A representative deal that runs each engine path once
+SAMPLE = {
+    'purchase_price': 300000, 'down_payment': 60000, 'rate': 6, 'loan_term': 30,
+    'monthly_rent': 2500, 'vacancy_rate': 5, 'property_tax': 3600, 'insurance': 1200,
+    'sale_price': 300000, 'years': 30, 'loan_amount': 240000,
+}
+
+Warmer = Callable[[], Any]
+
+
+class Readiness:
+    """Warm-up steps of one app and whether they have run."""
+
+    def __init__(self, app: Flask):
+        self.app = app
+        self.warmers: List[Tuple[str, Warmer]] = []
+        self.seconds: Dict[str, float] = {}
+        self.ready = False
+        self._started = False
+        # _lock guards _started and is only held briefly, so probes never
+        # wait for warm-up; _run_lock serializes warm-up runs
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+
+    def warmer(self, name: str) -> Callable[[Warmer], Warmer]:
+        """Decorator registering a warm-up step; steps run in registration order."""
+        def register(fn: Warmer) -> Warmer:
+            self.warmers.append((name, fn))
+            return fn
+        return register
+
+    def warm_up(self) -> Dict[str, float]:
+        """
+        Run every warm-up step once and mark the app ready.
+
+        Returns:
+            Seconds spent in each step
+
+        Raises:
+            Exception: Whatever a step raises; the app then stays not
+                ready, so a broken deployment fails its readiness probe
+        """
+        with self._lock:
+            self._started = True
+        with self._run_lock:
+            if not self.ready:
+                for name, fn in self.warmers:
+                    start = time.perf_counter()
+                    fn()
+                    self.seconds[name] = round(time.perf_counter() - start, 4)
+                self.ready = True
+        return dict(self.seconds)
+
+    def start(self) -> None:
+        """Start warm-up in a background thread unless it has started already."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        threading.Thread(
+            target=self.warm_up, name='calculator-warm-up', daemon=True
+        ).start()
+
+
+def install(app: Flask, modules: Tuple[str, ...] = ()) -> Readiness:
+    """
+    Add ``/ready`` and the common warm-up steps to ``app``.
+
+    Args:
+        app: The Flask application
+        modules: Lazily imported modules to load during warm-up; ones
+            that are not installed are skipped
+
+    Returns:
+        The app's ``Readiness``, for registering app-specific steps
+    """
+    readiness = Readiness(app)
+    app.extensions[EXTENSION] = readiness
+
+    @readiness.warmer('modules')
+    def import_modules():
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
+
+    @readiness.warmer('engine')
+    def run_engine():
+        fee_schedules()
+        Calculator.calculate_seller_financing(SAMPLE)
+        Calculator.calculate_investment_metrics(SAMPLE)
+        Calculator.calculate_investment(SAMPLE)
+        Calculator.calculate_closing_costs(SAMPLE)
+
+    @readiness.warmer('pages')
+    def render_pages():
+        # Compiles the templates and fingerprints the static files they link
+        pages = app.jinja_env.list_templates(filter_func=lambda name: name.endswith('.html'))
+        with app.test_request_context():
+            for page in pages:
+                render_template(page)
+
+    @app.route('/ready')
+    def ready():
+        """Report whether this worker has finished warming up."""
+        if readiness.ready:
+            response = jsonify({
+                'status': 'ready',
+                'engine_version': ENGINE_VERSION,
+                'warm_up_seconds': readiness.seconds
+            })
+        else:
+            readiness.start()
+            response = jsonify({'status': 'warming'})
+            response.status_code = 503
+            response.headers['Retry-After'] = '1'
+        response.headers['Cache-Control'] = 'no-store'
+        return response
+
+    return readiness
+
+
+def warm_up(app: Any) -> Optional[Dict[str, float]]:
+    """Warm ``app`` if it was set up with ``install``; None otherwise."""
+    readiness = getattr(app, 'extensions', {}).get(EXTENSION)
+    return readiness.warm_up() if readiness is not None else None
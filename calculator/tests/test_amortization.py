@@ -0,0 +1,70 @@
+"""Test suite for the closed-form amortization engine."""
+
+import pytest
+
+from calculator.core.amortization import (
+    amortization_schedule,
+    balance_after,
+    cumulative_interest,
+    cumulative_principal,
+    level_payment,
+)
+
+
+def _iterate(principal: float, monthly_rate: float, num_payments: int,
+             payments_made: int) -> tuple[float, float]:
+    """Reference month-by-month loop returning (balance, interest paid)."""
+    payment = level_payment(principal, monthly_rate, num_payments)
+    balance = principal
+    interest_paid = 0.0
+    for _ in range(payments_made):
+        interest = balance * monthly_rate
+        interest_paid += interest
+        balance -= payment - interest
+    return balance, interest_paid
+
+
+@pytest.mark.parametrize("principal,annual_rate,years,elapsed", [
+    (200000, 0.05, 30, 60),
+    (370000, 0.015, 30, 132),
+    (250000, 0.045, 15, 179),
+    (100000, 0.0, 30, 120),
+])
+def test_balance_matches_monthly_loop(principal: float, annual_rate: float,
+                                      years: int, elapsed: int) -> None:
+    """Test closed-form balance and interest against the iterative loop."""
+    monthly_rate = annual_rate / 12
+    expected_balance, expected_interest = _iterate(
+        principal, monthly_rate, years * 12, elapsed
+    )
+    balance = balance_after(principal, monthly_rate, years * 12, elapsed)
+    interest = cumulative_interest(principal, monthly_rate, years * 12, elapsed)
+    assert balance == pytest.approx(expected_balance, abs=1e-6)
+    assert interest == pytest.approx(expected_interest, abs=1e-6)
+    assert cumulative_principal(
+        principal, monthly_rate, years * 12, elapsed
+    ) == pytest.approx(principal - expected_balance, abs=1e-6)
+
+
+def test_balance_end_points() -> None:
+    """Test that the balance starts at the principal and ends at zero."""
+    assert balance_after(300000, 0.06 / 12, 360, 0) == pytest.approx(300000)
+    assert balance_after(300000, 0.06 / 12, 360, 360) == pytest.approx(0, abs=1e-6)
+
+
+def test_schedule_is_consistent() -> None:
+    """Test that the vectorized schedule agrees with the point lookups."""
+    schedule = amortization_schedule(200000, 0.05 / 12, 360)
+    assert len(schedule['balance']) == 360
+    assert schedule['balance'][-1] == 0.0
+    assert schedule['balance'][59] == pytest.approx(
+        balance_after(200000, 0.05 / 12, 360, 60)
+    )
+    assert schedule['cumulative_interest'][59] == pytest.approx(
+        cumulative_interest(200000, 0.05 / 12, 360, 60)
+    )
+    assert (schedule['interest'] + schedule['principal']) == pytest.approx(
+        schedule['payment']
+    )
+    with pytest.raises(ValueError, match="must be positive"):
+        amortization_schedule(200000, 0.05 / 12, 0)
@@ -0,0 +1,71 @@
+"""Test suite for the vectorized batch loan calculations."""
+
+import numpy as np
+import pytest
+
+from calculator.core.batch import (
+    balloon_payments,
+    evaluate_loans,
+    loan_balances,
+    monthly_payments,
+)
+from calculator.core.calc import Calculator
+
+
+@pytest.fixture
+def loans() -> dict[str, np.ndarray]:
+    """Random book of loans including a block of zero-rate loans."""
+    rng = np.random.default_rng(42)
+    size = 500
+    rate = rng.uniform(0.0, 0.12, size)
+    rate[:50] = 0.0
+    term = rng.choice([10, 15, 20, 30], size)
+    return {
+        'principal': rng.uniform(10000, 2000000, size).round(2),
+        'rate': rate,
+        'term': term,
+        'years_elapsed': rng.integers(0, term + 1),
+    }
+
+
+def test_payments_match_scalar_to_the_cent(loans: dict[str, np.ndarray]) -> None:
+    """Test batch payments against Calculator.calculate_monthly_payment."""
+    batch = monthly_payments(loans['principal'], loans['rate'], loans['term'])
+    scalar = np.array([
+        Calculator.calculate_monthly_payment(p, r, int(t))
+        for p, r, t in zip(loans['principal'], loans['rate'], loans['term'])
+    ])
+    assert np.array_equal(batch.round(2), scalar.round(2))
+    assert np.max(np.abs(batch - scalar)) < 1e-6
+
+
+def test_balances_match_scalar_to_the_cent(loans: dict[str, np.ndarray]) -> None:
+    """Test batch balances against Calculator.calculate_loan_balance."""
+    batch = loan_balances(
+        loans['principal'], loans['rate'], loans['term'],
+        loans['years_elapsed'] * 12
+    )
+    scalar = np.array([
+        Calculator.calculate_loan_balance(p, r, int(t), int(y))
+        for p, r, t, y in zip(
+            loans['principal'], loans['rate'], loans['term'],
+            loans['years_elapsed']
+        )
+    ])
+    assert np.max(np.abs(batch - scalar)) < 0.005
+
+
+def test_balloon_after_term_is_zero() -> None:
+    """Test that a balloon at or past maturity owes nothing."""
+    balloon = balloon_payments([370000, 370000], 0.015, 30, [132, 400])
+    assert balloon[0] == pytest.approx(253194.54, abs=0.005)
+    assert balloon[1] == pytest.approx(0, abs=1e-6)
+
+
+def test_evaluate_loans_shapes_and_validation() -> None:
+    """Test the combined entry point and vectorized validation."""
+    results = evaluate_loans([100000, 200000], [0.0, 0.05], 30, 60, 120)
+    assert set(results) == {'payment', 'balance', 'balloon'}
+    assert results['balance'][0] == pytest.approx(100000 * (1 - 60 / 360))
+    with pytest.raises(ValueError):
+        monthly_payments([100000, -1], 0.05, 30)
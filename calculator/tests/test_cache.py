@@ -0,0 +1,65 @@
+"""Test suite for the canonicalized result cache."""
+
+import threading
+
+from calculator.core.cache import ResultCache, cache_key
+
+
+def test_equivalent_payloads_share_a_key() -> None:
+    """Test that key order and numeric representation don't matter."""
+    first = {'type': 'investment', 'rate': 5.0, 'purchase_price': 200000, 'state': 'CA '}
+    second = {'purchase_price': 200000.0, 'rate': 5, 'type': 'investment', 'state': 'CA'}
+    assert cache_key(first) == cache_key(second)
+    assert cache_key(first) != cache_key({**first, 'type': 'closing_costs'})
+
+
+def test_distinct_values_keep_distinct_keys() -> None:
+    """Test that numeric-looking strings and large ints are not conflated."""
+    assert cache_key({'zip': '01234'}) != cache_key({'zip': 1234})
+    assert cache_key({'rate': '5'}) != cache_key({'rate': 5})
+    assert cache_key({'id': 2 ** 53 + 1}) != cache_key({'id': 2 ** 53})
+
+
+def test_lru_eviction_per_type() -> None:
+    """Test that each calculation type is bounded independently."""
+    cache = ResultCache(default_size=2, sizes={'closing_costs': 1})
+    for price in (1, 2, 3):
+        cache.put({'type': 'investment', 'purchase_price': price}, price)
+    cache.put({'type': 'closing_costs', 'purchase_price': 1}, 'kept')
+
+    assert cache.get({'type': 'investment', 'purchase_price': 1}) == (False, None)
+    assert cache.get({'type': 'investment', 'purchase_price': 3}) == (True, 3)
+    assert cache.get({'type': 'closing_costs', 'purchase_price': 1}) == (True, 'kept')
+
+    stats = cache.stats()
+    assert stats['by_type']['investment']['evictions'] == 1
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+
+
+def test_ttl_expiry() -> None:
+    """Test that entries older than the TTL are treated as misses."""
+    cache = ResultCache(ttl=0)
+    cache.put({'type': 'investment'}, 1)
+    assert cache.get({'type': 'investment'}) == (False, None)
+    assert cache.stats()['by_type']['investment']['expirations'] == 1
+
+
+def test_get_or_compute_is_thread_safe() -> None:
+    """Test concurrent access keeps the counters consistent."""
+    cache = ResultCache(default_size=8)
+
+    def worker() -> None:
+        for i in range(200):
+            payload = {'type': 'investment', 'purchase_price': i % 16}
+            cache.get_or_compute(payload, lambda: i % 16)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 1600
+    assert stats['by_type']['investment']['size'] <= 8
@@ -0,0 +1,58 @@
+"""Test suite for the streaming bulk calculation CLI."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from calculator.core.calc import Calculator
+from calculator.core.cli import main, run
+
+
+def test_investment_csv_matches_calculator() -> None:
+    """Test that CSV rows are scored like the scalar path."""
+    source = io.StringIO(
+        "purchase_price,down_payment,rate,monthly_rent,vacancy_rate\n"
+        "200000,40000,5,2000,5\n"
+        "abc,40000,5,2000,5\n"
+        "200000,300000,5,2000,5\n"
+        "350000,70000,,2500,\n"
+    )
+    output, errors = io.StringIO(), io.StringIO()
+    counts = run('investment', source, output, errors, chunk_size=2)
+
+    assert counts == {'rows': 4, 'valid': 2, 'invalid': 2}
+    rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+    assert [row['line'] for row in rows] == ['2', '5']
+    expected = Calculator.calculate_investment_metrics({
+        'purchase_price': 200000, 'down_payment': 40000, 'rate': 5,
+        'monthly_rent': 2000, 'vacancy_rate': 5
+    })
+    assert float(rows[0]['noi']) == pytest.approx(expected['noi'])
+
+    reported = [json.loads(line) for line in errors.getvalue().splitlines()]
+    assert reported == [
+        {'line': 3, 'error': "Invalid number for 'purchase_price'"},
+        {'line': 4, 'error': "Down payment cannot exceed purchase price"},
+    ]
+
+
+def test_loan_ndjson_round_trip(tmp_path) -> None:
+    """Test NDJSON input and output through the command line entry point."""
+    source = tmp_path / 'loans.ndjson'
+    source.write_text(
+        '{"principal": 370000, "rate": 0.015, "years": 30, "balloon_months": 132}\n'
+        'not json\n'
+        '{"principal": 100000, "rate": 0, "months_elapsed": 60}\n'
+    )
+    destination = tmp_path / 'scored.ndjson'
+    errors = tmp_path / 'errors.ndjson'
+    assert main(['loan', str(source), '-o', str(destination),
+                 '--errors', str(errors)]) == 0
+
+    rows = [json.loads(line) for line in destination.read_text().splitlines()]
+    assert rows[0]['line'] == 1
+    assert rows[0]['balloon'] == pytest.approx(253194.54, abs=0.01)
+    assert rows[1]['balance'] == pytest.approx(100000 * (1 - 60 / 360))
+    assert json.loads(errors.read_text())['line'] == 2
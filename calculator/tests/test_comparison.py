@@ -0,0 +1,57 @@
+"""Test suite for the vectorized loan comparison engine."""
+
+import numpy as np
+import pytest
+
+from calculator.core.amortization import level_payment
+from calculator.core.comparison import compare_loans, flatten_grid
+
+
+def _payoff_loop(loan_amount: float, rate: float, years: int,
+                 extra: float) -> tuple[int, float]:
+    """Reference loop used by the Tk comparison tab before the engine."""
+    payment = level_payment(loan_amount, rate / 12, years * 12) + extra
+    balance = loan_amount
+    months = 0
+    total_interest = 0.0
+    while balance > 0 and months < years * 12:
+        interest = balance * (rate / 12)
+        total_interest += interest
+        balance -= payment - interest
+        months += 1
+    return months, total_interest
+
+
+@pytest.mark.parametrize("extra", [0.0, 150.0, 1000.0])
+def test_payoff_matches_loop(extra: float) -> None:
+    """Test NPER-based payoff against the month-by-month loop."""
+    grid = flatten_grid(compare_loans(
+        420000, [0.12, 0.2, 0.3], [0.015, 0.02, 0.065], [15, 30], [extra]
+    ))
+    for i in range(len(grid['loan_amount'])):
+        months, interest = _payoff_loop(
+            grid['loan_amount'][i], grid['rate'][i],
+            int(grid['term_years'][i]), extra
+        )
+        assert grid['months_to_payoff'][i] == months
+        assert grid['total_interest'][i] == pytest.approx(interest, abs=0.01)
+
+
+def test_pmi_and_points() -> None:
+    """Test PMI only applies below the threshold and drops off at 80% LTV."""
+    grid = compare_loans(400000, [0.1, 0.2], [0.06], points=1.0)
+    monthly_pmi = grid['monthly_pmi'][:, 0, 0, 0]
+    assert monthly_pmi[0] == pytest.approx(360000 * 0.005 / 12)
+    assert monthly_pmi[1] == 0
+    assert 0 < grid['pmi_months'][0, 0, 0, 0] < 360
+    assert grid['points_cost'][0, 0, 0, 0] == pytest.approx(3600)
+
+
+def test_large_grid_shape() -> None:
+    """Test that a 50 x 50 grid is evaluated in one call."""
+    grid = compare_loans(
+        500000, np.linspace(0.05, 0.5, 50), np.linspace(0.0, 0.1, 50),
+        [15, 30], [0, 250]
+    )
+    assert grid['total_interest'].shape == (50, 50, 2, 2)
+    assert np.all(np.isfinite(grid['total_interest']))
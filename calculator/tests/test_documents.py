@@ -0,0 +1,205 @@
+"""Test suite for background document generation."""
+
+import io
+import json
+import os
+import threading
+import zipfile
+
+import pytest
+from docx import Document
+
+import calculator.web.app as web_app
+from calculator.web import documents
+from calculator.web.documents import DocumentJobs, JobQueueFull
+
+
+def write_template(path, text: str) -> None:
+    document = Document()
+    document.add_paragraph(text)
+    document.save(path)
+
+
+def document_text(path) -> str:
+    return '\n'.join(paragraph.text for paragraph in Document(path).paragraphs)
+
+
+@pytest.fixture
+def jobs(tmp_path):
+    (tmp_path / 'templates').mkdir()
+    write_template(tmp_path / 'templates' / 'lease.docx', 'Tenant: {{ tenant }}')
+    jobs = DocumentJobs(tmp_path / 'templates', tmp_path / 'generated')
+    yield jobs
+    jobs.shutdown()
+
+
+def test_identical_requests_share_output(jobs) -> None:
+    """Test content-addressed outputs and template caching."""
+    job = jobs.submit('lease.docx', {'tenant': 'Ada'})
+    done = jobs.status(job['job_id'], wait=10)
+    assert done['status'] == 'done'
+    assert document_text(jobs.output_dir / done['file']) == 'Tenant: Ada'
+
+    again = jobs.submit('lease.docx', {'tenant': 'Ada'})
+    assert again == done
+    other = jobs.submit('lease.docx', {'tenant': 'Grace'})
+    assert other['job_id'] != job['job_id']
+    jobs.status(other['job_id'], wait=10)
+
+    assert jobs.templates.loads == 1
+    assert len(list(jobs.output_dir.glob('*.docx'))) == 2
+
+
+def test_template_change_invalidates_cache(jobs) -> None:
+    """Test that editing a template on disk is picked up."""
+    first = jobs.submit('lease.docx', {'tenant': 'Ada'})
+    jobs.status(first['job_id'], wait=10)
+
+    path = jobs.templates.path('lease.docx')
+    write_template(path, 'Lessee: {{ tenant }}')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    second = jobs.submit('lease.docx', {'tenant': 'Ada'})
+    done = jobs.status(second['job_id'], wait=10)
+    assert second['job_id'] != first['job_id']
+    assert jobs.templates.loads == 2
+    assert document_text(jobs.output_dir / done['file']) == 'Lessee: Ada'
+
+
+def test_missing_templates_and_full_queue(tmp_path, jobs) -> None:
+    """Test that unknown or escaping names fail and the queue is bounded."""
+    write_template(tmp_path / 'secret.docx', 'outside')
+    for name in ('missing.docx', '../secret.docx'):
+        with pytest.raises(FileNotFoundError):
+            jobs.submit(name, {})
+
+    jobs.max_pending = 0
+    with pytest.raises(JobQueueFull):
+        jobs.submit('lease.docx', {'tenant': 'Ada'})
+
+
+def test_endpoints_poll_for_completion(jobs, monkeypatch) -> None:
+    """Test the submit and long-poll endpoints."""
+    monkeypatch.setattr(web_app, 'document_jobs', jobs)
+    client = web_app.app.test_client()
+
+    response = client.post('/generate-document',
+                           json={'template': 'lease.docx', 'data': {'tenant': 'Ada'}})
+    assert response.status_code in (200, 202)
+    job_id = response.get_json()['job_id']
+
+    response = client.get(f'/generate-document/{job_id}?wait=10')
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body['status'] == 'done'
+    assert body['file_url'].endswith(f'-{job_id}.docx')
+
+    response = client.post('/generate-document',
+                           json={'template': 'lease.docx', 'data': {'tenant': 'Ada'}})
+    assert response.status_code == 200
+    assert response.get_json()['file_url'] == body['file_url']
+
+    assert client.get('/generate-document/unknown').status_code == 404
+    # Patterns must not match other users' documents
+    for pattern in ('*', job_id[:8] + '*', '[0-9a-f]' * 32):
+        assert client.get(f'/generate-document/{pattern}').status_code == 404
+
+    # Pruned job records are found again from their exact file name
+    jobs._jobs.clear()
+    assert jobs.status(job_id)['file'] == f'lease-{job_id}.docx'
+    assert jobs.status(job_id.upper()) is None
+    response = client.post('/generate-document', json={'template': 'nope.docx'})
+    assert response.status_code == 404
+
+    jobs.max_pending = 0
+    response = client.post('/generate-document',
+                           json={'template': 'lease.docx', 'data': {'tenant': 'Bob'}})
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '5'
+
+
+def test_other_workers_see_job_state(jobs, monkeypatch) -> None:
+    """Test that another process's DocumentJobs reports pending, done and failed jobs."""
+    other = DocumentJobs(jobs.templates.directory, jobs.output_dir)
+    release = threading.Event()
+    render = documents.render_docx
+
+    def slow_render(template, context, output_path):
+        release.wait(10)
+        if context['tenant'] == 'Bad':
+            raise ValueError("cannot render")
+        render(template, context, output_path)
+
+    monkeypatch.setattr(documents, 'render_docx', slow_render)
+    job = jobs.submit('lease.docx', {'tenant': 'Ada'})
+    failing = jobs.submit('lease.docx', {'tenant': 'Bad'})
+    assert other.status(job['job_id'])['status'] == 'pending'
+    assert other.status(job['job_id'], wait=0.05)['status'] == 'pending'
+
+    release.set()
+    assert other.status(job['job_id'], wait=10) == {
+        'job_id': job['job_id'], 'status': 'done', 'file': job['file']
+    }
+    assert other.status(failing['job_id'], wait=10)['error'] == 'cannot render'
+    assert sorted(path.suffix for path in jobs.output_dir.iterdir()) == ['.docx', '.failed']
+
+    monkeypatch.setattr(documents, 'render_docx', render)
+    retried = other.submit('lease.docx', {'tenant': 'Bad'})
+    assert jobs.status(retried['job_id'], wait=10)['status'] == 'done'
+    other.shutdown()
+
+
+def test_bulk_documents_stream_a_zip(jobs, monkeypatch) -> None:
+    """Test mail merge of many records, with bad records listed."""
+    monkeypatch.setattr(web_app, 'document_jobs', jobs)
+    monkeypatch.setattr(web_app, 'BULK_DOCUMENT_WORKERS', 2)
+    client = web_app.app.test_client()
+    records = [{'tenant': f'Tenant {i}'} for i in range(12)] + ['not a record']
+
+    response = client.post('/generate-documents',
+                           json={'template': 'lease.docx', 'records': records})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/zip'
+
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        names = archive.namelist()
+        assert sorted(names) == sorted(
+            [f'lease-{i:05d}.docx' for i in range(12)] + ['errors.ndjson']
+        )
+        assert json.loads(archive.read('errors.ndjson')) == {
+            'index': 12, 'error': 'Record must be a JSON object'
+        }
+        assert document_text(io.BytesIO(archive.read('lease-00007.docx'))) == 'Tenant: Tenant 7'
+
+    response = client.post('/generate-documents',
+                           json={'template': 'missing.docx', 'records': []})
+    assert response.status_code == 404
+
+
+def test_bulk_renders_share_bounded_slots(jobs, monkeypatch) -> None:
+    """Test that bulk pools take a slot, release it and never fork."""
+    assert documents._pool_context().get_start_method() != 'fork'
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(documents, '_bulk_renders', slots)
+    template, _ = jobs.templates.get('lease.docx')
+
+    renders = documents.render_many(template, enumerate([{'tenant': 'Ada'}] * 3), 1)
+    assert next(renders)[2] is None
+    assert not slots.acquire(blocking=False)
+    renders.close()
+    assert slots.acquire(blocking=False)
+    slots.release()
+
+
+def test_bulk_cli(jobs, tmp_path) -> None:
+    """Test the mail-merge command line over a CSV file."""
+    source = tmp_path / 'deals.csv'
+    source.write_text('tenant\nAda\nGrace\n')
+    output = tmp_path / 'leases.zip'
+    assert documents.main([
+        str(jobs.templates.path('lease.docx')), str(source), '-o', str(output),
+        '--workers', '1'
+    ]) == 0
+    with zipfile.ZipFile(output) as archive:
+        assert archive.namelist() == ['lease-00000.docx', 'lease-00001.docx']
@@ -0,0 +1,76 @@
+"""Test suite for the exact integer-cents amortization mode."""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from calculator.core.exact import (
+    amortize_cents,
+    cents_schedule,
+    evaluate_loans_exact,
+    to_cents,
+)
+
+
+def _decimal_ledger(principal: str, annual_rate: str, years: int,
+                    payment: str) -> tuple[int, int, int]:
+    """Reference Decimal ledger returning (total interest, total paid, final)."""
+    cent = Decimal('0.01')
+    balance = Decimal(principal)
+    monthly_rate = Decimal(annual_rate) / 12
+    total_interest = total_paid = Decimal(0)
+    paid = Decimal(0)
+    for month in range(1, years * 12 + 1):
+        interest = (balance * monthly_rate).quantize(cent, ROUND_HALF_UP)
+        due = balance + interest
+        paid = due if month == years * 12 or due <= Decimal(payment) else Decimal(payment)
+        balance = due - paid
+        total_interest += interest
+        total_paid += paid
+        if balance == 0:
+            break
+    return int(total_interest * 100), int(total_paid * 100), int(paid * 100)
+
+
+@pytest.mark.parametrize("principal,rate,years", [
+    ('370000.00', '0.015', 30),
+    ('300000.00', '0.06', 30),
+    ('250000.00', '0.045', 15),
+    ('123456.78', '0.06125', 20),
+])
+def test_matches_decimal_ledger(principal: str, rate: str, years: int) -> None:
+    """Test the integer pipeline against a Decimal month-by-month ledger."""
+    result = amortize_cents(float(principal), float(rate), years)
+    payment = f"{result['payment'][()] / 100:.2f}"
+    total_interest, total_paid, final = _decimal_ledger(
+        principal, rate, years, payment
+    )
+    assert result['balance'][()] == 0
+    assert result['total_interest'][()] == total_interest
+    assert result['total_paid'][()] == total_paid
+    assert result['final_payment'][()] == final
+    assert total_paid == to_cents(float(principal)) + total_interest
+
+
+def test_schedule_ties_out() -> None:
+    """Test that the single-loan ledger sums to the batch totals."""
+    schedule = cents_schedule(300000, 0.06, 30)
+    totals = amortize_cents(300000, 0.06, 30)
+    assert schedule['balance'][-1] == 0
+    assert schedule['interest'].sum() == totals['total_interest']
+    assert schedule['principal'].sum() == 30000000
+
+
+def test_balloon_follows_the_ledger() -> None:
+    """Test that the exact balloon is the ledger balance, not the float one."""
+    exact = evaluate_loans_exact([370000, 200000], [0.015, 0.0], 30, 0, 132)
+    schedule = cents_schedule(370000, 0.015, 30)
+    assert exact['payment'][0] == pytest.approx(1276.94)
+    assert exact['balloon'][0] == schedule['balance'][131] / 100
+    # The payment rounds down to the cent, so the ledger balloon runs higher.
+    assert exact['balloon'][0] == pytest.approx(253194.54, abs=1.0)
+    assert exact['balloon'][1] == pytest.approx(
+        200000 - 132 * 555.56, abs=0.01
+    )
+    assert np.all(exact['balance'] == [370000, 200000])
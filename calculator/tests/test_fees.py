@@ -0,0 +1,83 @@
+"""Test suite for closing cost fee schedules."""
+
+import numpy as np
+import pytest
+
+from calculator.core import batch
+from calculator.core.bulk import evaluate_chunk
+from calculator.core.calc import Calculator
+from calculator.core.fees import fee_schedules, load
+
+CSV = """state,county,origination_rate,appraisal,credit_report,tax_service,flood_cert,recording,title_minimum,title_tiers,transfer_tax_brackets,realtor_rate,seller_other_fees
+,,0.01,500,50,75,25,350,0,:0.005,:0.001,0.06,500
+TX,,,,,,,150,238,100000:0.00832;1000000:0.00527;:0.00433,:0,,
+TX,Harris,,,,,,200,,,,,
+"""
+
+
+def test_default_schedule_keeps_national_estimate() -> None:
+    """Test that properties without a state get the original constants."""
+    results = Calculator.calculate_closing_costs(
+        {'purchase_price': 200000, 'loan_amount': 160000}
+    )
+    assert results['total_closing_costs'] == 3600
+    assert results['itemized_costs']['recording'] == 350
+    assert results['seller_costs'] == {
+        'realtor_fees': 12000, 'transfer_tax': 200, 'seller_other_fees': 500
+    }
+    assert fee_schedules() is fee_schedules()
+
+
+def test_counties_inherit_from_states() -> None:
+    """Test lookups, inheritance and tiered title premiums."""
+    schedules = fee_schedules()
+    assert schedules.lookup('tx', ' harris ') == schedules.lookup('TX', 'Harris')
+    assert schedules.lookup('ZZ') == schedules.lookup() == schedules.lookup('ZZ', 'Nowhere')
+    assert schedules.get('TX', 'Harris')['recording'] == 200
+    assert schedules.get('TX', 'Harris')['title_minimum'] == 238
+    assert schedules.get('TX', 'Travis')['recording'] == 150
+
+    results = Calculator.calculate_closing_costs(
+        {'purchase_price': 200000, 'loan_amount': 0, 'state': 'TX', 'county': 'Harris'}
+    )
+    assert results['itemized_costs']['title_insurance'] == pytest.approx(832 + 527)
+    assert results['seller_costs']['transfer_tax'] == 0
+
+
+def test_csv_schedules_match_json(tmp_path) -> None:
+    """Test the CSV layout and bracket validation."""
+    path = tmp_path / 'fees.csv'
+    path.write_text(CSV)
+    schedules = load(path)
+    for state, county in (('', ''), ('TX', ''), ('TX', 'Harris')):
+        assert schedules.get(state, county) == fee_schedules().get(state, county)
+
+    path.write_text(CSV.replace(':0.005', '100000:0.005'))
+    with pytest.raises(ValueError, match="last bracket"):
+        load(path)
+
+
+def test_batches_use_each_rows_schedule() -> None:
+    """Test vectorized and bulk closing costs against the scalar path."""
+    schedules = fee_schedules()
+    records = [
+        {'purchase_price': 150000, 'loan_amount': 120000, 'state': 'TX'},
+        {'purchase_price': 2500000, 'loan_amount': 2000000, 'state': 'FL',
+         'county': 'Miami-Dade'},
+        {'purchase_price': 420000, 'loan_amount': 370000},
+        {'purchase_price': 800000, 'loan_amount': 600000, 'state': 'CA'},
+    ]
+    results = batch.closing_costs({
+        'purchase_price': np.array([r['purchase_price'] for r in records]),
+        'loan_amount': np.array([r['loan_amount'] for r in records]),
+        'schedule': schedules.lookup_many(records),
+    })
+    _, columns, errors = evaluate_chunk('closing_costs', list(enumerate(records)))
+    assert errors == []
+    for i, record in enumerate(records):
+        expected = Calculator.calculate_closing_costs(record)
+        assert results['total_closing_costs'][i] == pytest.approx(expected['total_closing_costs'])
+        assert results['seller_costs']['transfer_tax'][i] == pytest.approx(
+            expected['seller_costs']['transfer_tax'])
+        assert columns['title_insurance'][i] == pytest.approx(
+            expected['itemized_costs']['title_insurance'])
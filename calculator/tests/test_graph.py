@@ -0,0 +1,92 @@
+"""Test suite for the incremental formula graph."""
+
+import numpy as np
+import pytest
+
+from calculator.core.batch import investment_metrics
+from calculator.core.calc import Calculator
+from calculator.core.graph import (
+    INVESTMENT_METRICS, FormulaGraph, Node, investment_evaluation
+)
+
+PROPERTY = {
+    'purchase_price': 250000, 'down_payment': 50000, 'rate': 6.5, 'loan_term': 30,
+    'monthly_rent': 2200, 'vacancy_rate': 5, 'other_income': 50,
+    'property_tax': 3000, 'insurance': 1200, 'maintenance': 1500,
+    'utilities': 600, 'mgmt_fee': 8
+}
+
+
+def test_matches_scalar_calculator() -> None:
+    """Test that the graph agrees with Calculator.calculate_investment_metrics."""
+    session = investment_evaluation({**PROPERTY, 'type': 'investment'})
+    expected = Calculator.calculate_investment_metrics(PROPERTY)
+    results = session.results(INVESTMENT_METRICS)
+    assert results == pytest.approx(expected)
+    assert all(isinstance(value, float) for value in results.values())
+
+
+def test_rate_change_recomputes_financing_only() -> None:
+    """Test that editing the rate leaves income and expenses cached."""
+    session = investment_evaluation(PROPERTY)
+    session.results()
+
+    session.update({'rate': 7})
+    session.results()
+    assert sorted(session.recomputed) == [
+        'annual_cash_flow', 'annual_debt_service', 'cash_on_cash', 'monthly_payment'
+    ]
+
+    session.update({'rate': 7, 'utilities': 600})
+    session.results()
+    assert session.recomputed == []
+
+    session.update({'vacancy_rate': 10})
+    assert session.get('cap_rate') == pytest.approx(
+        Calculator.calculate_investment_metrics({**PROPERTY, 'rate': 7, 'vacancy_rate': 10})
+        ['cap_rate']
+    )
+    assert 'monthly_payment' not in session.recomputed
+
+
+def test_portfolio_shared_assumption() -> None:
+    """Test batch re-evaluation when one assumption changes for every property."""
+    rng = np.random.default_rng(18)
+    count = 1000
+    columns = {
+        'purchase_price': rng.uniform(100000, 900000, count),
+        'monthly_rent': rng.uniform(800, 6000, count),
+        'vacancy_rate': rng.uniform(0, 15, count),
+        'property_tax': rng.uniform(1000, 9000, count),
+        'rate': 6.0,
+    }
+    columns['down_payment'] = columns['purchase_price'] * 0.2
+    session = investment_evaluation(columns)
+    session.results()
+    noi = session.values['noi']
+
+    session.update({'rate': 5.25})
+    results = session.results(INVESTMENT_METRICS)
+    assert 'noi' not in session.recomputed
+    assert session.values['noi'] is noi
+    expected = investment_metrics({**columns, 'rate': 5.25})
+    for name in INVESTMENT_METRICS:
+        np.testing.assert_allclose(results[name], expected[name])
+
+
+def test_invalid_update_keeps_state() -> None:
+    """Test that rejected inputs leave the evaluation unchanged."""
+    session = investment_evaluation(PROPERTY)
+    before = session.get('noi')
+    with pytest.raises(ValueError, match="Vacancy rate"):
+        session.update({'vacancy_rate': 150})
+    with pytest.raises(KeyError):
+        session.update({'vacancy': 10})
+    assert session.get('noi') == before
+    assert session.recomputed == []
+
+
+def test_graph_rejects_undeclared_dependencies() -> None:
+    """Test that nodes must be declared after what they use."""
+    with pytest.raises(ValueError, match="undefined"):
+        FormulaGraph({'a': 0.0}, [Node('c', ('b',), abs), Node('b', ('a',), abs)])
@@ -0,0 +1,93 @@
+"""Test suite for static fingerprints and calculation ETags."""
+
+import json
+
+from flask import url_for
+
+from calculator.core import calc, fees
+from calculator.core.cache import ResultCache
+from calculator.core.calc import Calculator
+from calculator.web import caching
+from calculator.web.app import app
+
+INVESTMENT = {
+    'type': 'investment', 'purchase_price': 250000, 'down_payment': 50000,
+    'rate': 6, 'monthly_rent': 2200, 'property_tax': 3000, 'insurance': 1000
+}
+
+
+def test_static_urls_are_fingerprinted() -> None:
+    """Test that versioned static files are immutable and others revalidate."""
+    with app.test_request_context():
+        url = url_for('static', filename='css/styles.css')
+    assert '?v=' in url
+
+    client = app.test_client()
+    response = client.get(url)
+    assert response.status_code == 200
+    assert 'immutable' in response.headers['Cache-Control']
+
+    response = client.get('/static/css/styles.css')
+    assert response.headers['Cache-Control'] == 'no-cache'
+    response = client.get('/static/css/styles.css?v=stale')
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+
+def test_calculation_etag_is_canonical(monkeypatch) -> None:
+    """Test strong ETags, 304s without computing, and engine versioning."""
+    client = app.test_client()
+    response = client.post('/calculate', json=INVESTMENT)
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+    assert not etag.startswith('W/')
+    assert response.headers['Cache-Control'] == 'no-cache'
+
+    reordered = dict(reversed(list(INVESTMENT.items())))
+    reordered['rate'] = 6.0
+    assert client.post('/calculate', json=reordered).headers['ETag'] == etag
+
+    def fail(data):
+        raise AssertionError("computed despite a matching ETag")
+
+    monkeypatch.setattr(Calculator, 'calculate_investment_metrics', staticmethod(fail))
+    response = client.post('/calculate', json=INVESTMENT, headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+    monkeypatch.setattr(caching, 'ENGINE_VERSION', calc.ENGINE_VERSION + '-next')
+    assert caching.calculation_etag(INVESTMENT) != etag.strip('"')
+
+
+def test_fee_schedules_version_closing_costs(tmp_path, monkeypatch) -> None:
+    """Test that new fee schedules change closing cost ETags and cache keys."""
+    closing = {'type': 'closing_costs', 'purchase_price': 300000, 'loan_amount': 240000}
+    cache = ResultCache()
+    cache.put(closing, 'old fees')
+    etags = {payload['type']: caching.calculation_etag(payload)
+             for payload in (closing, INVESTMENT)}
+
+    schedules = json.loads(fees.DEFAULT_PATH.read_text())
+    schedules['default']['appraisal'] += 100
+    path = tmp_path / 'fees.json'
+    path.write_text(json.dumps(schedules))
+    monkeypatch.setenv('CALCULATOR_FEE_SCHEDULES', str(path))
+    fees.fee_schedules.cache_clear()
+    try:
+        assert caching.calculation_etag(closing) != etags['closing_costs']
+        assert caching.calculation_etag(INVESTMENT) == etags['investment']
+        assert cache.get(closing) == (False, None)
+    finally:
+        monkeypatch.delenv('CALCULATOR_FEE_SCHEDULES')
+        fees.fee_schedules.cache_clear()
+    assert caching.calculation_etag(closing) == etags['closing_costs']
+    assert cache.get(closing) == (True, 'old fees')
+
+
+def test_errors_are_not_stored() -> None:
+    """Test that failed calculations carry no ETag and are not cached."""
+    response = app.test_client().post(
+        '/calculate', json={**INVESTMENT, 'vacancy_rate': 150}
+    )
+    assert response.status_code == 400
+    assert 'ETag' not in response.headers
+    assert response.headers['Cache-Control'] == 'no-store'
@@ -0,0 +1,74 @@
+"""Test suite for live recalculation helpers."""
+
+import random
+
+from calculator.core.live import Debouncer, line_edits
+
+
+class FakeClock:
+    """``after``/``after_cancel`` pair driven by an explicit clock."""
+
+    def __init__(self):
+        self.now = 0
+        self.timers = {}
+        self.next_id = 0
+
+    def after(self, delay, callback):
+        self.next_id += 1
+        self.timers[self.next_id] = (self.now + delay, callback)
+        return self.next_id
+
+    def after_cancel(self, handle):
+        del self.timers[handle]
+
+    def advance(self, ms: int) -> None:
+        self.now += ms
+        for handle, (due, callback) in sorted(self.timers.items()):
+            if due <= self.now:
+                del self.timers[handle]
+                callback()
+
+
+def test_debouncer_coalesces_bursts() -> None:
+    """Test that a burst of keystrokes produces a single call."""
+    clock = FakeClock()
+    debouncer = Debouncer(clock.after, clock.after_cancel, delay=300)
+    calls = []
+
+    for _ in range(10):
+        debouncer.call('live', lambda: calls.append(clock.now))
+        clock.advance(100)
+    assert calls == []
+    clock.advance(200)
+    assert calls == [1200]
+    assert clock.timers == {}
+
+    debouncer.call('live', lambda: calls.append('dropped'))
+    debouncer.cancel()
+    clock.advance(1000)
+    assert calls == [1200]
+
+
+def apply(lines: list, edits: list) -> list:
+    lines = list(lines)
+    for start, stop, replacement in edits:
+        lines[start:stop] = replacement
+    return lines
+
+
+def test_line_edits_rebuild_new_text() -> None:
+    """Test that applying the edits in order turns old lines into new ones."""
+    rng = random.Random(17)
+    for _ in range(200):
+        old = [rng.choice('abcde') for _ in range(rng.randrange(12))]
+        new = [rng.choice('abcde') for _ in range(rng.randrange(12))]
+        assert apply(old, line_edits(old, new)) == new
+
+
+def test_line_edits_touch_only_changed_lines() -> None:
+    """Test that one changed figure in a summary is a one-line edit."""
+    old = [f"Line {i}: {i * 100}" for i in range(50)]
+    new = list(old)
+    new[20] = "Line 20: 2001"
+    assert line_edits(old, new) == [(20, 21, ["Line 20: 2001"])]
+    assert line_edits(old, old) == []
@@ -0,0 +1,52 @@
+"""Test suite for the multi-year pro forma projection engine."""
+
+import numpy as np
+import pytest
+
+from calculator.core.calc import Calculator
+from calculator.core.projection import project_investments
+
+PORTFOLIO = {
+    'purchase_price': [200000, 420000, 350000],
+    'down_payment': [40000, 50000, 70000],
+    'rate': [5, 1.5, 0],
+    'loan_term': [30, 30, 15],
+    'monthly_rent': [2000, 2500, 2200],
+    'vacancy_rate': [5, 5, 8],
+    'property_tax': [2400, 3000, 4200],
+    'insurance': [900, 1200, 1800],
+    'mgmt_fee': [8, 10, 0],
+}
+
+
+def test_first_year_matches_investment_metrics() -> None:
+    """Test that year 1 reproduces the single-property metrics."""
+    pro_forma = project_investments(PORTFOLIO, years=3)
+    for i in range(3):
+        record = {key: values[i] for key, values in PORTFOLIO.items()}
+        metrics = Calculator.calculate_investment_metrics(record)
+        assert pro_forma['noi'][0, i] == pytest.approx(metrics['noi'])
+        assert pro_forma['cash_flow'][0, i] == pytest.approx(
+            metrics['annual_cash_flow']
+        )
+
+
+def test_equity_reflects_loan_paydown() -> None:
+    """Test that balances follow the amortization schedule."""
+    pro_forma = project_investments(PORTFOLIO, years=5)
+    expected = Calculator.calculate_loan_balance(160000, 0.05, 30, 5)
+    assert pro_forma['loan_balance'][4, 0] == pytest.approx(expected)
+    assert pro_forma['equity'][4, 0] == pytest.approx(
+        200000 * 1.03 ** 5 - expected
+    )
+    assert np.all(np.diff(pro_forma['loan_balance'], axis=0) < 0)
+
+
+def test_debt_service_stops_after_payoff() -> None:
+    """Test a 40-year projection past the end of a 15-year loan."""
+    pro_forma = project_investments(PORTFOLIO, years=40)
+    assert pro_forma['equity'].shape == (40, 3)
+    assert np.all(pro_forma['debt_service'][15:, 2] == 0)
+    assert pro_forma['loan_balance'][14, 2] == pytest.approx(0)
+    with pytest.raises(ValueError):
+        project_investments(PORTFOLIO, years=41)
@@ -0,0 +1,70 @@
+"""Test suite for the vectorized IRR / NPV / equity multiple solver."""
+
+import numpy as np
+import pytest
+
+from calculator.core.calc import Calculator
+from calculator.core.projection import project_investments
+from calculator.core.returns import (
+    evaluate_returns,
+    investment_cash_flows,
+    irr,
+    npv,
+    pro_forma_cash_flows,
+)
+
+
+def test_irr_zeroes_npv_for_many_rows() -> None:
+    """Test that every solved IRR is a root of its row's NPV."""
+    rng = np.random.default_rng(3)
+    flows = np.column_stack([
+        -rng.uniform(50000, 150000, 20000),
+        rng.uniform(-5000, 20000, (20000, 9)),
+        rng.uniform(100000, 300000, 20000),
+    ])
+    rates = irr(flows)
+    assert np.all(np.isfinite(rates))
+    residual = np.array([npv(row, rate)[0, 0] for row, rate in
+                         zip(flows[:200], rates[:200])])
+    assert np.max(np.abs(residual)) < 1e-4
+
+
+def test_irr_solves_rows_independently() -> None:
+    """Test vectorized IRR, including a row that needs the fallback."""
+    rates = irr([[-100, 110, 0], [-100, 0, 121], [-100, 230, -132], [100, 50, 0]])
+    assert rates[0] == pytest.approx(0.1)
+    assert rates[1] == pytest.approx(0.1)
+    assert rates[2] == pytest.approx(0.1) or rates[2] == pytest.approx(0.2)
+    assert np.isnan(rates[3])
+
+
+def test_cash_flows_from_investment_metrics() -> None:
+    """Test building rows from calculate_investment_metrics results."""
+    metrics = [
+        Calculator.calculate_investment_metrics({
+            'purchase_price': 200000, 'down_payment': 40000, 'rate': 5,
+            'monthly_rent': rent, 'vacancy_rate': 5, 'loan_term': 30
+        })
+        for rent in (1500, 2000)
+    ]
+    flows = investment_cash_flows(metrics, 40000, [60000, 60000], years=5)
+    assert flows.shape == (2, 6)
+    assert flows[0, 0] == -40000
+    assert flows[1, 5] == pytest.approx(metrics[1]['annual_cash_flow'] + 60000)
+
+    results = evaluate_returns(flows, [0.05, 0.1])
+    assert results['npv'].shape == (2, 2)
+    assert list(results['rank']) == [1, 0]
+    assert np.all(results['equity_multiple'] > 1)
+
+
+def test_cash_flows_from_pro_forma() -> None:
+    """Test building rows from a projected pro forma."""
+    pro_forma = project_investments({
+        'purchase_price': [200000, 300000], 'down_payment': [40000, 60000],
+        'rate': 5, 'monthly_rent': [2000, 2200], 'vacancy_rate': 5
+    }, years=7)
+    flows = pro_forma_cash_flows(pro_forma, [40000, 60000])
+    assert flows.shape == (2, 8)
+    assert flows[0, 1] == pytest.approx(pro_forma['cash_flow'][0, 0])
+    assert np.all(np.isfinite(irr(flows)))
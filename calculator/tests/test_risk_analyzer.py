@@ -0,0 +1,87 @@
+"""Test suite for the strategy risk analyzer."""
+
+import numpy as np
+import pytest
+
+from calculator.core.risk_analyzer import (
+    CATEGORIES, FACTORS, STRATEGIES, RiskAnalyzer, property_columns
+)
+from calculator.web.app import app
+
+STRONG = {
+    'purchase_price': 300000, 'down_payment': 120000, 'rate': 5,
+    'monthly_rent': 3200, 'vacancy_rate': 5, 'property_tax': 3600, 'insurance': 1200
+}
+WEAK = {**STRONG, 'down_payment': 15000, 'rate': 8, 'monthly_rent': 2000}
+
+
+def test_deal_numbers_drive_financial_risk() -> None:
+    """Test that leverage, DSCR and cash-on-cash move the scores."""
+    analyzer = RiskAnalyzer()
+    strong, weak = analyzer.compare_strategies([STRONG, WEAK])
+    assert strong['metrics']['ltv'] == pytest.approx(0.6)
+    assert weak['metrics']['dscr'] < 1 < strong['metrics']['dscr']
+
+    def financial(result, strategy):
+        item = next(item for item in result['ranking'] if item['strategy'] == strategy)
+        return item['categories']['financial']['score']
+
+    for strategy in STRATEGIES:
+        assert financial(weak, strategy) > financial(strong, strategy)
+    # Taking over the loan exposes subject-to buyers to leverage most
+    assert financial(weak, 'subject-to') > financial(weak, 'lease-option')
+    assert [item['strategy'] for item in weak['ranking']][-1] == 'subject-to'
+
+
+def test_vectorized_scores_match_single_property() -> None:
+    """Test that scoring a portfolio equals scoring each property alone."""
+    analyzer = RiskAnalyzer()
+    rng = np.random.default_rng(22)
+    properties = [
+        {**STRONG, 'down_payment': float(down), 'monthly_rent': float(rent)}
+        for down, rent in zip(rng.uniform(0, 150000, 50), rng.uniform(1200, 4000, 50))
+    ]
+    portfolio = analyzer.score(property_columns(properties))
+    assert portfolio['factors'].shape == (len(STRATEGIES), 50, len(FACTORS))
+    assert portfolio['categories'].shape == (len(STRATEGIES), 50, len(CATEGORIES))
+    for p in (0, 17, 49):
+        single = analyzer.score(property_columns([properties[p]]))
+        np.testing.assert_allclose(portfolio['overall'][:, p], single['overall'][:, 0])
+
+
+def test_weights_are_applied() -> None:
+    """Test that factor weights change category scores."""
+    default = RiskAnalyzer()
+    compliance_heavy = RiskAnalyzer({'compliance': 10})
+    assert default.analyze_legal_risks('lease-option', {}) == 'medium'
+    assert compliance_heavy.analyze_legal_risks('subject-to', {}) == 'high'
+    risks = {'compliance': 0.9, 'documentation': 0.1}
+    assert default.calculate_risk_level(risks) == 'medium'
+    assert compliance_heavy.calculate_risk_level(risks) == 'high'
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        default.score(property_columns([STRONG]), ['flip'])
+
+
+def test_endpoint_ranks_strategies() -> None:
+    """Test /analyze-risks returns a ranked comparison in one call."""
+    client = app.test_client()
+    response = client.post('/analyze-risks', json={'property': WEAK, 'strategy': 'wrap'})
+    body = response.get_json()
+    scores = [item['score'] for item in body['ranking']]
+    assert scores == sorted(scores)
+    assert {item['strategy'] for item in body['ranking']} == set(STRATEGIES)
+    wrap = next(item for item in body['ranking'] if item['strategy'] == 'wrap')
+    assert body['financial'] == wrap['categories']['financial']['level']
+
+    response = client.post('/analyze-risks', json={
+        'properties': [STRONG, WEAK], 'strategies': ['master-lease', 'subject-to']
+    })
+    assert len(response.get_json()['properties']) == 2
+
+    response = client.post('/analyze-risks', json={'property': {**WEAK, 'vacancy_rate': 150}})
+    assert response.status_code == 400
+
+    for body in ({'strategies': 'wrap'}, {'strategies': [['wrap']]}, {'strategy': ['wrap']}):
+        response = client.post('/analyze-risks', json={'property': WEAK, **body})
+        assert response.status_code == 400
+        assert 'Expected strateg' in response.get_json()['error']
@@ -0,0 +1,50 @@
+"""Test suite for the scenario comparison table model."""
+
+from calculator.core.scenario_view import ScenarioTable
+
+
+def make_rows(count: int) -> list:
+    return [
+        {'id': str(i), 'name': f'Deal {i:03d}',
+         'monthly_payment': None if i % 10 == 0 else float((i * 7919) % 5000)}
+        for i in range(count)
+    ]
+
+
+def test_filter_sort_and_window() -> None:
+    """Test type-ahead filtering, sorting and slicing together."""
+    table = ScenarioTable(make_rows(100))
+    table.set_filter('DEAL 0')
+    assert len(table) == 100
+    table.set_filter('deal 01')
+    assert [row['id'] for row in table.window(0, 20)] == [str(i) for i in range(10, 20)]
+    table.set_filter('')
+    assert len(table) == 100
+
+    table.sort('monthly_payment')
+    payments = [row['monthly_payment'] for row in table.window(0, 100)]
+    assert payments[:90] == sorted(payments[:90])
+    assert payments[90:] == [None] * 10
+    table.sort('monthly_payment')
+    assert table.descending
+    assert table.window(0, 1)[0]['monthly_payment'] == max(payments[:90])
+
+    table.set_only({'3', '5'})
+    assert {row['id'] for row in table.window(0, 10)} == {'3', '5'}
+
+
+def test_narrowing_filter_rescans_only_matches() -> None:
+    """Test that typing more of a filter only rescans the previous matches."""
+    rows = make_rows(10000)
+    table = ScenarioTable(rows)
+    for text in ('d', 'de', 'dea', 'deal 1'):
+        table.set_filter(text)
+    assert table.scanned == 4 * 10000
+    matches = sum('deal 1' in row['name'].casefold() for row in rows)
+    table.set_filter('deal 12')
+    assert table.scanned == 4 * 10000 + matches
+
+    table.sort('monthly_payment')
+    table.sort('name', descending=True)
+    assert table.scanned == 6 * 10000 + matches
+    assert len(table.window(0, 30)) == 30
@@ -0,0 +1,123 @@
+"""Test suite for the SQLite scenario store."""
+
+import json
+
+import pytest
+
+from calculator.core import scenarios
+from calculator.core.scenarios import ScenarioManager
+
+
+def test_imports_legacy_json_once(tmp_path) -> None:
+    """Test that an existing scenarios.json is imported on first run only."""
+    legacy = tmp_path / 'scenarios.json'
+    legacy.write_text(json.dumps({
+        'abc': {
+            'name': 'Old deal',
+            'data': {'type': 'seller_financing', 'sale_price': 420000},
+            'created_at': '2024-01-01T00:00:00',
+            'last_modified': '2024-01-01T00:00:00'
+        }
+    }))
+    db = tmp_path / 'scenarios.db'
+
+    manager = ScenarioManager(db, legacy)
+    assert manager.get_scenario('abc')['data']['sale_price'] == 420000
+    manager.delete_scenario('abc')
+    manager.close()
+
+    reopened = ScenarioManager(db, legacy)
+    assert reopened.get_scenario('abc') is None
+    reopened.close()
+
+
+def test_add_list_search_and_delete(tmp_path) -> None:
+    """Test the JSON store's API plus indexed listing and search."""
+    manager = ScenarioManager(tmp_path / 'scenarios.db', None)
+    first = manager.add_scenario('Main St duplex', {'type': 'investment', 'noi': 1})
+    second = manager.add_scenario('Oak 50% down', {'sale_price': 300000},
+                                  calc_type='seller_financing')
+    manager.add_scenario('Oak 5 down', {'sale_price': 310000},
+                         calc_type='seller_financing')
+
+    assert manager.get_scenario(first)['name'] == 'Main St duplex'
+    assert list(manager.get_all_scenarios())[0] == first
+    assert manager.count_scenarios(calc_type='seller_financing') == 2
+    assert [s['id'] for s in manager.list_scenarios(search='50%')] == [second]
+
+    names = [s['name'] for s in manager.list_scenarios(order_by='name', limit=2)]
+    assert names == ['Main St duplex', 'Oak 5 down']
+    assert 'data' not in manager.list_scenarios()[0]
+    assert list(manager.get_scenarios([second, 'missing'])) == [second]
+
+    manager.delete_scenario(first)
+    assert manager.count_scenarios() == 2
+    manager.close()
+
+
+def test_outputs_are_stored_and_recomputed_only_when_stale(tmp_path, monkeypatch) -> None:
+    """Test that current outputs are served without recomputing."""
+    manager = ScenarioManager(tmp_path / 'scenarios.db', None)
+    deal = {'type': 'seller_financing', 'sale_price': 420000,
+            'down_payment': 50000, 'new_rate': 1.5, 'balloon_years': 11}
+    ids = [manager.add_scenario(f'Deal {i}', deal) for i in range(3)]
+    bad = manager.add_scenario('Bad', {**deal, 'down_payment': 500000})
+
+    calls = []
+    original = scenarios.OUTPUTS['seller_financing']
+    monkeypatch.setitem(scenarios.OUTPUTS, 'seller_financing',
+                        lambda data: calls.append(data) or original(data))
+
+    outputs = manager.get_outputs(ids + [bad], ['balloon_payment'])
+    assert outputs[ids[0]]['balloon_payment'] == pytest.approx(253194.54, abs=0.01)
+    assert outputs[bad] == {'error': "Down payment cannot exceed sale price"}
+    assert calls == []
+
+    # Input keys and metrics other types produce never make outputs stale
+    manager.get_outputs(ids + [bad], ['sale_price', 'new_rate', 'cap_rate'])
+    assert calls == []
+    assert manager.get_outputs(ids, ['balloon_payment'], recompute=False).keys() == set(ids)
+
+    # Outputs stored without a metric their type produces are recomputed,
+    # once for the three identical inputs; without recompute they are left out
+    with manager.connection:
+        manager.connection.execute(
+            "UPDATE scenarios SET outputs = json_remove(outputs, '$.total_cost')"
+        )
+    assert manager.get_outputs(ids, ['total_cost'], recompute=False) == {}
+    assert calls == []
+    manager.get_outputs(ids, ['total_cost'])
+    assert len(calls) == 1
+
+    monkeypatch.setattr(scenarios, 'ENGINE_VERSION', 'next')
+    assert manager.refresh_outputs() == 4
+    assert len(calls) == 3
+    manager.get_outputs(ids, ['balloon_payment'])
+    assert len(calls) == 3
+    manager.close()
+
+
+def test_output_metrics_match_engines() -> None:
+    """Test that OUTPUT_METRICS lists exactly what each engine returns."""
+    deal = {'sale_price': 420000, 'down_payment': 50000, 'new_rate': 1.5,
+            'purchase_price': 300000, 'loan_amount': 200000, 'rate': 5,
+            'monthly_rent': 2000}
+    for calc_type, metrics in scenarios.OUTPUT_METRICS.items():
+        assert set(scenarios.compute_outputs(calc_type, deal)) == metrics
+
+
+def test_column_values_prefer_current_outputs(tmp_path, monkeypatch) -> None:
+    """Test reading one sortable column without decoding scenarios."""
+    manager = ScenarioManager(tmp_path / 'scenarios.db', None)
+    deal = manager.add_scenario('Deal', {'type': 'seller_financing', 'sale_price': 420000,
+                                         'down_payment': 50000, 'new_rate': 1.5})
+    note = manager.add_scenario('Note', {'type': 'notes', 'monthly_payment': 'n/a'})
+    payments = manager.column_values('monthly_payment')
+    assert payments[deal] == pytest.approx(
+        manager.get_outputs([deal])[deal]['monthly_payment'])
+    assert payments[note] == 'n/a'
+    assert manager.column_values('sale_price')[deal] == 420000
+
+    monkeypatch.setattr(scenarios, 'ENGINE_VERSION', 'next')
+    assert manager.column_values('monthly_payment')[deal] is None
+    manager.close()
@@ -0,0 +1,76 @@
+"""Test suite for warm-up, readiness and the gunicorn settings."""
+
+import threading
+from types import SimpleNamespace
+
+from flask import Flask
+
+from calculator.web import gunicorn_conf, serving
+from calculator.web.app import app, document_jobs
+
+
+def test_ready_only_after_warm_up(tmp_path) -> None:
+    """Test that /ready reports 503 until every warm-up step has run."""
+    (tmp_path / 'page.html').write_text('<p>{{ 1 + 1 }}</p>')
+    fresh = Flask(__name__, template_folder=str(tmp_path))
+    readiness = serving.install(fresh, modules=('calculator.core.batch', 'not_installed'))
+    calls = []
+    readiness.warmer('custom')(lambda: calls.append('custom'))
+    readiness._started = True  # keep the probe from warming in the background
+
+    response = fresh.test_client().get('/ready')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    assert response.headers['Cache-Control'] == 'no-store'
+
+    seconds = serving.warm_up(fresh)
+    assert list(seconds) == ['modules', 'engine', 'pages', 'custom']
+    assert serving.warm_up(fresh) == seconds
+    assert calls == ['custom']
+    body = fresh.test_client().get('/ready').get_json()
+    assert body['status'] == 'ready'
+    assert serving.warm_up(Flask(__name__)) is None
+
+
+def test_first_probe_starts_warm_up(tmp_path) -> None:
+    """Test that a probe warms an app no server hook has warmed."""
+    fresh = Flask(__name__, template_folder=str(tmp_path))
+    readiness = serving.install(fresh)
+    assert fresh.test_client().get('/ready').status_code == 503
+    readiness.warm_up()
+    assert fresh.test_client().get('/ready').status_code == 200
+
+
+def test_probes_do_not_wait_for_warm_up(tmp_path) -> None:
+    """Test that probes during a background warm-up answer 503 at once."""
+    fresh = Flask(__name__, template_folder=str(tmp_path))
+    readiness = serving.install(fresh)
+    entered, release, finished = threading.Event(), threading.Event(), threading.Event()
+
+    @readiness.warmer('slow')
+    def slow():
+        entered.set()
+        release.wait(10)
+        finished.set()
+
+    client = fresh.test_client()
+    assert client.get('/ready').status_code == 503
+    assert entered.wait(10)
+    assert client.get('/ready').status_code == 503
+    assert not finished.is_set()
+
+    release.set()
+    assert readiness.warm_up()['slow'] >= 0
+    assert client.get('/ready').status_code == 200
+
+
+def test_worker_hook_warms_the_web_app() -> None:
+    """Test the gunicorn settings and that workers warm the web app."""
+    assert gunicorn_conf.preload_app
+    assert gunicorn_conf.workers >= 1
+    assert gunicorn_conf.max_requests_jitter < gunicorn_conf.max_requests
+
+    gunicorn_conf.post_worker_init(SimpleNamespace(wsgi=app))
+    assert {'documents', 'risk', 'pages'} <= set(app.extensions[serving.EXTENSION].seconds)
+    assert document_jobs.templates.loads >= 1
+    assert app.test_client().get('/ready').status_code == 200
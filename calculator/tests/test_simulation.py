@@ -0,0 +1,50 @@
+"""Test suite for the Monte Carlo investment simulator."""
+
+import pytest
+
+from calculator.core.simulation import simulate_investment
+
+PROPERTY = {
+    'purchase_price': 420000,
+    'down_payment': 50000,
+    'rate': 1.5,
+    'monthly_rent': 2500,
+    'vacancy_rate': 5,
+    'property_tax': 3000,
+    'insurance': 1200,
+    'maintenance': 1800,
+    'mgmt_fee': 10,
+    'loan_term': 30
+}
+
+
+def test_reproducible_across_worker_counts() -> None:
+    """Test that sharding and worker count don't change the result."""
+    inline = simulate_investment(PROPERTY, paths=3000, seed=7,
+                                 shard_size=1000, workers=1)
+    pooled = simulate_investment(PROPERTY, paths=3000, seed=7,
+                                 shard_size=1000, workers=2)
+    assert inline == pooled
+
+
+def test_bands_are_ordered() -> None:
+    """Test percentile bands and the zero-volatility case."""
+    result = simulate_investment(PROPERTY, paths=2000, years=10, seed=1)
+    equity = result['equity']
+    assert len(equity['p50']) == 10
+    assert all(lo <= hi for lo, hi in zip(equity['p5'], equity['p95']))
+
+    fixed = simulate_investment(PROPERTY, paths=10, seed=1, assumptions={
+        'appreciation_volatility': 0, 'rent_volatility': 0,
+        'vacancy_volatility': 0, 'expense_volatility': 0
+    })
+    assert fixed['irr']['p5'] == pytest.approx(fixed['irr']['p95'])
+    assert isinstance(fixed['irr']['p50'], float)
+
+
+def test_invalid_property_is_rejected() -> None:
+    """Test that property data goes through the investment checks."""
+    with pytest.raises(ValueError, match="Loan term must be positive"):
+        simulate_investment({**PROPERTY, 'loan_term': 0}, paths=10)
+    with pytest.raises(ValueError, match="Down payment cannot exceed"):
+        simulate_investment({**PROPERTY, 'down_payment': 500000}, paths=10)
@@ -0,0 +1,27 @@
+"""Cold-start import budget for the core and web entry points."""
+
+import pytest
+
+from calculator.core.importtime import measure, total_seconds
+
+# Generous multiples of measured cold starts (about 0.15 s and 0.4 s) so
+# that slow CI machines pass but an eager heavy import does not.
+BUDGETS = {
+    'calculator.core.calc': 0.75,
+    'calculator.web.app': 1.5,
+}
+
+# Loaded at first use only
+LAZY = {
+    'calculator.core.calc': ('flask', 'docxtpl', 'sqlite3', 'tkinter'),
+    'calculator.web.app': ('docxtpl', 'docx', 'lxml', 'tkinter'),
+}
+
+
+@pytest.mark.parametrize('module', sorted(BUDGETS))
+def test_cold_start_budget(module: str) -> None:
+    """Test that importing an entry point stays within its time budget."""
+    records = measure(module)
+    imported = {record.module.split('.')[0] for record in records}
+    assert not imported & set(LAZY[module])
+    assert total_seconds(records, module) < BUDGETS[module]
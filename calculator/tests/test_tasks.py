@@ -0,0 +1,110 @@
+"""Test suite for the background task runner."""
+
+import threading
+import time
+
+import pytest
+
+from calculator.core.tasks import TaskRunner
+
+
+class FakeLoop:
+    """Stand-in for Tk's ``after``: callbacks run only when pumped."""
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, delay, callback):
+        self.pending.append(callback)
+
+    def run_until(self, condition, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, "event loop timed out"
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.001)
+
+
+def test_results_arrive_on_the_loop() -> None:
+    """Test that results and progress are delivered only when the loop runs."""
+    loop = FakeLoop()
+    runner = TaskRunner(loop.after)
+    results, progress = [], []
+
+    def work(task, value):
+        task.report(1, 2, 'half')
+        return value * 2
+
+    runner.submit('calc', work, 21, on_done=results.append,
+                  on_progress=lambda fraction, message: progress.append((fraction, message)))
+    runner.executor.shutdown(wait=True)
+    assert results == []
+
+    loop.run_until(lambda: results)
+    assert results == [42]
+    assert progress == [(0.5, 'half')]
+    assert not runner.busy
+    assert loop.pending == []
+
+
+def test_superseded_task_is_dropped() -> None:
+    """Test that a newer task under the same key wins over a slower one."""
+    loop = FakeLoop()
+    runner = TaskRunner(loop.after)
+    release = threading.Event()
+    results = []
+
+    def slow(task, value):
+        release.wait(5)
+        return value
+
+    runner.submit('calc', slow, 'stale', on_done=results.append)
+    runner.submit('calc', lambda task, value: value, 'fresh', on_done=results.append)
+    release.set()
+    loop.run_until(lambda: not runner.busy)
+    runner.executor.shutdown(wait=True)
+    loop.run_until(lambda: not loop.pending)
+    assert results == ['fresh']
+
+
+def test_cancel_stops_at_checkpoint() -> None:
+    """Test that cancelling makes the task stop at its next check."""
+    loop = FakeLoop()
+    runner = TaskRunner(loop.after)
+    started = threading.Event()
+    stopped = threading.Event()
+    results = []
+
+    def loop_forever(task):
+        started.set()
+        try:
+            while True:
+                task.check()
+                time.sleep(0.001)
+        finally:
+            stopped.set()
+
+    runner.submit('calc', loop_forever, on_done=results.append)
+    started.wait(5)
+    assert runner.cancel('calc')
+    assert stopped.wait(5)
+    assert not runner.busy
+    runner.shutdown()
+    assert results == []
+
+
+def test_errors_go_to_handler() -> None:
+    """Test that worker exceptions reach ``on_error`` on the loop."""
+    loop = FakeLoop()
+    runner = TaskRunner(loop.after)
+    errors = []
+
+    def fail(task):
+        raise ValueError("bad input")
+
+    runner.submit('calc', fail, on_done=pytest.fail, on_error=errors.append)
+    loop.run_until(lambda: errors)
+    assert str(errors[0]) == "bad input"
+    runner.shutdown()
@@ -0,0 +1,80 @@
+"""Test suite for vectorized input validation."""
+
+import numpy as np
+import pytest
+
+from calculator.core import batch
+from calculator.core.bulk import evaluate_chunk
+from calculator.core.calc import Calculator
+from calculator.core.validation import RULES, check, error_messages, validate
+
+
+def test_investment_codes_match_scalar_exceptions() -> None:
+    """Test that each row's first error is what the scalar path raises."""
+    rng = np.random.default_rng(7)
+    size = 2000
+    columns = {
+        'purchase_price': rng.uniform(-1000, 400000, size),
+        'down_payment': rng.uniform(-1000, 150000, size),
+        'rate': rng.uniform(-1, 8, size),
+        'loan_term': rng.choice([0, 15, 30], size),
+        'monthly_rent': rng.uniform(-100, 3000, size),
+        'vacancy_rate': rng.uniform(-5, 110, size),
+        'utilities': rng.uniform(-50, 3000, size),
+        'mgmt_fee': rng.uniform(-5, 110, size),
+    }
+    valid, codes = validate('investment', columns)
+    messages = error_messages('investment', codes)
+    assert 0 < valid.sum() < size
+
+    for i in range(size):
+        record = {name: float(values[i]) for name, values in columns.items()}
+        try:
+            Calculator.calculate_investment_metrics(record)
+        except ValueError as e:
+            assert messages[i] == str(e)
+        else:
+            assert valid[i]
+
+
+def test_valid_rows_compute_without_raising() -> None:
+    """Test computing only the rows the mask keeps."""
+    columns = {
+        'purchase_price': np.array([300000.0, 100000.0, 250000.0]),
+        'loan_amount': np.array([240000.0, 150000.0, 0.0]),
+    }
+    valid, codes = validate('closing_costs', columns)
+    assert valid.tolist() == [True, False, True]
+    assert RULES['closing_costs'][codes[1] - 1][0] == 'loan_exceeds_price'
+
+    results = batch.closing_costs({k: v[valid] for k, v in columns.items()})
+    assert results['total_closing_costs'].shape == (2,)
+
+
+def test_check_broadcasts_scalars_and_raises() -> None:
+    """Test all-or-nothing checking with mixed scalar and array fields."""
+    check('loan', {'principal': [1000, 2000], 'rate': 0.05, 'years': 30})
+    with pytest.raises(ValueError, match="Elapsed months"):
+        check('loan', {'principal': 1000, 'rate': 0.05, 'years': 10,
+                       'months_elapsed': [0, 121]})
+
+
+def test_non_finite_rows_are_rejected() -> None:
+    """Test that NaN and infinite inputs fail instead of producing NaN outputs."""
+    valid, codes = validate('investment', {
+        'purchase_price': [np.nan, 200000, 200000],
+        'down_payment': [0, 0, 0],
+        'monthly_rent': [1000, np.inf, 1000],
+    })
+    assert valid.tolist() == [False, False, True]
+    assert error_messages('investment', codes)[:2] == ["Values must be finite numbers"] * 2
+
+    # An absent balloon month is NaN and stays valid
+    check('loan', {'principal': 1000, 'rate': 0.05, 'balloon_months': np.nan})
+
+    lines, _, errors = evaluate_chunk('closing_costs', [
+        (1, {'purchase_price': 'nan', 'loan_amount': 0}),
+        (2, {'purchase_price': 300000, 'loan_amount': 240000}),
+    ])
+    assert lines == [2]
+    assert errors == [(1, "Values must be finite numbers")]
@@ -0,0 +1,65 @@
+"""Test suite for the /calculate/batch endpoint."""
+
+import json
+
+import pytest
+
+from calculator.core.calc import Calculator
+from calculator.web.app import app
+
+INVESTMENT = {
+    'type': 'investment', 'purchase_price': 200000, 'down_payment': 40000,
+    'rate': 5, 'monthly_rent': 2000, 'vacancy_rate': 5
+}
+
+
+@pytest.fixture
+def client():
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def test_batch_streams_results_in_input_order(client) -> None:
+    """Test mixed JSON array input with per-record errors."""
+    payload = [
+        INVESTMENT,
+        {'type': 'closing_costs', 'purchase_price': 300000, 'loan_amount': 240000},
+        {'type': 'unknown'},
+        {**INVESTMENT, 'down_payment': 300000},
+    ]
+    response = client.post('/calculate/batch', json=payload)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert [line['index'] for line in lines] == [0, 1, 2, 3]
+    expected = Calculator.calculate_investment_metrics(INVESTMENT)
+    assert lines[0]['type'] == 'investment'
+    assert lines[0]['result']['noi'] == pytest.approx(expected['noi'])
+    assert lines[1]['result']['appraisal'] == 500
+    assert lines[2] == {'index': 2, 'error': 'Invalid calculation type'}
+    assert lines[3]['error'] == "Down payment cannot exceed purchase price"
+
+
+def test_batch_ndjson_columnar(client) -> None:
+    """Test NDJSON input with the columnar response format."""
+    body = '\n'.join([
+        json.dumps(INVESTMENT),
+        'not json',
+        json.dumps({**INVESTMENT, 'monthly_rent': 2500}),
+    ])
+    response = client.post(
+        '/calculate/batch?format=columnar', data=body,
+        content_type='application/x-ndjson'
+    )
+    data = response.get_json()
+    assert data['investment']['index'] == [0, 2]
+    assert len(data['investment']['cap_rate']) == 2
+    assert data['errors']['index'] == [1]
+
+
+def test_batch_rejects_non_array(client) -> None:
+    """Test that a JSON object body is rejected."""
+    response = client.post('/calculate/batch', json=INVESTMENT)
+    assert response.status_code == 400
@@ -0,0 +1,3 @@
+"""gunicorn settings for ``gunicorn app:app``; see calculator.web.gunicorn_conf."""
+
+from calculator.web.gunicorn_conf import *  # noqa: F401,F403
@@ -1,3 +1,6 @@
+from calculator.core.calc import Calculator
+
+
 def calculate_monthly_payment(principal, annual_rate, years):
     """
     Calculate monthly mortgage payment
@@ -5,23 +8,7 @@ def calculate_monthly_payment(principal, annual_rate, years):
     annual_rate: annual interest rate (as decimal, e.g., 0.05 for 5%)
     years: loan term in years
     """
-    # Convert annual rate to monthly
-    monthly_rate = annual_rate / 12
-    
-    # Total number of payments
-    n_payments = years * 12
-    
-    # Handle zero interest case
-    if annual_rate == 0:
-        return principal / n_payments
-        
-    # Calculate monthly payment using amortization formula
-    monthly_payment = principal * (
-        (monthly_rate * (1 + monthly_rate)**n_payments) / 
-        ((1 + monthly_rate)**n_payments - 1)
-    )
-    
-    return round(monthly_payment, 2)
+    return Calculator.calculate_monthly_payment(principal, annual_rate, years)
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+import itertools
+import unittest
+
+import app as root_app
+import calc
+import quick_calc
+import verify
+import web_version.app as web_version_app
+from calculator.core.amortization import balance_after, level_payment
+from calculator.core.calc import Calculator
+from calculator.web.app import app as suite_app
+
+
+PRINCIPALS = [0, 100000, 370000, 1250000]
+RATES = [0, 0.015, 0.045, 0.0725]
+TERMS = [10, 15, 30]
+
+
+class TestKernelParity(unittest.TestCase):
+    """Every front end must agree with the shared calculator.core kernel."""
+
+    def loan_grid(self):
+        return itertools.product(PRINCIPALS, RATES, TERMS)
+
+    def test_monthly_payment_matches_kernel(self):
+        """Test that every payment entry point returns the kernel's value"""
+        implementations = [
+            Calculator.calculate_monthly_payment,
+            web_version_app.Calculator.calculate_monthly_payment,
+            quick_calc.calculate_monthly_payment,
+            verify.calculate_monthly_payment,
+            lambda p, r, y: calc.RealEstateCalculator.calculate_monthly_payment(None, p, r, y),
+        ]
+        for principal, rate, years in self.loan_grid():
+            expected = level_payment(principal, rate / 12, years * 12)
+            for implementation in implementations:
+                self.assertEqual(implementation(principal, rate, years), expected)
+
+    def test_loan_balance_matches_kernel(self):
+        """Test that balances honour the term instead of assuming 30 years"""
+        for principal, rate, years in self.loan_grid():
+            for elapsed in (0, 5, years):
+                expected = balance_after(principal, rate / 12, years * 12, elapsed * 12)
+                self.assertEqual(
+                    Calculator.calculate_loan_balance(principal, rate, years, elapsed),
+                    expected
+                )
+                self.assertEqual(
+                    verify.calculate_loan_balance(principal, rate, elapsed, years),
+                    expected
+                )
+                self.assertEqual(
+                    calc.RealEstateCalculator.calculate_loan_balance(
+                        None, principal, rate, years, elapsed),
+                    expected
+                )
+
+    def test_seller_financing_endpoints(self):
+        """Test that both Flask apps return the kernel's seller financing numbers"""
+        data = {'sale_price': 420000, 'down_payment': 50000, 'rate': 1.5, 'years': 30}
+        expected = Calculator.calculate_seller_financing(data)['new_financing']
+
+        response = root_app.app.test_client().post(
+            '/calculate', json={'type': 'seller_financing', **data})
+        self.assertEqual(response.get_json()['monthly_payment'],
+                         round(expected['monthly_payment'], 2))
+        self.assertEqual(response.get_json()['total_interest'],
+                         round(expected['total_interest'], 2))
+
+        response = web_version_app.app.test_client().post(
+            '/calculate', json={'type': 'seller_financing', **data})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['new_financing'], expected)
+
+    def test_investment_endpoints(self):
+        """Test that the Flask apps share the kernel's investment metrics"""
+        data = {
+            'purchase_price': 200000, 'down_payment': 40000, 'rate': 5,
+            'monthly_rent': 2000, 'vacancy_rate': 5, 'property_tax': 2400
+        }
+        metrics = Calculator.calculate_investment_metrics(data)
+
+        response = suite_app.test_client().post(
+            '/calculate', json={'type': 'investment', **data})
+        self.assertEqual(response.get_json(), metrics)
+
+        response = web_version_app.app.test_client().post(
+            '/calculate', json={'type': 'investment', **data})
+        self.assertEqual(response.get_json()['annual']['noi'], metrics['noi'])
+
+        response = root_app.app.test_client().post('/calculate', json={
+            'type': 'investment', 'purchase_price': 200000,
+            'monthly_rent': 2000, 'monthly_expenses': 500
+        })
+        self.assertEqual(response.get_json(), {
+            'cash_flow': 1500.0, 'cap_rate': 9.0, 'roi': 9.0, 'break_even': 133.0
+        })
+
+    def test_closing_costs_endpoints(self):
+        """Test that closing cost title insurance comes from the kernel"""
+        response = root_app.app.test_client().post('/calculate', json={
+            'type': 'closing_costs', 'property_price': 300000,
+            'down_payment_percent': 20, 'lender_fees': 1500
+        })
+        self.assertEqual(response.get_json(), {
+            'down_payment': 60000.0, 'lender_fees': 1500.0,
+            'title_insurance': 1500.0, 'total_closing': 63000.0
+        })
+
+        data = {'purchase_price': 300000, 'loan_amount': 240000}
+        response = web_version_app.app.test_client().post(
+            '/calculate', json={'type': 'closing_costs', **data})
+        self.assertEqual(response.get_json(), Calculator.calculate_closing_costs(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
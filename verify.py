@@ -2,6 +2,8 @@
 
 from typing import Tuple
 
+from calculator.core.calc import Calculator
+
 
 def calculate_monthly_payment(
     principal: float,
@@ -19,18 +21,14 @@ def calculate_monthly_payment(
     Returns:
         Monthly payment amount
     """
-    monthly_rate = annual_rate / 12
-    num_payments = years * 12
-    
-    numerator = principal * monthly_rate * (1 + monthly_rate)**num_payments
-    denominator = (1 + monthly_rate)**num_payments - 1
-    return numerator / denominator
+    return Calculator.calculate_monthly_payment(principal, annual_rate, years)
 
 
 def calculate_loan_balance(
     principal: float,
     annual_rate: float,
-    years_elapsed: int
+    years_elapsed: int,
+    term_years: int = 30
 ) -> float:
     """
     Calculate remaining balance after years elapsed.
@@ -39,22 +37,14 @@ def calculate_loan_balance(
         principal: Original loan amount
         annual_rate: Annual interest rate as decimal
         years_elapsed: Number of years elapsed
+        term_years: Original loan term in years
         
     Returns:
         Remaining loan balance
     """
-    monthly_rate = annual_rate / 12
-    monthly_payment = calculate_monthly_payment(principal, annual_rate, 30)
-    
-    remaining_balance = principal
-    months_elapsed = years_elapsed * 12
-    
-    for _ in range(months_elapsed):
-        interest = remaining_balance * monthly_rate
-        principal_paid = monthly_payment - interest
-        remaining_balance -= principal_paid
-    
-    return remaining_balance
+    return Calculator.calculate_loan_balance(
+        principal, annual_rate, term_years, years_elapsed
+    )
 
 
 def verify_current_mortgage() -> Tuple[float, float, float]:
@@ -86,19 +76,18 @@ def verify_new_loan() -> Tuple[float, float, float, float]:
     new_rate = 0.015
     balloon_years = 11
 
-    loan_amount = sale_price - down_payment
-    monthly_payment = calculate_monthly_payment(loan_amount, new_rate, 30)
-
-    remaining_balance = loan_amount
-    for _ in range(balloon_years * 12):
-        interest = remaining_balance * (new_rate / 12)
-        principal_paid = monthly_payment - interest
-        remaining_balance -= principal_paid
-
-    total_payments = monthly_payment * (balloon_years * 12)
-    total_cost = total_payments + down_payment + remaining_balance
+    financing = Calculator.calculate_seller_financing({
+        'sale_price': sale_price,
+        'down_payment': down_payment,
+        'new_rate': new_rate * 100,
+        'loan_term': 30,
+        'balloon_years': balloon_years
+    })['new_financing']
+    loan_amount = financing['loan_amount']
+    monthly_payment = financing['monthly_payment']
+    remaining_balance = financing['balloon_payment']
     
-    return loan_amount, monthly_payment, remaining_balance, total_cost
+    return loan_amount, monthly_payment, remaining_balance, financing['total_cost']
 
 
 def main():